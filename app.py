@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, Response, stream_with_context, abort, g
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 import os
 from datetime import datetime
@@ -20,15 +20,30 @@ app.config['FLASK_ADMIN_SWATCH'] = 'cerulean'
 # Railway ortamında olup olmadığımızı kontrol et
 IS_PRODUCTION = os.environ.get('RAILWAY_ENVIRONMENT') == 'production'
 
+# Grafikler HTML içine base64 olarak mı gömülsün, yoksa ayrı önbelleklenebilir URL'den mi sunulsun
+CHART_INLINE = os.environ.get('CHART_INLINE', '1') != '0'
+
+# İstatistik sayfasında izin verilen zaman aralıkları (gün)
+VALID_TIME_RANGES = [7, 30, 90, 180, 365]
+
+# Toplu analiz isteğinde kabul edilen en fazla metin sayısı
+ANALYZE_BATCH_MAX_SIZE = int(os.environ.get('ANALYZE_BATCH_MAX_SIZE', 1000))
+
 # Veritabanı ve giriş yöneticisini başlat
+# Not: text_improver, admin (flask_admin) ve grafik çizimi (matplotlib) yalnızca
+# ihtiyaç duyan route'larda, ilk kullanımda yüklenir
 from models import db, User, Analysis, LanguageStats, SentimentStats, UserPreference, TextSuggestionFeedback, EmotionStats
 from forms import LoginForm, RegistrationForm, AnalysisForm
-from sentiment_analyzer import analyze_sentiment, SUPPORTED_LANGUAGES
-from stats import get_sentiment_distribution, get_language_distribution, get_time_series_analysis, update_stats
-from text_improver import get_text_improvements, improve_negative_text, correct_grammar, suggest_alternative_expressions
+from sentiment_analyzer import analyze_sentiment, analyze_sentiment_batch, SUPPORTED_LANGUAGES
+from stats import get_chart_png, to_base64, update_stats, update_stats_bulk
 from user_preferences import get_or_create_user_preferences, update_user_preferences, record_analysis_feedback
 from user_preferences import record_text_suggestion_feedback, get_user_analysis_patterns, get_personalized_recommendations, adapt_analysis_to_preferences
-from admin import init_admin
+from bulk_analysis import analyze_stream, iter_ndjson, STREAM_CHUNK_SIZE
+from document_analysis import analyze_document_stream, DOCUMENT_SEGMENT_CHARS, DOCUMENT_BATCH_SIZE
+from translation import get_translation_metrics
+from tracing import span, current_trace, start_trace, finish_trace, get_tracing_metrics, TRACING_ENABLED
+from metrics import start_request, observe_request, render_metrics, METRICS_AVAILABLE, METRICS_TOKEN
+from improvement_jobs import enqueue_improvements, save_improvements, load_improvements
 
 db.init_app(app)
 login_manager = LoginManager()
@@ -36,6 +51,36 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 login_manager.login_message = 'Bu sayfayı görüntülemek için lütfen giriş yapın.'
 
+def debug_requested():
+    """İstekte aşama sürelerinin yanıta eklenmesini isteyen debug bayrağı (?debug=1) var mı?"""
+    return request.args.get('debug') == '1'
+
+def add_timings(response_data):
+    """Debug bayrağı varsa geçerli isteğin aşama sürelerini API yanıtına ekler."""
+    trace = current_trace()
+    if trace is not None and debug_requested():
+        response_data['timings'] = trace.timings()
+    return response_data
+
+@app.before_request
+def start_request_trace():
+    g.request_started = start_request()
+    # İzleme kapalıyken yalnızca debug bayrağı olan istekler ölçülür
+    if TRACING_ENABLED or debug_requested():
+        start_trace(request.endpoint or 'unknown')
+
+@app.after_request
+def record_request_metrics(response):
+    # Endpoint adı etiket olarak kullanılır; bilinmeyen URL'ler tek bir etikette toplanır
+    if 'request_started' in g:
+        observe_request(request.method, request.endpoint or 'unknown', response.status_code,
+                        g.request_started, current_trace())
+    return response
+
+@app.teardown_request
+def finish_request_trace(exc):
+    finish_trace()
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -61,6 +106,39 @@ def create_tables():
             db.session.add(EmotionStats(emotion="surprise", count=0))
             db.session.commit()
 
+def analysis_fields(result, text, user_id):
+    """Analiz sonucundan Analysis kaydı için alan sözlüğü oluşturur."""
+    return {
+        'text': text,
+        'original_language': result['language_code'],
+        'sentiment': result['sentiment'],
+        'confidence': result['confidence'],
+        'user_id': user_id,
+        'happiness': result['emotion_scores']['happiness'],
+        'sadness': result['emotion_scores']['sadness'],
+        'anger': result['emotion_scores']['anger'],
+        'fear': result['emotion_scores']['fear'],
+        'surprise': result['emotion_scores']['surprise'],
+        'intensity': result['intensity']
+    }
+
+def chart_src(chart_type, user_id=None, days=30):
+    """
+    Grafik için <img> kaynağını döndürür.
+    CHART_INLINE açıksa base64 veri URI'si, kapalıysa veri filigranı ile sürümlenmiş
+    ve tarayıcı tarafından önbelleklenebilen /charts URL'si döner.
+    """
+    png, watermark = get_chart_png(chart_type, user_id, days)
+    if png is None:
+        return None
+    if CHART_INLINE:
+        return 'data:image/png;base64,' + to_base64(png)
+    
+    scope = 'user' if user_id else 'all'
+    if chart_type != 'time_series':
+        return url_for('chart_image', chart_type=chart_type, scope=scope, v=watermark)
+    return url_for('chart_image', chart_type=chart_type, scope=scope, days=days, v=watermark)
+
 @app.route('/')
 def index():
     form = AnalysisForm()
@@ -77,6 +155,7 @@ def analyze():
     form = AnalysisForm()
     result = None
     text_improvements = None
+    improvements_pending = False
     
     if form.validate_on_submit():
         text = form.text.data
@@ -92,29 +171,21 @@ def analyze():
                 # Kullanıcı giriş yapmışsa analizi kaydet ve kullanıcı tercihlerine göre uyarla
                 if current_user.is_authenticated:
                     # Kullanıcı tercihlerine göre sonuçları uyarla
-                    adapted_result = adapt_analysis_to_preferences(result, current_user.id)
+                    with span('adapt_preferences'):
+                        adapted_result = adapt_analysis_to_preferences(result, current_user.id)
                     
                     # Analizi veritabanına kaydet
                     if not IS_PRODUCTION:
-                        analysis = Analysis(
-                            text=text,
-                            original_language=result['language_code'],
-                            sentiment=result['sentiment'],
-                            confidence=result['confidence'],
-                            user_id=current_user.id,
-                            happiness=result['emotion_scores']['happiness'],
-                            sadness=result['emotion_scores']['sadness'],
-                            anger=result['emotion_scores']['anger'],
-                            fear=result['emotion_scores']['fear'],
-                            surprise=result['emotion_scores']['surprise'],
-                            intensity=result['intensity']
-                        )
-                        db.session.add(analysis)
+                        with span('db_insert'):
+                            analysis = Analysis(**analysis_fields(result, text, current_user.id))
+                            db.session.add(analysis)
                         
                         # İstatistikleri güncelle
-                        update_stats(result)
+                        with span('update_stats'):
+                            update_stats(result)
                         
-                        db.session.commit()
+                        with span('db_commit'):
+                            db.session.commit()
                     
                     # Analiz ID'sini result sözlüğüne ekle
                     result['analysis_id'] = analysis.id
@@ -122,9 +193,16 @@ def analyze():
                     # Kullanıcı tercihleri
                     user_preferences = get_or_create_user_preferences(current_user.id)
                     
-                    # Metin önerileri gösterilecekse
+                    # Metin önerileri gösterilecekse arka planda hazırlanır; sayfa hazır olana kadar sorgular.
+                    # Kuyruk doluysa öneriler eskisi gibi istek içinde hesaplanır.
                     if user_preferences.show_text_suggestions:
-                        text_improvements = get_text_improvements(text, result['language_code'], result['sentiment'])
+                        with span('text_improvements'):
+                            improvements_pending = enqueue_improvements(
+                                app, analysis.id, text, result['language_code'], result['sentiment'])
+                            if not improvements_pending:
+                                from text_improver import get_text_improvements
+                                text_improvements = get_text_improvements(text, result['language_code'], result['sentiment'])
+                                save_improvements(analysis.id, text_improvements)
                     
                     # Sonuçları kullanıcı tercihlerine göre uyarla
                     result = adapted_result
@@ -140,7 +218,28 @@ def analyze():
                     'error': str(e)
                 }
     
-    return render_template('result.html', result=result, form=form, text_improvements=text_improvements)
+    with span('render'):
+        return render_template('result.html', result=result, form=form, text_improvements=text_improvements,
+                               improvements_pending=improvements_pending)
+
+@app.route('/analysis/<int:analysis_id>/improvements')
+@login_required
+def analysis_improvements(analysis_id):
+    """Arka planda hazırlanan metin önerilerinin durumunu ve hazırsa HTML'ini döndürür."""
+    analysis = Analysis.query.get_or_404(analysis_id)
+    if analysis.user_id != current_user.id:
+        abort(403)
+    
+    status, improvements = load_improvements(analysis)
+    response = {'status': status}
+    if status == 'done':
+        response['improvements'] = improvements
+        response['html'] = render_template(
+            'text_improvements.html',
+            text_improvements=improvements,
+            result={'analysis_id': analysis.id, 'text': analysis.text}
+        )
+    return jsonify(response)
 
 @app.route('/preferences', methods=['GET', 'POST'])
 @login_required
@@ -255,9 +354,9 @@ def profile():
         total_analyses = Analysis.query.filter_by(user_id=current_user.id).count()
     
     # İstatistikleri oluştur
-    sentiment_chart = get_sentiment_distribution(current_user.id) if total_analyses > 0 else None
-    language_chart = get_language_distribution(current_user.id) if total_analyses > 0 else None
-    time_series_chart = get_time_series_analysis(days=30, user_id=current_user.id) if total_analyses > 0 else None
+    sentiment_chart = chart_src('sentiment', user_id=current_user.id) if total_analyses > 0 else None
+    language_chart = chart_src('language', user_id=current_user.id) if total_analyses > 0 else None
+    time_series_chart = chart_src('time_series', user_id=current_user.id, days=30) if total_analyses > 0 else None
     
     return render_template('profile.html', 
                           user=current_user,
@@ -287,8 +386,7 @@ def stats():
         time_range = 30
     
     # Geçerli aralıkları kontrol et
-    valid_ranges = [7, 30, 90, 180, 365]
-    if time_range not in valid_ranges:
+    if time_range not in VALID_TIME_RANGES:
         time_range = 30
     
     # Genel istatistikleri al
@@ -322,9 +420,9 @@ def stats():
         language_stats.append((name, count, percentage))
     
     # Grafikleri oluştur
-    sentiment_chart = get_sentiment_distribution() if total_analyses > 0 else None
-    language_chart = get_language_distribution() if total_analyses > 0 else None
-    time_series_chart = get_time_series_analysis(days=time_range) if total_analyses > 0 else None
+    sentiment_chart = chart_src('sentiment') if total_analyses > 0 else None
+    language_chart = chart_src('language') if total_analyses > 0 else None
+    time_series_chart = chart_src('time_series', days=time_range) if total_analyses > 0 else None
     
     return render_template('stats.html',
                           total_analyses=total_analyses,
@@ -336,6 +434,28 @@ def stats():
                           time_series_chart=time_series_chart,
                           time_range=time_range)
 
+@app.route('/charts/<chart_type>.png')
+@login_required
+def chart_image(chart_type):
+    """Önbellekteki grafiği PNG olarak sunar."""
+    if chart_type not in ('sentiment', 'language', 'time_series'):
+        abort(404)
+    
+    user_id = current_user.id if request.args.get('scope') == 'user' else None
+    days = request.args.get('days', 30, type=int)
+    if days not in VALID_TIME_RANGES:
+        days = 30
+    
+    png, watermark = get_chart_png(chart_type, user_id, days)
+    if png is None:
+        abort(404)
+    
+    response = Response(png, mimetype='image/png')
+    response.set_etag(f"{chart_type}-{user_id}-{days}-{watermark}")
+    response.cache_control.private = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
 @app.route('/api/analyze', methods=['POST'])
 def api_analyze():
     """API endpoint for sentiment analysis."""
@@ -357,28 +477,92 @@ def api_analyze():
             user = User.query.get(user_id)
             if user:
                 if not IS_PRODUCTION:
-                    analysis = Analysis(
-                        text=text,
-                        original_language=result['language_code'],
-                        sentiment=result['sentiment'],
-                        confidence=result['confidence'],
-                        user_id=user.id,
-                        happiness=result['emotion_scores']['happiness'],
-                        sadness=result['emotion_scores']['sadness'],
-                        anger=result['emotion_scores']['anger'],
-                        fear=result['emotion_scores']['fear'],
-                        surprise=result['emotion_scores']['surprise'],
-                        intensity=result['intensity']
+                    with span('db_insert'):
+                        analysis = Analysis(**analysis_fields(result, text, user.id))
+                        db.session.add(analysis)
+                    with span('update_stats'):
+                        update_stats(result)
+                    with span('db_commit'):
+                        db.session.commit()
+        
+        return jsonify(add_timings(result))
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/analyze/batch', methods=['POST'])
+def api_analyze_batch():
+    """API endpoint for batch sentiment analysis."""
+    if not request.is_json:
+        return jsonify({"error": "Request must be JSON"}), 400
+    
+    data = request.get_json()
+    texts = data.get('texts')
+    
+    if not isinstance(texts, list) or not texts:
+        return jsonify({"error": "Texts must be a non-empty array"}), 400
+    
+    if len(texts) > ANALYZE_BATCH_MAX_SIZE:
+        return jsonify({"error": f"At most {ANALYZE_BATCH_MAX_SIZE} texts are allowed per batch"}), 413
+    
+    try:
+        results = analyze_sentiment_batch(texts)
+        succeeded = [result for result in results if 'error' not in result]
+        
+        # Kullanıcı kimliği varsa başarılı analizleri tek seferde kaydet
+        user_id = data.get('user_id')
+        if user_id and succeeded and not IS_PRODUCTION:
+            user = User.query.get(user_id)
+            if user:
+                with span('db_insert'):
+                    db.session.bulk_insert_mappings(
+                        Analysis,
+                        [analysis_fields(result, result['text'], user.id) for result in succeeded]
                     )
-                    db.session.add(analysis)
-                    update_stats(result)
+                with span('update_stats'):
+                    update_stats_bulk(succeeded)
+                with span('db_commit'):
                     db.session.commit()
         
-        return jsonify(result)
+        return jsonify(add_timings({
+            "results": results,
+            "count": len(results),
+            "error_count": len(results) - len(succeeded)
+        }))
     
     except Exception as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/analyze/stream', methods=['POST'])
+def api_analyze_stream():
+    """
+    API endpoint for streaming bulk analysis.
+    Reads NDJSON or plain text lines from the request body and streams NDJSON results.
+    """
+    chunk_size = request.args.get('chunk_size', STREAM_CHUNK_SIZE, type=int)
+    chunk_size = max(1, min(chunk_size, ANALYZE_BATCH_MAX_SIZE))
+    
+    # İstek gövdesi satır satır okunur; yeni parça ancak önceki sonuçlar gönderildikten sonra işlenir
+    results = analyze_stream(request.stream, chunk_size)
+    return Response(stream_with_context(iter_ndjson(results)), mimetype='application/x-ndjson')
+
+@app.route('/api/analyze/document', methods=['POST'])
+def api_analyze_document():
+    """
+    API endpoint for streaming long document analysis.
+    Reads a plain text document from the request body, streams per-segment NDJSON results
+    and ends with a document-level result.
+    """
+    segment_chars = request.args.get('segment_chars', DOCUMENT_SEGMENT_CHARS, type=int)
+    segment_chars = max(100, min(segment_chars, DOCUMENT_SEGMENT_CHARS))
+    batch_size = request.args.get('batch_size', DOCUMENT_BATCH_SIZE, type=int)
+    batch_size = max(1, min(batch_size, ANALYZE_BATCH_MAX_SIZE))
+    
+    # Belge satır satır okunur; bölüm sonuçları belgenin tamamı okunmadan gönderilmeye başlar
+    results = analyze_document_stream(request.stream, segment_chars, batch_size)
+    return Response(stream_with_context(iter_ndjson(results)), mimetype='application/x-ndjson')
+
 @app.route('/api/text_improvements', methods=['POST'])
 def api_text_improvements():
     """API endpoint for text improvements."""
@@ -394,12 +578,42 @@ def api_text_improvements():
         return jsonify({"error": "Text is required"}), 400
     
     try:
+        from text_improver import get_text_improvements
         improvements = get_text_improvements(text, lang_code, sentiment)
         return jsonify(improvements)
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/metrics/translation')
+@login_required
+def api_translation_metrics():
+    """Çeviri devre kesicisinin durumunu ve önbellek istatistiklerini döndürür (sadece admin)."""
+    if not current_user.is_admin:
+        abort(403)
+    return jsonify(get_translation_metrics())
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """
+    Prometheus metrikleri (tüm gunicorn worker'larının toplamı).
+    Üretimde yalnızca METRICS_TOKEN tanımlıysa ve istek bu token'ı taşıyorsa açılır.
+    """
+    if not METRICS_AVAILABLE or (IS_PRODUCTION and not METRICS_TOKEN):
+        abort(404)
+    if METRICS_TOKEN and request.headers.get('Authorization') != f'Bearer {METRICS_TOKEN}':
+        abort(401)
+    output, content_type = render_metrics()
+    return Response(output, mimetype=content_type)
+
+@app.route('/api/metrics/tracing')
+@login_required
+def api_tracing_metrics():
+    """Route ve aşama bazında süre histogramlarını döndürür (sadece admin, worker başına)."""
+    if not current_user.is_admin:
+        abort(403)
+    return jsonify(get_tracing_metrics())
+
 # Navbar'da aktif sayfayı belirlemek için context processor
 @app.context_processor
 def inject_active_page():
@@ -0,0 +1,729 @@
+"""
+Empathix Performans Ölçüm Aracı
+
+Bu script, analiz hattının sıcak noktalarını ölçmek için kullanılır.
+Kullanım:
+    python benchmark.py            # Tüm ölçümleri çalıştır
+    python benchmark.py lexicon    # Sadece belirtilen ölçümleri çalıştır
+    python benchmark.py pipeline stats --json sonuclar.json --baseline benchmark_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+
+# Kayıtlı ölçümler: {isim: fonksiyon}
+BENCHMARKS = {}
+
+def benchmark(name):
+    """Fonksiyonu verilen isimle ölçüm olarak kaydeden dekoratör."""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+def measure(func, number=100, repeat=5):
+    """
+    Fonksiyonun çağrı başına en iyi çalışma süresini ölçer.
+
+    Args:
+        func (callable): Ölçülecek fonksiyon
+        number (int): Her turdaki çağrı sayısı
+        repeat (int): Tur sayısı
+
+    Returns:
+        float: Çağrı başına süre (mikro saniye)
+    """
+    times = timeit.repeat(func, number=number, repeat=repeat)
+    return min(times) / number * 1e6
+
+def make_tokens(vocabulary, size, seed=42):
+    """Verilen kelime havuzundan tekrarlanabilir rastgele bir kelime dizisi üretir."""
+    rng = random.Random(seed)
+    return [rng.choice(vocabulary) for _ in range(size)]
+
+# Duygu kelimeleri dışında kalan dolgu kelimeleri
+FILLER_WORDS = [
+    'the', 'service', 'was', 'product', 'delivery', 'order', 'today', 'support',
+    'team', 'price', 'quality', 'package', 'time', 'call', 'email', 'again'
+]
+
+@benchmark('lexicon')
+def bench_lexicon():
+    """Derlenmiş duygu sözlüğünü eski iç içe liste taramasıyla karşılaştırır."""
+    from sentiment_analyzer import EMOTION_KEYWORDS, EMOTION_LEXICON
+
+    def legacy_match(words):
+        matches = []
+        for word in words:
+            for emotion, keywords in EMOTION_KEYWORDS.items():
+                if word in keywords:
+                    matches.append((word, emotion))
+        return matches
+
+    def compiled_match(words):
+        return [(phrase, emotion)
+                for position, phrase, emotions in EMOTION_LEXICON.find(words)
+                for emotion in emotions]
+
+    keywords = [word for words in EMOTION_KEYWORDS.values() for word in words if ' ' not in word]
+    vocabulary = FILLER_WORDS * 4 + keywords
+
+    results = {}
+    for size in (50, 500, 5000):
+        tokens = make_tokens(vocabulary, size)
+        number = max(1, 20000 // size)
+        legacy = measure(lambda: legacy_match(tokens), number=number)
+        compiled = measure(lambda: compiled_match(tokens), number=number)
+        results[f'legacy_{size}_us'] = round(legacy, 2)
+        results[f'compiled_{size}_us'] = round(compiled, 2)
+        results[f'speedup_{size}'] = round(legacy / compiled, 2)
+    return results
+
+# Dil tespiti ölçümünde kullanılan çok dilli örnek metinler
+MIXED_LANGUAGE_CORPUS = [
+    'The delivery was late and the support team did not answer my emails.',
+    'I am really happy with the quality of this product, thank you!',
+    'This is the worst service I have ever used.',
+    'Siparişim iki gün gecikti ama ürün gayet iyi çalışıyor.',
+    'Müşteri hizmetleri çok ilgisizdi, bir daha alışveriş yapmayacağım.',
+    'Bu ürün çok güzel, herkese tavsiye ederim.',
+    'El producto llegó roto y nadie responde a mis mensajes.',
+    'Le service client était très aimable et rapide.',
+    'Die Lieferung war pünktlich und die Qualität ist hervorragend.',
+    'Il prodotto è arrivato in ritardo ma funziona bene.',
+    'O atendimento foi excelente, recomendo a todos.',
+    'Доставка была быстрой, но упаковка повреждена.',
+    '配送がとても早くて満足しています。',
+    'ok'
+]
+
+@benchmark('language_detection')
+def bench_language_detection(size=2000, unique_ratio=0.3):
+    """
+    Karışık dilli bir derlemde dil tespiti süresini ölçer: tohumsuz langdetect
+    çağrısı ile hızlı kontroller ve önbellek içeren tespit katmanı karşılaştırılır.
+    Derlemdeki metinlerin bir kısmı tekrar eder (aynı yorumların tekrar analizi gibi).
+    """
+    from langdetect import detect, LangDetectException
+    from sentiment_analyzer import detect_language, language_cache
+
+    rng = random.Random(42)
+    unique_texts = [f'{rng.choice(MIXED_LANGUAGE_CORPUS)} #{i}' for i in range(int(size * unique_ratio))]
+    corpus = [rng.choice(unique_texts) for _ in range(size)]
+
+    def legacy():
+        for text in corpus:
+            try:
+                detect(text)
+            except LangDetectException:
+                pass
+
+    def cold():
+        language_cache.clear()
+        for text in corpus:
+            detect_language(text)
+
+    def warm():
+        for text in corpus:
+            detect_language(text)
+
+    results = {'texts': size, 'unique_texts': len(unique_texts)}
+    for name, func in (('legacy', legacy), ('cached_cold', cold), ('cached_warm', warm)):
+        results[f'{name}_us_per_text'] = round(measure(func, number=1, repeat=3) / size, 2)
+    results['speedup_cold'] = round(results['legacy_us_per_text'] / results['cached_cold_us_per_text'], 2)
+    return results
+
+# Yeni bir Python sürecinde uygulamanın yüklenme, ısındırma ve ilk analiz süresini ölçen script
+STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import app
+timings = {'import_app': time.perf_counter() - started}
+if sys.argv[1] == 'warm':
+    from warmup import warm_up
+    for name, seconds in warm_up().items():
+        timings['warm_up_' + name] = seconds
+from sentiment_analyzer import analyze_sentiment
+from text_improver import get_text_improvements
+for label in ('first', 'second'):
+    started = time.perf_counter()
+    result = analyze_sentiment('I am not happy with the late delivery of my order.')
+    get_text_improvements(result['text'], result['language_code'], result['sentiment'])
+    timings[label + '_request'] = time.perf_counter() - started
+print(json.dumps(timings))
+"""
+
+@benchmark('startup')
+def bench_startup():
+    """
+    Uygulamanın yüklenme ve ısındırma maliyetini, ısındırma yapılmış ve yapılmamış
+    süreçlerde ilk ve ikinci analiz isteğinin süresiyle birlikte raporlar.
+    Çeviri ağ gecikmesinin ölçüme karışmaması için stub çeviri sağlayıcısı kullanılır.
+    """
+    env = dict(os.environ, TRANSLATION_BACKEND='stub')
+    results = {}
+    for mode in ('cold', 'warm'):
+        output = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT, mode],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        for name, seconds in timings.items():
+            results[f'{mode}_{name}_ms'] = round(seconds * 1000, 1)
+    return results
+
+# Uygulamayı yükleyip süreyi ve en yüksek bellek kullanımını (RSS) yazdıran script
+IMPORT_SCRIPT = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app
+if sys.argv[1] == 'eager':
+    # Eskiden app.py yüklenirken gelen modüller
+    import charts, text_improver, admin
+elapsed = time.perf_counter() - started
+print(json.dumps({'import': elapsed, 'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+def parse_importtime(stderr, top=5):
+    """python -X importtime çıktısından kümülatif süresi en yüksek üst düzey modülleri döndürür."""
+    modules = []
+    for line in stderr.splitlines():
+        fields = line[len('import time:'):].split('|')
+        if not line.startswith('import time:') or len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        # İç içe aktarılan modüller iki boşluk girintiyle yazılır
+        if not fields[2].startswith('  '):
+            modules.append((int(fields[1]), fields[2].strip()))
+    return sorted(modules, reverse=True)[:top]
+
+@benchmark('import_cost')
+def bench_import_cost():
+    """
+    Web worker'ın app.py'yi yükleme süresini ve bellek kullanımını, tembel yüklenen
+    modüllerin (charts/matplotlib, text_improver, admin/flask_admin) de yüklendiği
+    eski durumla karşılaştırır. python -X importtime ile en pahalı modülleri listeler.
+    """
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for mode in ('lazy', 'eager'):
+        runs = []
+        for _ in range(3):
+            output = subprocess.run(
+                [sys.executable, '-c', IMPORT_SCRIPT, mode],
+                cwd=cwd, capture_output=True, text=True, check=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[f'{mode}_import_ms'] = round(min(run['import'] for run in runs) * 1000, 1)
+        results[f'{mode}_rss_mb'] = round(min(run['rss_mb'] for run in runs), 1)
+
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=cwd, capture_output=True, text=True, check=True
+    ).stderr
+    for cumulative_us, name in parse_importtime(stderr):
+        results[f'importtime_{name}_ms'] = round(cumulative_us / 1000, 1)
+    return results
+
+def make_misspelled_text(words, size, error_rate=0.15, seed=42):
+    """Sözlük kelimelerinden, bir kısmında yazım hatası (silme, değiştirme, yer değiştirme) bulunan metin üretir."""
+    rng = random.Random(seed)
+    tokens = []
+    for _ in range(size):
+        word = list(rng.choice(words))
+        if rng.random() < error_rate and len(word) > 3:
+            i = rng.randrange(len(word) - 1)
+            operation = rng.randrange(3)
+            if operation == 0:
+                del word[i]
+            elif operation == 1:
+                word[i] = rng.choice('abcdefghijklmnopqrstuvwxyz')
+            else:
+                word[i], word[i + 1] = word[i + 1], word[i]
+        tokens.append(''.join(word))
+    return ' '.join(tokens) + '.'
+
+# Yazım düzelticisinin soğuk önbellekte TextBlob'a göre ulaşması beklenen en düşük hızlanma
+SPELLING_SPEEDUP_TARGET = 10
+
+@benchmark('spelling')
+def bench_spelling(size=500, texts=5):
+    """
+    500 kelimelik metinlerde TextBlob.correct ile simetrik silme dizinli düzelticiyi karşılaştırır.
+    Soğuk ölçümde her metin yeni (önbelleği boş) bir düzelticiyle düzeltilir; TextBlob'un
+    sözlük yükleme süresi ölçüme katılmaz. Hızlanma hedefin altında kalırsa uyarı yazılır.
+    """
+    from textblob import TextBlob
+    from textblob.en import suggest
+    from spell_checker import SpellChecker
+
+    started = time.perf_counter()
+    checker = SpellChecker.from_file()
+    build_seconds = time.perf_counter() - started
+    common_words = sorted(checker.frequencies, key=checker.frequencies.get, reverse=True)[:5000]
+    samples = [make_misspelled_text(common_words, size, seed=seed) for seed in range(texts)]
+
+    # TextBlob sözlüğünü ilk kullanımda yükler
+    suggest('teh')
+    started = time.perf_counter()
+    legacy = [str(TextBlob(text).correct()) for text in samples]
+    legacy_seconds = (time.perf_counter() - started) / texts
+
+    cold_seconds = 0
+    corrected = []
+    for text in samples:
+        checker.cache.clear()
+        started = time.perf_counter()
+        corrected.append(checker.correct(text))
+        cold_seconds += time.perf_counter() - started
+    cold_seconds /= texts
+
+    # Aynı kelimeler tekrar geldiğinde kelime önbelleğinden döner
+    warm_seconds = measure(lambda: checker.correct(samples[-1]), number=1, repeat=3) / 1e6
+
+    speedup = legacy_seconds / cold_seconds
+    if speedup < SPELLING_SPEEDUP_TARGET:
+        print(f"  UYARI: soğuk hızlanma {speedup:.1f}x, hedef {SPELLING_SPEEDUP_TARGET}x")
+    return {
+        'words': size,
+        'index_build_seconds': round(build_seconds, 2),
+        'index_entries': len(checker.index),
+        'textblob_seconds': round(legacy_seconds, 3),
+        'symspell_cold_seconds': round(cold_seconds, 4),
+        'symspell_warm_seconds': round(warm_seconds, 4),
+        'speedup_cold': round(speedup, 1),
+        'meets_speedup_target': speedup >= SPELLING_SPEEDUP_TARGET,
+        'same_output': legacy == corrected
+    }
+
+@benchmark('text_rules')
+def bench_text_rules():
+    """
+    Her çağrıda sözlük kurup tek kelime eşleştiren eski yöntemi derlenmiş kural motoruyla
+    karşılaştırır. Değiştirmelerin doğruluğu tests/test_text_rules.py'de kontrol edilir.
+    """
+    from text_rules import get_text_rules
+
+    rules = get_text_rules()
+    table = rules.state[0][('alternative_expressions', 'tr')]
+
+    def legacy_match(words):
+        common_expressions = dict((phrase, list(alternatives)) for phrase, alternatives in table.items())
+        return [(i, word) for i, word in enumerate(words) if word in common_expressions]
+
+    def compiled_match(words):
+        return rules.find('alternative_expressions', 'tr', words)
+
+    vocabulary = ['bu', 'ürün', 'çok', 'ama', 've', 'teslimat', 'hayal', 'kırıklığı'] * 4 + list(table)
+    results = {}
+    for size in (50, 500):
+        tokens = make_tokens(vocabulary, size)
+        number = max(1, 20000 // size)
+        legacy = measure(lambda: legacy_match(tokens), number=number)
+        compiled = measure(lambda: compiled_match(tokens), number=number)
+        results[f'legacy_{size}_us'] = round(legacy, 2)
+        results[f'compiled_{size}_us'] = round(compiled, 2)
+    return results
+
+def create_benchmark_app(database_uri=None):
+    """
+    Ölçümler için app.py'yi yüklemeden minimal bir Flask uygulaması oluşturur.
+    Veritabanı verilmezse BENCHMARK_DATABASE_URL ya da geçici bir SQLite dosyası kullanılır.
+    """
+    from flask import Flask
+    from models import db
+
+    if database_uri is None:
+        database_uri = os.environ.get('BENCHMARK_DATABASE_URL') or \
+            'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='empathix-bench-'), 'bench.db')
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if database_uri.startswith('sqlite'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 30}}
+    db.init_app(app)
+    return app
+
+# İstatistik yükü testinde kullanılan analiz sonucu
+SAMPLE_RESULT = {
+    'language_code': 'tr',
+    'language_name': 'Türkçe',
+    'sentiment': 'Pozitif',
+    'emotion_scores': {'happiness': 0.8, 'sadness': 0.1, 'anger': 0.0, 'fear': 0.0, 'surprise': 0.1},
+    'intensity': 3
+}
+
+def legacy_update_stats(analysis_result):
+    """Eski oku-değiştir-yaz sayaç güncellemesi (karşılaştırma için)."""
+    from models import db, SentimentStats
+
+    sentiment_stat = SentimentStats.query.filter_by(sentiment=analysis_result['sentiment']).first()
+    sentiment_stat.count += 1
+    db.session.commit()
+
+def stats_worker(task):
+    """Ayrı bir süreçte istatistikleri art arda günceller, başarısız işlem sayısını döndürür."""
+    from sqlalchemy.exc import DBAPIError
+    from models import db
+    from stats import update_stats
+
+    database_uri, iterations, legacy = task
+    app = create_benchmark_app(database_uri)
+    failures = 0
+    with app.app_context():
+        for _ in range(iterations):
+            try:
+                if legacy:
+                    legacy_update_stats(SAMPLE_RESULT)
+                else:
+                    update_stats(SAMPLE_RESULT)
+                    db.session.commit()
+            except DBAPIError:
+                db.session.rollback()
+                failures += 1
+    return failures
+
+@benchmark('stats_concurrency')
+def bench_stats_concurrency(workers=8, iterations=200):
+    """
+    Eşzamanlı süreçlerin istatistik sayaçlarını güncellediği yük testi.
+    Başarılı her güncelleme sayaca yansımalıdır; fark kaybolan güncelleme sayısıdır.
+    """
+    from models import db, SentimentStats
+
+    app = create_benchmark_app()
+    database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+    results = {}
+
+    for mode, legacy in (('legacy', True), ('atomic', False)):
+        with app.app_context():
+            db.drop_all()
+            db.create_all()
+            db.session.add(SentimentStats(sentiment=SAMPLE_RESULT['sentiment'], count=0))
+            db.session.commit()
+
+        with Pool(workers) as pool:
+            failures = sum(pool.map(stats_worker, [(database_uri, iterations, legacy)] * workers))
+
+        with app.app_context():
+            actual = SentimentStats.query.filter_by(sentiment=SAMPLE_RESULT['sentiment']).first().count
+
+        expected = workers * iterations - failures
+        results[f'{mode}_failed_transactions'] = failures
+        results[f'{mode}_lost_updates'] = expected - actual
+    return results
+
+def seed_analyses(app, rows, days=365, users=10, batch_size=10000, seed=42):
+    """
+    Veritabanını temizler ve rastgele analiz kayıtlarıyla doldurur.
+
+    Args:
+        app: create_benchmark_app ile oluşturulan uygulama
+        rows (int): Eklenecek analiz sayısı
+        days (int): Kayıtların dağıtılacağı geçmiş gün sayısı
+        users (int): Kayıtların dağıtılacağı kullanıcı sayısı
+        batch_size (int): Tek INSERT ile eklenen satır sayısı
+    """
+    from models import db, Analysis, User
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    sentiments = ['Pozitif', 'Negatif', 'Nötr']
+    languages = ['en', 'tr', 'de', 'fr', 'es']
+    text = 'Bu ürün hakkında uzun bir müşteri yorumu. ' * 5
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        for i in range(1, users + 1):
+            db.session.add(User(id=i, username=f'user{i}', email=f'user{i}@example.com'))
+        db.session.commit()
+
+        for start in range(0, rows, batch_size):
+            batch = []
+            for _ in range(min(batch_size, rows - start)):
+                batch.append({
+                    'text': text,
+                    'original_language': rng.choice(languages),
+                    'sentiment': rng.choice(sentiments),
+                    'confidence': rng.random() * 100,
+                    'created_at': now - timedelta(seconds=rng.randrange(days * 86400)),
+                    'user_id': rng.randint(1, users),
+                    'happiness': rng.random(),
+                    'sadness': rng.random(),
+                    'anger': rng.random(),
+                    'fear': rng.random(),
+                    'surprise': rng.random(),
+                    'intensity': rng.randint(1, 3)
+                })
+            db.session.execute(Analysis.__table__.insert(), batch)
+            db.session.commit()
+
+def measure_once(func):
+    """Fonksiyonu bir kez çalıştırır; süreyi (sn) ve en yüksek bellek kullanımını (MB) döndürür."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+@benchmark('time_series')
+def bench_time_series(rows=int(os.environ.get('BENCHMARK_ROWS', 1000000)), days=365):
+    """Zaman serisi verisinin ORM + pandas ile ve SQL GROUP BY ile hesaplanmasını karşılaştırır."""
+    import pandas as pd
+    from models import Analysis
+    from stats import get_daily_sentiment_counts
+
+    app = create_benchmark_app()
+    seed_analyses(app, rows, days=days)
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+
+    def legacy():
+        analyses = Analysis.query.filter(Analysis.created_at.between(start_date, end_date)).all()
+        df = pd.DataFrame([{'date': a.created_at.date(), 'sentiment': a.sentiment} for a in analyses])
+        return df.groupby(['date', 'sentiment']).size().unstack(fill_value=0)
+
+    def aggregated():
+        return get_daily_sentiment_counts(start_date, end_date)
+
+    results = {'rows': rows}
+    with app.app_context():
+        for name, func in (('orm_pandas', legacy), ('sql_group_by', aggregated)):
+            elapsed, peak_mb = measure_once(func)
+            results[f'{name}_seconds'] = round(elapsed, 3)
+            results[f'{name}_peak_mb'] = round(peak_mb, 1)
+    return results
+
+# Ölçüm hattı örnek metinleri: (etiket, metin)
+PIPELINE_TEXTS = [
+    ('en', 'I am really disappointed, the delivery was late again and support never answered my email. '
+           'See https://example.com/order/123 <b>now</b>'),
+    ('tr', 'Sipariş yine geç geldi, çok üzgün ve kızgınım. Destek ekibi hiç yanıt vermedi, berbat bir deneyim.')
+]
+
+@benchmark('pipeline')
+def bench_pipeline():
+    """
+    Analiz hattının aşamalarını ayrı ayrı ve uçtan uca ölçer (çağrı başına mikro saniye).
+    Çeviri ağ gecikmesinin ölçüme karışmaması için stub çeviri sağlayıcısı kullanılır.
+    """
+    from translation import set_backend, StubTranslationBackend
+    from sentiment_analyzer import (clean_text, detect_language, detect_language_code, build_analysis_context,
+                                    analyze_detailed_emotions, highlight_emotional_words, analyze_sentiment,
+                                    result_cache)
+    from text_improver import get_text_improvements
+
+    set_backend(StubTranslationBackend())
+    results = {}
+    for label, text in PIPELINE_TEXTS:
+        cleaned = clean_text(text)
+        lang_code, lang_name = detect_language(cleaned)
+        context = build_analysis_context(cleaned, lang_code)
+        result = analyze_sentiment(text)
+
+        stages = (
+            ('clean_text', lambda: clean_text(text), 1000),
+            ('detect_language_uncached', lambda: detect_language_code(cleaned), 20),
+            ('detect_language', lambda: detect_language(cleaned), 1000),
+            ('analyze_detailed_emotions', lambda: analyze_detailed_emotions(cleaned, lang_code, context), 1000),
+            ('highlight_emotional_words', lambda: highlight_emotional_words(cleaned, lang_code, context), 1000),
+            # Sonuç önbelleği her çağrıdan önce temizlenerek tüm hat ölçülür
+            ('analyze_sentiment', lambda: (result_cache.clear(), analyze_sentiment(text)), 50),
+            ('analyze_sentiment_cached', lambda: analyze_sentiment(text), 1000),
+            ('get_text_improvements', lambda: get_text_improvements(text, lang_code, result['sentiment']), 5)
+        )
+        for name, func, number in stages:
+            results[f'{label}_{name}_us'] = round(measure(func, number=number, repeat=3), 2)
+    return results
+
+@benchmark('stats')
+def bench_stats(sizes=os.environ.get('BENCHMARK_SIZES', '1000,100000,1000000')):
+    """
+    İstatistik güncellemesini ve grafik fonksiyonlarını farklı büyüklükteki
+    veritabanlarında ölçer (BENCHMARK_SIZES, virgülle ayrılmış satır sayıları).
+    Grafikler önbellek atlanarak doğrudan çizilir; önbellekli yol ayrıca ölçülür.
+    """
+    from models import db
+    from stats import (update_stats, get_chart_png, render_sentiment_distribution,
+                       render_language_distribution, render_time_series_analysis, chart_cache)
+
+    def update_stats_and_commit():
+        update_stats(SAMPLE_RESULT)
+        db.session.commit()
+
+    results = {}
+    for rows in (int(size) for size in sizes.split(',')):
+        app = create_benchmark_app()
+        started = time.perf_counter()
+        seed_analyses(app, rows)
+        results[f'{rows}_seed_seconds'] = round(time.perf_counter() - started, 1)
+
+        functions = (
+            ('update_stats', update_stats_and_commit, 20),
+            ('render_sentiment_distribution', lambda: render_sentiment_distribution(), 1),
+            ('render_sentiment_distribution_user', lambda: render_sentiment_distribution(1), 1),
+            ('render_language_distribution', lambda: render_language_distribution(), 1),
+            ('render_language_distribution_user', lambda: render_language_distribution(1), 1),
+            ('render_time_series_analysis', lambda: render_time_series_analysis(30), 1),
+            ('render_time_series_analysis_user', lambda: render_time_series_analysis(30, 1), 1),
+            ('get_chart_png_cached', lambda: get_chart_png('sentiment'), 20)
+        )
+        with app.app_context():
+            chart_cache.clear()
+            for name, func, number in functions:
+                results[f'{rows}_{name}_ms'] = round(measure(func, number=number, repeat=3) / 1000, 2)
+    return results
+
+@benchmark('sentiment_backend')
+def bench_sentiment_backend(size=256, batch_sizes=(1, 2, 4, 8, 16, 32, 64), clients=16):
+    """
+    Duygu puanlama sağlayıcılarının yalnızca CPU üzerinde saniye başına puanladığı metin
+    sayısını ölçer. Transformer modeli sabit grup boyutlarıyla doğrudan ve eşzamanlı
+    tekil isteklerle (dinamik gruplama) ölçülür; transformers/torch kurulu değilse
+    yalnızca TextBlob ölçülür.
+    """
+    # GPU olan makinelerde de CPU ölçülsün (torch yüklenmeden önce ayarlanmalıdır)
+    os.environ['CUDA_VISIBLE_DEVICES'] = ''
+    from concurrent.futures import ThreadPoolExecutor
+    from sentiment_analyzer import EMOTION_KEYWORDS
+    from sentiment_backends import TextBlobBackend, TransformerBackend
+
+    keywords = [word for word in EMOTION_KEYWORDS['happiness'] + EMOTION_KEYWORDS['sadness'] if word.isascii()]
+    vocabulary = FILLER_WORDS * 3 + keywords
+    texts = [' '.join(make_tokens(vocabulary, 20, seed=i)) + '.' for i in range(size)]
+
+    def throughput(func):
+        started = time.perf_counter()
+        func()
+        return round(size / (time.perf_counter() - started), 1)
+
+    textblob = TextBlobBackend()
+    results = {'texts': size, 'textblob_texts_per_second': throughput(lambda: textblob.score_many(texts))}
+
+    try:
+        transformer = TransformerBackend()
+        started = time.perf_counter()
+        transformer.warm_up()
+    except ImportError:
+        results['transformer_available'] = False
+        return results
+    results['transformer_available'] = True
+    results['transformer_load_seconds'] = round(time.perf_counter() - started, 2)
+
+    for batch_size in batch_sizes:
+        transformer.max_batch_size = batch_size
+        results[f'transformer_batch_{batch_size}_texts_per_second'] = throughput(lambda: transformer.predict(texts))
+
+    # Eşzamanlı istemcilerin her biri tek metin gönderir; arka plan thread'i istekleri gruplar
+    transformer.max_batch_size = max(batch_sizes)
+    transformer.batches = transformer.batched_texts = 0
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results[f'transformer_dynamic_{clients}_clients_texts_per_second'] = throughput(
+            lambda: list(pool.map(transformer.score, texts)))
+    results['transformer_dynamic_mean_batch_size'] = transformer.stats()['mean_batch_size']
+    return results
+
+# Karşılaştırmada dikkate alınmayan, eski uygulamaları ölçen metrik önekleri
+REFERENCE_PREFIXES = ('legacy_', 'textblob_', 'orm_pandas_')
+# Düşük olması iyi olan metrik sonekleri
+LOWER_IS_BETTER = ('_us', '_ms', '_seconds', '_mb', '_us_per_text', '_failed_transactions', '_lost_updates')
+# Yüksek olması iyi olan metrik sonekleri
+HIGHER_IS_BETTER = ('_per_second',)
+
+def compare_results(results, baseline, tolerance):
+    """
+    Ölçüm sonuçlarını kayıtlı referans sonuçlarla karşılaştırır.
+    Süre, bellek, hata ve saniye başına işlem metriklerinde referanstan tolerance oranından fazla kötüleşme,
+    True olan mantıksal metriklerin False olması gerileme sayılır. Adet gibi bilgi
+    amaçlı metrikler ve eski uygulamaların ölçümleri karşılaştırılmaz.
+
+    Args:
+        results (dict): {ölçüm: {metrik: değer}}
+        baseline (dict): Aynı biçimde referans sonuçlar
+        tolerance (float): İzin verilen göreli kötüleşme (0.25 = %25)
+
+    Returns:
+        list: (ölçüm, metrik, referans, güncel değer) gerilemeleri
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base is None or metric.startswith(REFERENCE_PREFIXES):
+                continue
+            if isinstance(base, bool):
+                regressed = base and not value
+            elif metric.endswith(LOWER_IS_BETTER):
+                regressed = value > base * (1 + tolerance) if base else value > 0
+            elif metric.endswith(HIGHER_IS_BETTER):
+                regressed = value < base / (1 + tolerance)
+            else:
+                continue
+            if regressed:
+                regressions.append((name, metric, base, value))
+    return regressions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Empathix performans ölçümleri')
+    parser.add_argument('names', nargs='*', help=f"Çalıştırılacak ölçümler (varsayılan: tümü): {', '.join(BENCHMARKS)}")
+    parser.add_argument('--json', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--baseline', help='Karşılaştırılacak referans sonuçların JSON dosyası')
+    parser.add_argument('--tolerance', type=float, default=float(os.environ.get('BENCHMARK_TOLERANCE', 0.25)),
+                        help='Gerileme sayılmadan izin verilen göreli kötüleşme (varsayılan: 0.25)')
+    args = parser.parse_args(argv)
+
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Bilinmeyen ölçüm: {', '.join(unknown)}")
+        print(f"Mevcut ölçümler: {', '.join(BENCHMARKS)}")
+        return 1
+
+    all_results = {}
+    for name in names:
+        print(f"== {name} ==")
+        results = BENCHMARKS[name]()
+        all_results[name] = results
+        for metric, value in results.items():
+            print(f"  {metric:<32} {value}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created_at': datetime.utcnow().isoformat(timespec='seconds'),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'results': all_results
+            }, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare_results(all_results, baseline, args.tolerance)
+        print(f"== Karşılaştırma ({args.baseline}, tolerans %{args.tolerance * 100:.0f}) ==")
+        for name, metric, base, value in regressions:
+            print(f"  GERİLEME {name}.{metric}: {base} -> {value}")
+        if regressions:
+            return 2
+        print("  Gerileme yok")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,172 @@
+"""
+Büyük dosyaların akış halinde analiz edilmesi için modül.
+Bu modül, satır satır okunan NDJSON veya düz metin girdisini sabit boyutlu
+parçalar halinde analiz eder ve sonuçları üretildikçe NDJSON olarak döndürür.
+Girdi ve çıktı hiçbir zaman tamamen belleğe alınmaz; bir sonraki parça ancak
+önceki parçanın sonuçları tüketildiğinde okunur.
+
+Komut satırı kullanımı:
+    python bulk_analysis.py girdi.ndjson -o sonuclar.ndjson
+    cat metinler.txt | python bulk_analysis.py > sonuclar.ndjson
+"""
+
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+from sentiment_analyzer import analyze_sentiment_batch
+
+# Tek seferde analiz edilen satır sayısı
+STREAM_CHUNK_SIZE = int(os.environ.get('STREAM_CHUNK_SIZE', 100))
+# Bir girdi satırının en fazla karakter (bayt akışında bayt) sayısı; daha uzun satırlar belleğe alınmadan atlanır
+STREAM_MAX_LINE_LENGTH = int(os.environ.get('STREAM_MAX_LINE_LENGTH', 20000))
+
+def parse_line(line):
+    """
+    Girdi satırından kayıt kimliğini ve metni çıkarır.
+    Satır {"text": ..., "id": ...} biçiminde bir JSON nesnesi, JSON string'i
+    veya düz metin olabilir. Tırnakla başlayıp JSON olarak okunamayan satırlar
+    (örn. alıntı ile başlayan bir cümle) düz metin kabul edilir.
+
+    Args:
+        line (str | bytes): Girdi satırı
+
+    Returns:
+        tuple: (kayıt kimliği, metin, hata mesajı); boş satırlar için None
+    """
+    if isinstance(line, bytes):
+        line = line.decode('utf-8', errors='replace')
+    line = line.strip()
+    if not line:
+        return None
+
+    if line[0] not in '{"':
+        return None, line, None
+
+    try:
+        data = json.loads(line)
+    except ValueError:
+        if line[0] == '"':
+            return None, line, None
+        return None, None, 'Invalid JSON'
+
+    if isinstance(data, str):
+        return None, data, None
+    if isinstance(data, dict):
+        return data.get('id'), data.get('text'), None
+    return None, None, 'Unsupported JSON value'
+
+def iter_lines(source, max_length=STREAM_MAX_LINE_LENGTH):
+    """
+    Satırları en fazla max_length uzunluğunda okur.
+    readline destekleyen akışlarda (dosyalar, istek gövdesi) sınırı aşan satırlar
+    parça parça okunup atılır; satırın tamamı hiçbir zaman belleğe alınmaz.
+
+    Args:
+        source (iterable): Girdi akışı veya satırlar (str veya bytes)
+        max_length (int): Satır sonu hariç en fazla karakter sayısı
+
+    Yields:
+        str | bytes: Satır; sınırı aşan satırlar için None
+    """
+    readline = getattr(source, 'readline', None)
+    if readline is None:
+        for line in source:
+            yield None if len(line.rstrip()) > max_length else line
+        return
+
+    # Satır sonu (\r\n) için iki karakter pay bırakılır
+    limit = max_length + 2
+    while True:
+        line = readline(limit)
+        if not line:
+            return
+        newline = b'\n' if isinstance(line, bytes) else '\n'
+        if len(line) == limit and not line.endswith(newline):
+            # Satırın kalanını sınırlı parçalarla oku ve at
+            while line and not line.endswith(newline):
+                line = readline(limit)
+            yield None
+            continue
+        yield None if len(line.rstrip()) > max_length else line
+
+def iter_records(lines, max_length=STREAM_MAX_LINE_LENGTH):
+    """Boş satırları atlayarak (satır no, kimlik, metin, hata) kayıtları üretir."""
+    for line_no, line in enumerate(iter_lines(lines, max_length), start=1):
+        if line is None:
+            yield line_no, None, None, f'Line exceeds {max_length} characters'
+            continue
+        parsed = parse_line(line)
+        if parsed is not None:
+            yield (line_no,) + parsed
+
+def iter_chunks(iterable, size):
+    """Yineleyiciyi en fazla 'size' elemanlı listeler halinde tüketir."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def analyze_stream(lines, chunk_size=STREAM_CHUNK_SIZE, max_line_length=STREAM_MAX_LINE_LENGTH):
+    """
+    Satırları parçalar halinde analiz eder ve sonuçları sırayla üretir.
+
+    Args:
+        lines (iterable): Girdi akışı veya satırları (str veya bytes)
+        chunk_size (int): Tek seferde analiz edilen satır sayısı
+        max_line_length (int): Bir satırın en fazla uzunluğu; aşan satırlar için hata döner
+
+    Yields:
+        dict: Analiz sonucu; 'line' ve varsa 'id' alanlarını içerir
+    """
+    for chunk in iter_chunks(iter_records(lines, max_line_length), chunk_size):
+        texts = [text for line_no, record_id, text, error in chunk if error is None]
+        analyzed = iter(analyze_sentiment_batch(texts))
+
+        for line_no, record_id, text, error in chunk:
+            result = {'text': text, 'error': error} if error else next(analyzed)
+            result['line'] = line_no
+            if record_id is not None:
+                result['id'] = record_id
+            yield result
+
+def iter_ndjson(results):
+    """Sonuçları NDJSON satırlarına dönüştürür."""
+    for result in results:
+        yield json.dumps(result, ensure_ascii=False) + '\n'
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='NDJSON veya düz metin dosyalarını akış halinde analiz eder.')
+    parser.add_argument('input', nargs='?', default='-', help="Girdi dosyası ('-' = standart girdi)")
+    parser.add_argument('-o', '--output', default='-', help="Çıktı dosyası ('-' = standart çıktı)")
+    parser.add_argument('--chunk-size', type=int, default=STREAM_CHUNK_SIZE, help='Tek seferde analiz edilen satır sayısı')
+    parser.add_argument('--max-line-length', type=int, default=STREAM_MAX_LINE_LENGTH, help='Bir satırın en fazla karakter sayısı')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    count = 0
+    errors = 0
+    try:
+        for result in analyze_stream(source, args.chunk_size, args.max_line_length):
+            target.write(json.dumps(result, ensure_ascii=False) + '\n')
+            count += 1
+            if 'error' in result:
+                errors += 1
+            if count % args.chunk_size == 0:
+                target.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(f"{count} satır analiz edildi, {errors} hata.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Uygulama genelinde kullanılan önbellek yapıları.
+Bu modül, sınırlı boyutlu bellek içi LRU önbelleği, gunicorn worker yeniden
+başlatmalarından sonra da korunan SQLite tabanlı kalıcı önbelleği ve bu iki
+seviyeyi birleştiren katmanlı önbelleği sağlar.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+def normalize_text(text):
+    """Önbellek anahtarı için metni normalize eder (Unicode NFC ve boşluklar)."""
+    text = unicodedata.normalize('NFC', text)
+    return ' '.join(text.split())
+
+def make_key(*parts):
+    """
+    Verilen parçalardan sabit uzunlukta bir önbellek anahtarı üretir.
+    Son parça genellikle metnin kendisidir ve SHA-256 ile özetlenir.
+
+    Args:
+        *parts: Anahtarı oluşturan değerler (örn. kaynak dil, hedef dil, metin)
+
+    Returns:
+        str: Önbellek anahtarı
+    """
+    *prefix, text = parts
+    digest = hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+    return ':'.join([str(p) for p in prefix] + [digest])
+
+class LRUCache:
+    """
+    Thread-safe, sınırlı boyutlu ve isteğe bağlı TTL destekli bellek içi önbellek.
+    Boyut aşıldığında en uzun süredir kullanılmayan kayıt çıkarılır.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Kayıt varsa değerini, yoksa veya süresi dolmuşsa None döndürür."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.time():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expires_at=None):
+        """
+        Değeri önbelleğe ekler, gerekirse en eski kayıtları çıkarır.
+        expires_at verilirse (başka bir seviyeden taşınan kayıt) kayıt o anda geçersiz olur;
+        verilmezse geçerlilik süresi ttl'den hesaplanır.
+        """
+        if expires_at is None and self.ttl:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Önbellek sayaçlarını döndürür."""
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+class SQLiteCache:
+    """
+    SQLite dosyasında tutulan kalıcı önbellek.
+    Aynı dosyayı kullanan tüm gunicorn worker'ları kayıtları paylaşır ve
+    worker yeniden başlatıldığında kayıtlar kaybolmaz. Değerler JSON olarak saklanır.
+    """
+
+    # Kayıt sayısı kontrolünün kaç yazmada bir yapılacağı
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path, ttl=None, max_entries=100000, table='cache'):
+        self.path = path
+        self.ttl = ttl or None
+        self.max_entries = max_entries
+        self.table = table
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _connect(self):
+        # sqlite3 bağlantıları thread'ler ve fork edilmiş süreçler arasında paylaşılamaz
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)'
+        )
+        conn.execute(f'CREATE INDEX IF NOT EXISTS ix_{self.table}_created_at ON {self.table} (created_at)')
+        conn.commit()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        """Kayıt varsa değerini, yoksa veya süresi dolmuşsa None döndürür."""
+        return self.get_entry(key)[0]
+
+    def get_entry(self, key):
+        """
+        Kaydın değerini ve geçerliliğinin biteceği zamanı döndürür.
+
+        Returns:
+            tuple: (değer, bitiş zamanı); kayıt yoksa veya süresi dolmuşsa (None, None),
+                   TTL yoksa bitiş zamanı None
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(f'SELECT value, created_at FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Önbellek okuma hatası: {e}")
+            self.misses += 1
+            return None, None
+
+        if row is None:
+            self.misses += 1
+            return None, None
+
+        value, created_at = row
+        expires_at = created_at + self.ttl if self.ttl else None
+        if expires_at is not None and expires_at < time.time():
+            self.expirations += 1
+            self.misses += 1
+            return None, None
+
+        self.hits += 1
+        return json.loads(value), expires_at
+
+    def set(self, key, value):
+        """Değeri kalıcı önbelleğe yazar."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                f'INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), time.time())
+            )
+            conn.commit()
+
+            self._writes += 1
+            if self._writes % self.PRUNE_INTERVAL == 0:
+                self.prune()
+        except sqlite3.Error as e:
+            print(f"Önbellek yazma hatası: {e}")
+
+    def prune(self):
+        """Süresi dolmuş kayıtları ve kapasiteyi aşan en eski kayıtları siler."""
+        conn = self._connect()
+        if self.ttl:
+            cursor = conn.execute(f'DELETE FROM {self.table} WHERE created_at < ?', (time.time() - self.ttl,))
+            self.expirations += cursor.rowcount
+
+        count = conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+        if self.max_entries and count > self.max_entries:
+            cursor = conn.execute(
+                f'DELETE FROM {self.table} WHERE key IN '
+                f'(SELECT key FROM {self.table} ORDER BY created_at LIMIT ?)',
+                (count - self.max_entries,)
+            )
+            self.evictions += cursor.rowcount
+        conn.commit()
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute(f'DELETE FROM {self.table}')
+        conn.commit()
+
+    def __len__(self):
+        return self._connect().execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def stats(self):
+        """Önbellek sayaçlarını döndürür."""
+        return {
+            'path': self.path,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+class TieredCache:
+    """
+    Bellek içi LRU seviyesi ile isteğe bağlı kalıcı seviyeyi birleştirir.
+    Okumada önce bellek, sonra disk kontrol edilir; diskte bulunan kayıt kalan geçerlilik
+    süresiyle belleğe taşınır, böylece bellekte diskteki süresinden uzun yaşamaz.
+    """
+
+    def __init__(self, memory, disk=None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None or self.disk is None:
+            return value
+
+        value, expires_at = self.disk.get_entry(key)
+        if value is not None:
+            self.memory.set(key, value, expires_at=expires_at)
+        return value
+
+    def set(self, key, value):
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        """Her iki seviyenin sayaçlarını ve toplam isabet oranını döndürür."""
+        memory_stats = self.memory.stats()
+        disk_stats = self.disk.stats() if self.disk is not None else None
+
+        hits = memory_stats['hits'] + (disk_stats['hits'] if disk_stats else 0)
+        lookups = memory_stats['hits'] + memory_stats['misses']
+        return {
+            'memory': memory_stats,
+            'disk': disk_stats,
+            'hits': hits,
+            'misses': lookups - hits,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0
+        }
+
+def create_cache(maxsize, ttl=None, path=None, table='cache', max_entries=100000):
+    """
+    Bellek içi LRU ve (path verilmişse) SQLite seviyelerinden oluşan önbellek oluşturur.
+
+    Args:
+        maxsize (int): Bellek içi kayıt sınırı
+        ttl (int, optional): Kayıtların geçerlilik süresi (saniye), 0 veya None ise süresiz
+        path (str, optional): Kalıcı önbellek için SQLite dosya yolu
+        table (str): SQLite tablo adı
+        max_entries (int): Kalıcı seviyedeki kayıt sınırı
+
+    Returns:
+        TieredCache: Katmanlı önbellek
+    """
+    memory = LRUCache(maxsize=maxsize, ttl=ttl)
+    disk = SQLiteCache(path, ttl=ttl, max_entries=max_entries, table=table) if path else None
+    return TieredCache(memory, disk)
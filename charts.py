@@ -0,0 +1,79 @@
+"""
+Grafik çizim modülü.
+Bu modül matplotlib ile PNG grafik üretimini stats modülünden ayırır. matplotlib
+ve numpy yüklemesi uzun sürdüğü ve bellek kullandığı için bu modül yalnızca bir
+grafik ilk kez çizileceği zaman içe aktarılır.
+"""
+
+import io
+import matplotlib
+matplotlib.use('Agg')  # GUI olmadan çalışması için
+import matplotlib.pyplot as plt
+import numpy as np
+
+def figure_to_png():
+    """Aktif matplotlib figürünü PNG olarak döndürür ve figürü kapatır."""
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', bbox_inches='tight')
+    plt.close()
+    png = buf.getvalue()
+    buf.close()
+    return png
+
+def palette(count, name='tab10'):
+    """Renk haritasından eşit aralıklı count adet renk döndürür."""
+    cmap = plt.cm.get_cmap(name)
+    return [cmap(i) for i in np.linspace(0, 1, count)]
+
+def render_pie_chart(labels, sizes, colors, title, startangle=90):
+    """
+    Pasta grafik çizer.
+
+    Args:
+        labels (list): Dilim etiketleri
+        sizes (list): Dilim değerleri
+        colors (list): Dilim renkleri
+        title (str): Grafik başlığı
+        startangle (int): İlk dilimin başlangıç açısı
+
+    Returns:
+        bytes: PNG grafik görüntüsü.
+    """
+    plt.figure(figsize=(8, 6))
+    plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+            shadow=True, startangle=startangle, textprops={'fontsize': 12})
+    plt.axis('equal')  # Dairesel görünüm için
+    plt.title(title, fontsize=16, pad=20)
+
+    return figure_to_png()
+
+def render_sentiment_time_series(dates, series, days):
+    """
+    Günlük duygu sayılarının çizgi grafiğini çizer.
+
+    Args:
+        dates (list): Günler
+        series (dict): {duygu: günlük sayılar}
+        days (int): Grafiğin kapsadığı gün sayısı
+
+    Returns:
+        bytes: PNG grafik görüntüsü.
+    """
+    plt.figure(figsize=(10, 6))
+
+    # Çizgi grafiği çiz
+    plt.plot(dates, series['Pozitif'], 'g-', label='Pozitif', linewidth=2)
+    plt.plot(dates, series['Negatif'], 'r-', label='Negatif', linewidth=2)
+    plt.plot(dates, series['Nötr'], 'y-', label='Nötr', linewidth=2)
+
+    # Grafik ayarları
+    plt.title(f'Son {days} Gün İçindeki Analiz Dağılımı', fontsize=16)
+    plt.xlabel('Tarih', fontsize=12)
+    plt.ylabel('Analiz Sayısı', fontsize=12)
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.legend()
+
+    # X ekseni tarih formatını ayarla
+    plt.gcf().autofmt_xdate()
+
+    return figure_to_png()
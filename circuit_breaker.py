@@ -0,0 +1,128 @@
+"""
+Devre kesici (circuit breaker) modülü.
+Bu modül, dış servis çağrılarının son sonuçlarını kayan bir pencerede izler.
+Hata veya yavaş çağrı oranı eşiği aştığında devre açılır ve çağrılar beklemeden
+reddedilir. Belirli bir süre sonra tek bir deneme çağrısına izin verilir; deneme
+başarılı olursa devre yeniden kapanır.
+"""
+
+import threading
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """Devre açıkken yapılan çağrılarda fırlatılır."""
+
+class CircuitBreaker:
+    """
+    Hata ve gecikme oranına göre açılıp kapanan devre kesici.
+
+    Args:
+        name (str): Metriklerde kullanılacak isim
+        window_size (int): Değerlendirilen son çağrı sayısı
+        min_calls (int): Devrenin açılabilmesi için penceredeki en az çağrı sayısı
+        failure_rate (float): Devreyi açan kötü (hatalı veya yavaş) çağrı oranı
+        slow_call_seconds (float): Bu süreden uzun süren başarılı çağrılar da kötü sayılır
+        open_seconds (float): Devrenin deneme çağrısına izin vermeden önce açık kalacağı süre
+    """
+
+    def __init__(self, name, window_size=20, min_calls=5, failure_rate=0.5,
+                 slow_call_seconds=2.0, open_seconds=30.0):
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        self.transitions = {}
+        self.rejected_calls = 0
+        self.failed_calls = 0
+        self.slow_calls = 0
+        self.successful_calls = 0
+
+    def _transition(self, state):
+        # Kilit tutulurken çağrılmalıdır
+        key = f'{self.state}->{state}'
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        print(f"Devre kesici '{self.name}': {self.state} -> {state}")
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._outcomes.clear()
+        self._probe_in_flight = False
+
+    def allow(self):
+        """
+        Çağrının yapılıp yapılamayacağını döndürür.
+        Açık devre, bekleme süresi dolduğunda yarı açık duruma geçer ve tek bir deneme çağrısına izin verir.
+        """
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self._transition(HALF_OPEN)
+
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.rejected_calls += 1
+            return False
+
+    def record_success(self, duration):
+        """Başarılı çağrıyı süresiyle birlikte kaydeder."""
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            if slow:
+                self.slow_calls += 1
+            else:
+                self.successful_calls += 1
+
+            if self.state == HALF_OPEN:
+                self._transition(OPEN if slow else CLOSED)
+                return
+            self._record(slow)
+
+    def record_failure(self):
+        """Hatalı çağrıyı kaydeder."""
+        with self._lock:
+            self.failed_calls += 1
+            if self.state == HALF_OPEN:
+                self._transition(OPEN)
+                return
+            self._record(True)
+
+    def _record(self, bad):
+        self._outcomes.append(bad)
+        if self.state != CLOSED or len(self._outcomes) < self.min_calls:
+            return
+        if sum(self._outcomes) / len(self._outcomes) >= self.failure_rate:
+            self._transition(OPEN)
+
+    def stats(self):
+        """Devre durumunu ve sayaçlarını döndürür."""
+        with self._lock:
+            window = list(self._outcomes)
+            return {
+                'name': self.name,
+                'state': self.state,
+                'window_calls': len(window),
+                'window_failure_rate': round(sum(window) / len(window), 4) if window else 0.0,
+                'successful_calls': self.successful_calls,
+                'slow_calls': self.slow_calls,
+                'failed_calls': self.failed_calls,
+                'rejected_calls': self.rejected_calls,
+                'transitions': dict(self.transitions)
+            }
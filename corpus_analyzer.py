@@ -0,0 +1,198 @@
+"""
+Empathix Toplu Derlem Analiz Aracı
+
+Bu script, büyük metin derlemlerini (CSV, JSONL veya Parquet) web uygulaması
+olmadan, birden fazla işlemci çekirdeğine dağıtarak analiz eder. Her worker
+süreci NLTK ve TextBlob'u yalnızca bir kez yükler. Çalışma sonunda saniye
+başına işlenen metin sayısı ve aşama bazında süreler raporlanır.
+
+Kullanım:
+    python corpus_analyzer.py yorumlar.csv -o sonuclar.jsonl --workers 8
+    python corpus_analyzer.py biletler.jsonl -o sonuclar.csv --text-column body --improvements
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+from bulk_analysis import iter_chunks
+
+# Worker başına bir görevde işlenen satır sayısı
+DEFAULT_CHUNK_SIZE = 200
+
+# CSV çıktısına yazılan alanlar
+CSV_FIELDS = [
+    'id', 'language_code', 'sentiment', 'polarity', 'subjectivity', 'confidence',
+    'happiness', 'sadness', 'anger', 'fear', 'surprise', 'intensity', 'improved_text', 'error'
+]
+
+def read_rows(path, text_column, id_column=None):
+    """
+    Girdi dosyasından (kimlik, metin) çiftlerini okur.
+    CSV ve JSONL satır satır okunur; Parquet dosyaları pandas ile yüklenir.
+
+    Args:
+        path (str): Girdi dosyası (.csv, .jsonl/.ndjson, .parquet)
+        text_column (str): Metni içeren sütun
+        id_column (str, optional): Kayıt kimliğini içeren sütun
+
+    Yields:
+        tuple: (kimlik, metin)
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            for i, row in enumerate(csv.DictReader(f)):
+                yield (row.get(id_column) if id_column else i), row.get(text_column)
+    elif extension in ('.jsonl', '.ndjson'):
+        with open(path, encoding='utf-8') as f:
+            i = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                yield (row.get(id_column) if id_column else i), row.get(text_column)
+                i += 1
+    elif extension == '.parquet':
+        import pandas as pd
+        df = pd.read_parquet(path)
+        ids = df[id_column] if id_column else range(len(df))
+        for record_id, text in zip(ids, df[text_column]):
+            yield record_id, text
+    else:
+        raise ValueError(f"Desteklenmeyen dosya türü: {extension}")
+
+def init_worker():
+    """Her worker sürecinde analiz modüllerini bir kez yükler ve TextBlob'u ısıtır."""
+    global sentiment_analyzer, text_improver
+    import sentiment_analyzer
+    import text_improver
+    from textblob import TextBlob
+
+    TextBlob('warm up').sentiment
+    sentiment_analyzer.word_tokenize('warm up')
+
+def analyze_chunk(task):
+    """
+    Bir satır parçasını worker sürecinde analiz eder.
+
+    Args:
+        task (tuple): (satır listesi, metin iyileştirmeleri hesaplansın mı)
+
+    Returns:
+        tuple: (sonuç listesi, {aşama: toplam süre})
+    """
+    rows, with_improvements = task
+    timings = defaultdict(float)
+    results = []
+
+    for record_id, text in rows:
+        if not isinstance(text, str) or not text.strip():
+            results.append({'id': record_id, 'error': 'Text is required'})
+            continue
+
+        try:
+            started = time.perf_counter()
+            cleaned_text = sentiment_analyzer.clean_text(text)
+            timings['clean'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            lang_code, lang_name = sentiment_analyzer.detect_language(cleaned_text)
+            timings['detect_language'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            context = sentiment_analyzer.build_analysis_context(cleaned_text, lang_code)
+            timings['translate_and_polarity'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            result = sentiment_analyzer.build_sentiment_result(text, lang_name, context)
+            timings['emotions'] += time.perf_counter() - started
+
+            result['id'] = record_id
+            if with_improvements:
+                started = time.perf_counter()
+                result['improvements'] = text_improver.get_text_improvements(text, lang_code, result['sentiment'])
+                timings['improvements'] += time.perf_counter() - started
+
+            results.append(result)
+        except Exception as e:
+            results.append({'id': record_id, 'error': str(e)})
+
+    return results, dict(timings)
+
+class ResultWriter:
+    """Sonuçları uzantıya göre JSONL veya CSV olarak yazar."""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.csv = None
+        if path.lower().endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            self.csv.writeheader()
+
+    def write(self, result):
+        if self.csv is None:
+            self.file.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+            return
+
+        row = dict(result)
+        row.update(result.get('emotion_scores', {}))
+        improvements = result.get('improvements')
+        if improvements:
+            row['improved_text'] = improvements['improved_text']['improved_text']
+        self.csv.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Büyük metin derlemlerini çok çekirdekli olarak analiz eder.')
+    parser.add_argument('input', help='Girdi dosyası (.csv, .jsonl, .ndjson, .parquet)')
+    parser.add_argument('-o', '--output', required=True, help='Çıktı dosyası (.jsonl veya .csv)')
+    parser.add_argument('--text-column', default='text', help='Metni içeren sütun')
+    parser.add_argument('--id-column', help='Kayıt kimliğini içeren sütun')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker süreç sayısı')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Bir görevdeki satır sayısı')
+    parser.add_argument('--improvements', action='store_true', help='Metin iyileştirme önerilerini de hesapla')
+    args = parser.parse_args(argv)
+
+    rows = read_rows(args.input, args.text_column, args.id_column)
+    tasks = ((chunk, args.improvements) for chunk in iter_chunks(rows, args.chunk_size))
+
+    writer = ResultWriter(args.output)
+    stage_totals = defaultdict(float)
+    count = 0
+    errors = 0
+    started = time.perf_counter()
+
+    try:
+        with Pool(processes=args.workers, initializer=init_worker) as pool:
+            # imap sonuçları girdi sırasıyla ve hazır oldukça döndürür
+            for results, timings in pool.imap(analyze_chunk, tasks):
+                for result in results:
+                    writer.write(result)
+                    count += 1
+                    if 'error' in result:
+                        errors += 1
+                for stage, seconds in timings.items():
+                    stage_totals[stage] += seconds
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    throughput = count / elapsed if elapsed > 0 else 0.0
+
+    print(f"{count} metin {elapsed:.1f} saniyede analiz edildi ({throughput:.1f} metin/sn), {errors} hata.", file=sys.stderr)
+    print("Aşama süreleri (tüm worker'ların toplamı):", file=sys.stderr)
+    for stage, seconds in sorted(stage_totals.items(), key=lambda item: item[1], reverse=True):
+        per_text = seconds / count * 1000 if count else 0.0
+        print(f"  {stage:<24} {seconds:10.2f} sn  {per_text:8.2f} ms/metin", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""
+Uzun belgelerin cümle bazında akış halinde analiz edilmesi için modül.
+Bu modül, belgeyi satır satır okuyarak cümlelere ayırır, cümleleri çeviri
+sınırını aşmayan bölümler halinde gruplar ve bölümleri küçük partiler halinde
+analiz eder. Her bölümün sonucu hazır olur olmaz üretilir; en sonda bölüm
+sonuçları metin uzunluğuyla ağırlıklandırılarak belge düzeyinde birleştirilir.
+Belgenin tamamı hiçbir zaman belleğe alınmaz.
+
+Komut satırı kullanımı:
+    python document_analysis.py rapor.txt -o sonuclar.ndjson
+"""
+
+import argparse
+import codecs
+import os
+import sys
+from collections import Counter
+from nltk.tokenize import sent_tokenize
+from bulk_analysis import iter_chunks, iter_ndjson
+from sentiment_analyzer import (analyze_sentiment_batch, calculate_intensity, polarity_to_sentiment,
+                                SUPPORTED_LANGUAGES)
+from translation import MAX_TRANSLATION_LENGTH
+
+# Bir bölümün en fazla karakter sayısı (çeviri sağlayıcısının sınırını aşmamalıdır)
+DOCUMENT_SEGMENT_CHARS = min(int(os.environ.get('DOCUMENT_SEGMENT_CHARS', 1000)), MAX_TRANSLATION_LENGTH)
+# Aynı anda analiz edilen (ve çevirileri eşzamanlı yapılan) bölüm sayısı
+DOCUMENT_BATCH_SIZE = int(os.environ.get('DOCUMENT_BATCH_SIZE', 20))
+
+EMOTIONS = ['happiness', 'sadness', 'anger', 'fear', 'surprise']
+
+def split_long_text(text, max_chars):
+    """Sınırdan uzun metni kelime sınırlarından bölerek parçalar üretir."""
+    part = []
+    length = 0
+    for word in text.split():
+        if part and length + len(word) + 1 > max_chars:
+            yield ' '.join(part)
+            part, length = [], 0
+        # Tek başına sınırı aşan kelimeler (örn. uzun URL'ler) kesilir
+        while len(word) > max_chars:
+            yield word[:max_chars]
+            word = word[max_chars:]
+        part.append(word)
+        length += len(word) + 1
+    if part:
+        yield ' '.join(part)
+
+def iter_line_parts(source, limit):
+    """
+    Akışı satır satır, tek okumada en fazla limit uzunluğunda okur.
+    Sınırı aşan satırlar son boşluktan bölünerek parça parça üretilir; yarım kalan
+    kelime bir sonraki parçaya taşınır. Böylece tek satırlık bir belge de belleğe
+    tamamen alınmadan işlenir. readline desteklemeyen kaynaklar (satır listeleri)
+    olduğu gibi üretilir.
+
+    Args:
+        source (iterable): Girdi akışı veya satırlar (str veya bytes)
+        limit (int): Tek okumada okunacak en fazla karakter (bayt) sayısı
+
+    Yields:
+        str | bytes: Satır veya satır parçası
+    """
+    readline = getattr(source, 'readline', None)
+    if readline is None:
+        yield from source
+        return
+
+    # Okuma sınırında bölünen çok baytlı UTF-8 karakterleri bir sonraki okumada tamamlanır
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    carry = ''
+    while True:
+        raw = readline(limit)
+        if not raw:
+            carry += decoder.decode(b'', final=True)
+            if carry:
+                yield carry
+            return
+        text = carry + (decoder.decode(raw) if isinstance(raw, bytes) else raw)
+        carry = ''
+        if len(raw) == limit and not text.endswith('\n'):
+            # Satır bitmedi: son boşluktan böl, yarım kalmış olabilecek son kelimeyi taşı
+            cut = len(text) - 1
+            while cut >= 0 and not text[cut].isspace():
+                cut -= 1
+            if cut > 0:
+                text, carry = text[:cut], text[cut + 1:]
+            # Yalnızca boşluktan oluşan parçalar paragraf sonu sayılmamalıdır
+            if not text.strip():
+                continue
+        yield text
+
+def iter_sentences(lines, max_buffer=DOCUMENT_SEGMENT_CHARS * 4):
+    """
+    Satırları okuyarak cümleleri sırayla üretir.
+    Paragraf sonlarında (boş satır) tampondaki tüm cümleler üretilir. Tampon sınırı
+    aşılırsa, yarım kalmış olabilecek son cümle dışındakiler üretilir; son cümle
+    tamponun yarısından uzunsa (noktalama içermeyen metin) o da kelime sınırlarından
+    bölünerek üretilir. Akışlar tampon sınırının yarısını aşmayan okumalarla okunur
+    (bkz. iter_line_parts). Böylece paragraf veya noktalama içermeyen, hatta tek satırlık
+    uzun belgelerde de bellek kullanımı ve yeniden bölme maliyeti sınırlı kalır.
+
+    Args:
+        lines (iterable): Belge akışı veya satırları (str veya bytes)
+        max_buffer (int): Tamponda tutulacak en fazla karakter sayısı
+
+    Yields:
+        str: Cümle
+    """
+    buffer = []
+    buffered = 0
+    for line in iter_line_parts(lines, max_buffer // 2):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        line = line.strip()
+
+        if line:
+            buffer.append(line)
+            buffered += len(line) + 1
+            if buffered < max_buffer:
+                continue
+            sentences = sent_tokenize(' '.join(buffer))
+            yield from sentences[:-1]
+            tail = sentences[-1]
+            if len(tail) <= max_buffer // 2:
+                buffer, buffered = [tail], len(tail)
+                continue
+            # Noktalama içermeyen metinde son parça hiç kısalmaz; tamponda tutulursa her
+            # satırda yeniden bölünür. Kelime sınırlarından bölünerek üretilir.
+            yield from split_long_text(tail, max_buffer // 2)
+            buffer, buffered = [], 0
+        elif buffer:
+            yield from sent_tokenize(' '.join(buffer))
+            buffer, buffered = [], 0
+
+    if buffer:
+        yield from sent_tokenize(' '.join(buffer))
+
+def iter_segments(sentences, max_chars=DOCUMENT_SEGMENT_CHARS):
+    """
+    Ardışık cümleleri en fazla max_chars karakterlik bölümlerde birleştirir.
+
+    Args:
+        sentences (iterable): Cümleler
+        max_chars (int): Bir bölümün en fazla karakter sayısı
+
+    Yields:
+        str: Bölüm metni
+    """
+    segment = []
+    length = 0
+    for sentence in sentences:
+        if len(sentence) > max_chars:
+            if segment:
+                yield ' '.join(segment)
+                segment, length = [], 0
+            yield from split_long_text(sentence, max_chars)
+            continue
+        if segment and length + len(sentence) + 1 > max_chars:
+            yield ' '.join(segment)
+            segment, length = [], 0
+        segment.append(sentence)
+        length += len(sentence) + 1
+    if segment:
+        yield ' '.join(segment)
+
+class DocumentAggregate:
+    """Bölüm sonuçlarını metin uzunluğuyla ağırlıklandırarak belge düzeyinde birleştirir."""
+
+    def __init__(self):
+        self.weight = 0
+        self.polarity = 0.0
+        self.subjectivity = 0.0
+        self.emotions = dict.fromkeys(EMOTIONS, 0.0)
+        self.sentiments = Counter()
+        self.languages = Counter()
+        self.segments = 0
+        self.errors = 0
+
+    def add(self, result):
+        """Bir bölümün analiz sonucunu ekler."""
+        self.segments += 1
+        if 'error' in result:
+            self.errors += 1
+            return
+
+        weight = len(result['text'])
+        self.weight += weight
+        self.polarity += result['polarity'] * weight
+        self.subjectivity += result['subjectivity'] * weight
+        for emotion in EMOTIONS:
+            self.emotions[emotion] += result['emotion_scores'][emotion] * weight
+        self.sentiments[result['sentiment']] += 1
+        self.languages[result['language_code']] += weight
+
+    def result(self):
+        """Belge düzeyindeki sonucu döndürür."""
+        weight = self.weight or 1
+        polarity = self.polarity / weight
+        emotion_scores = {emotion: round(score / weight, 2) for emotion, score in self.emotions.items()}
+        language_code = self.languages.most_common(1)[0][0] if self.languages else None
+
+        return {
+            'segments': self.segments,
+            'errors': self.errors,
+            'characters': self.weight,
+            'language_code': language_code,
+            'language_name': SUPPORTED_LANGUAGES.get(language_code),
+            'sentiment': polarity_to_sentiment(polarity),
+            'polarity': polarity,
+            'subjectivity': self.subjectivity / weight,
+            'confidence': round(abs(polarity) * 100, 2),
+            'emotion_scores': emotion_scores,
+            'intensity': calculate_intensity(emotion_scores, polarity),
+            'segment_sentiments': dict(self.sentiments)
+        }
+
+def analyze_document_stream(lines, segment_chars=DOCUMENT_SEGMENT_CHARS, batch_size=DOCUMENT_BATCH_SIZE):
+    """
+    Belgeyi bölüm bölüm analiz eder; her bölümün sonucunu ve en sonda belge sonucunu üretir.
+
+    Args:
+        lines (iterable): Belge satırları (str veya bytes)
+        segment_chars (int): Bir bölümün en fazla karakter sayısı
+        batch_size (int): Aynı anda analiz edilen bölüm sayısı
+
+    Yields:
+        dict: {'type': 'segment', 'index': ..., ...analiz sonucu} kayıtları,
+              en sonda {'type': 'document', ...belge sonucu}
+    """
+    aggregate = DocumentAggregate()
+    index = 0
+    segments = iter_segments(iter_sentences(lines), segment_chars)
+
+    for batch in iter_chunks(segments, batch_size):
+        for result in analyze_sentiment_batch(batch):
+            aggregate.add(result)
+            result.pop('cleaned_text', None)
+            result.update({'type': 'segment', 'index': index})
+            index += 1
+            yield result
+
+    document = aggregate.result()
+    document['type'] = 'document'
+    yield document
+
+def analyze_document(text, segment_chars=DOCUMENT_SEGMENT_CHARS, batch_size=DOCUMENT_BATCH_SIZE):
+    """
+    Belgeyi analiz eder ve tüm sonuçları birlikte döndürür.
+
+    Returns:
+        dict: {'segments': [bölüm sonuçları], 'document': belge sonucu}
+    """
+    results = list(analyze_document_stream(text.splitlines(), segment_chars, batch_size))
+    return {'segments': results[:-1], 'document': results[-1]}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Uzun belgeleri cümle bazında akış halinde analiz eder.')
+    parser.add_argument('input', nargs='?', default='-', help="Belge dosyası ('-' = standart girdi)")
+    parser.add_argument('-o', '--output', default='-', help="Çıktı dosyası ('-' = standart çıktı)")
+    parser.add_argument('--segment-chars', type=int, default=DOCUMENT_SEGMENT_CHARS, help='Bir bölümün en fazla karakter sayısı')
+    parser.add_argument('--batch-size', type=int, default=DOCUMENT_BATCH_SIZE, help='Aynı anda analiz edilen bölüm sayısı')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    try:
+        for line in iter_ndjson(analyze_document_stream(source, args.segment_chars, args.batch_size)):
+            target.write(line)
+            target.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
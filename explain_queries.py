@@ -0,0 +1,118 @@
+"""
+Empathix Sorgu Planı İnceleme Aracı
+
+Bu script, Analysis tablosu üzerindeki sık kullanılan sorguların çalıştırma
+planlarını (EXPLAIN) yazdırır. Tablo büyüdükçe sorguların indeks kullanıp
+kullanmadığını doğrulamak için kullanılır. SQLite ve PostgreSQL desteklenir.
+
+Kullanım:
+    python explain_queries.py                  # empathix.db veya DATABASE_URL
+    python explain_queries.py --analyze        # PostgreSQL'de EXPLAIN ANALYZE
+    python explain_queries.py --user-id 42
+"""
+
+import argparse
+import os
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, select, func, desc
+from models import Analysis
+
+def get_database_url():
+    """Veritabanı bağlantı URL'sini uygulama ile aynı kurallarla belirler."""
+    db_url = os.environ.get('DATABASE_URL')
+    if db_url and db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    return db_url or 'sqlite:///empathix.db'
+
+def get_hot_queries(user_id, days=365):
+    """
+    İncelenecek sorguları döndürür.
+
+    Args:
+        user_id (int): Kullanıcıya özel sorgularda kullanılacak kullanıcı ID'si
+        days (int): Zaman serisi sorgusunun kapsadığı gün sayısı
+
+    Returns:
+        list: (sorgu adı, SQLAlchemy select ifadesi) çiftleri
+    """
+    table = Analysis.__table__
+    c = table.c
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    day = func.date(c.created_at).label('day')
+
+    return [
+        ('history (/history, /profile)',
+         select(table).where(c.user_id == user_id).order_by(c.created_at.desc()).limit(10)),
+        ('profile analysis count',
+         select(func.count(c.id)).where(c.user_id == user_id)),
+        ('user sentiment distribution',
+         select(c.sentiment, func.count(c.id)).where(c.user_id == user_id).group_by(c.sentiment)),
+        ('global sentiment distribution',
+         select(c.sentiment, func.count(c.id)).group_by(c.sentiment)),
+        ('user language distribution',
+         select(c.original_language, func.count(c.id)).where(c.user_id == user_id).group_by(c.original_language)),
+        ('global language distribution',
+         select(c.original_language, func.count(c.id)).group_by(c.original_language)),
+        ('user top languages (get_user_analysis_patterns)',
+         select(c.original_language, func.count(c.id).label('count')).where(c.user_id == user_id)
+         .group_by(c.original_language).order_by(desc('count')).limit(3)),
+        ('user time series',
+         select(day, c.sentiment, func.count(c.id))
+         .where(c.created_at.between(start_date, end_date), c.user_id == user_id)
+         .group_by(day, c.sentiment)),
+        ('global time series',
+         select(day, c.sentiment, func.count(c.id))
+         .where(c.created_at.between(start_date, end_date))
+         .group_by(day, c.sentiment)),
+        ('chart watermark',
+         select(func.max(c.id)).where(c.user_id == user_id)),
+    ]
+
+def explain(conn, statement, analyze=False):
+    """
+    Sorgunun çalıştırma planını satırlar halinde döndürür.
+
+    Args:
+        conn: SQLAlchemy bağlantısı
+        statement: SQLAlchemy select ifadesi
+        analyze (bool): PostgreSQL'de sorguyu gerçekten çalıştırarak ölç (EXPLAIN ANALYZE)
+
+    Returns:
+        tuple: (SQL metni, plan satırları)
+    """
+    compiled = statement.compile(dialect=conn.dialect)
+    sql = str(compiled)
+
+    if conn.dialect.name == 'sqlite':
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql, params).fetchall()
+        plan = [row[-1] for row in rows]
+    else:
+        prefix = 'EXPLAIN (ANALYZE, BUFFERS) ' if analyze else 'EXPLAIN '
+        rows = conn.exec_driver_sql(prefix + sql, compiled.params).fetchall()
+        plan = [row[0] for row in rows]
+
+    return sql, plan
+
+def main():
+    parser = argparse.ArgumentParser(description='Analysis sorgularının çalıştırma planlarını yazdırır.')
+    parser.add_argument('--user-id', type=int, default=1, help='Kullanıcıya özel sorgular için kullanıcı ID')
+    parser.add_argument('--days', type=int, default=365, help='Zaman serisi sorgusunun gün sayısı')
+    parser.add_argument('--analyze', action='store_true', help='PostgreSQL için EXPLAIN ANALYZE kullan')
+    parser.add_argument('--sql', action='store_true', help='Sorgu metinlerini de yazdır')
+    args = parser.parse_args()
+
+    engine = create_engine(get_database_url())
+    with engine.connect() as conn:
+        print(f"Veritabanı: {conn.dialect.name}")
+        for name, statement in get_hot_queries(args.user_id, args.days):
+            sql, plan = explain(conn, statement, args.analyze)
+            print(f"\n== {name} ==")
+            if args.sql:
+                print(sql)
+            for line in plan:
+                print(f"  {line}")
+
+if __name__ == "__main__":
+    main()
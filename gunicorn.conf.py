@@ -0,0 +1,71 @@
+"""
+gunicorn yapılandırması.
+gunicorn, çalışma dizinindeki bu dosyayı otomatik olarak yükler (Procfile: gunicorn wsgi:app).
+
+Uygulama ana süreçte bir kez yüklenir ve ısındırılır (preload_app), ardından
+worker'lar fork edilir. NLTK verileri, TextBlob modelleri ve sözlükler böylece
+her worker'da yeniden yüklenmez. GUNICORN_PRELOAD=0 ile her worker uygulamayı
+kendisi yükler ve başlarken ayrı ayrı ısındırır.
+
+Prometheus metrikleri worker'lar arasında PROMETHEUS_MULTIPROC_DIR dizinindeki
+dosyalar üzerinden birleştirilir. Dizin, uygulama (ve prometheus_client) yüklenmeden
+önce burada ayarlanır.
+"""
+
+import glob
+import os
+import tempfile
+import time
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'empathix-metrics'))
+os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+def on_starting(server):
+    # Önceki çalıştırmalardan kalan metrik dosyalarını temizle. preload_app açıkken ana
+    # süreç uygulamayı bu noktadan önce yüklemiştir; onun dosyaları da silinir, ancak ana
+    # süreç istek karşılamadığından kaybolan bir değer olmaz ve worker'lar kendi pid'leriyle
+    # yeni dosyalar açar
+    for path in glob.glob(os.path.join(PROMETHEUS_MULTIPROC_DIR, '*.db')):
+        os.remove(path)
+
+def log_warm_up(log, label, with_models=True):
+    from warmup import warm_up
+
+    started = time.perf_counter()
+    timings = warm_up(with_models=with_models)
+    details = ', '.join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in timings.items())
+    log.info("%s ısındırma %.0f ms sürdü (%s)", label, (time.perf_counter() - started) * 1000, details)
+
+def when_ready(server):
+    # preload_app açıkken uygulama bu noktada ana süreçte yüklenmiştir; worker'lar henüz fork edilmemiştir
+    if preload_app:
+        log_warm_up(server.log, "Ana süreç", with_models=False)
+
+def post_fork(server, worker):
+    # Ana süreçte açılmış veritabanı bağlantıları worker'lar arasında paylaşılmamalıdır
+    if preload_app:
+        from app import app
+        from models import db
+
+        with app.app_context():
+            db.engine.dispose()
+
+def child_exit(server, worker):
+    # Ölen worker'ın canlı göstergeleri /metrics çıktısından kaldırılır; sayaçları korunur
+    from metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
+
+def post_worker_init(worker):
+    if not preload_app:
+        log_warm_up(worker.log, f"Worker {worker.pid}")
+    else:
+        # Duygu modeli (transformer sağlayıcısında) ve gruplama thread'i her worker'da ayrı yüklenir
+        from sentiment_backends import get_sentiment_backend
+
+        started = time.perf_counter()
+        get_sentiment_backend().warm_up()
+        worker.log.info("Worker %s duygu modeli %.0f ms'de yüklendi", worker.pid, (time.perf_counter() - started) * 1000)
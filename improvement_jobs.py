@@ -0,0 +1,134 @@
+"""
+Metin iyileştirme önerileri için arka plan iş kuyruğu.
+Bu modül, çeviri ve yazım düzeltmesi nedeniyle yavaş olan get_text_improvements
+çağrısını istek döngüsünün dışına, süreç içi bir thread havuzuna taşır. Sonuçlar
+Analysis kaydının improved_text, grammar_corrections ve alternative_expressions
+sütunlarına yazılır; böylece sonuç, isteği hangi worker karşılarsa karşılasın
+veritabanından okunabilir.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from models import db, Analysis
+
+# Aynı anda çalışan iyileştirme işi sayısı ve kuyrukta bekleyebilecek en fazla iş
+IMPROVEMENT_WORKERS = int(os.environ.get('IMPROVEMENT_WORKERS', 2))
+IMPROVEMENT_QUEUE_SIZE = int(os.environ.get('IMPROVEMENT_QUEUE_SIZE', 100))
+
+_executor = None
+_executor_pid = None
+_pending = 0
+_pending_lock = threading.Lock()
+
+def get_executor():
+    """İyileştirme işleri için thread havuzunu döndürür; fork sonrası yeniden oluşturulur."""
+    global _executor, _executor_pid, _pending
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=IMPROVEMENT_WORKERS, thread_name_prefix='improvements')
+        _executor_pid = os.getpid()
+        _pending = 0
+    return _executor
+
+def pending_jobs():
+    """Bu süreçte kuyrukta bekleyen veya çalışan iş sayısını döndürür."""
+    return _pending if _executor_pid == os.getpid() else 0
+
+def save_improvements(analysis_id, improvements):
+    """
+    İyileştirme önerilerini analiz kaydına yazar ve commit eder.
+
+    Args:
+        analysis_id (int): Analiz ID'si
+        improvements (dict): get_text_improvements sonucu
+    """
+    db.session.query(Analysis).filter(Analysis.id == analysis_id).update({
+        Analysis.improved_text: improvements['improved_text']['improved_text'],
+        Analysis.grammar_corrections: json.dumps(improvements['grammar_corrections'], ensure_ascii=False),
+        Analysis.alternative_expressions: json.dumps(improvements['alternative_expressions'], ensure_ascii=False)
+    }, synchronize_session=False)
+    db.session.commit()
+
+def save_improvement_error(analysis_id, error):
+    """İyileştirme işi başarısız olduysa hatayı kaydeder, böylece istemci beklemeyi bırakır."""
+    payload = json.dumps({'error': error}, ensure_ascii=False)
+    db.session.query(Analysis).filter(Analysis.id == analysis_id).update({
+        Analysis.grammar_corrections: payload,
+        Analysis.alternative_expressions: payload
+    }, synchronize_session=False)
+    db.session.commit()
+
+def load_improvements(analysis):
+    """
+    Analiz kaydındaki iyileştirme önerilerini get_text_improvements biçiminde döndürür.
+
+    Args:
+        analysis (Analysis): Analiz kaydı
+
+    Returns:
+        tuple: (durum, öneriler); durum 'pending', 'done' veya 'error' olur
+    """
+    if analysis.grammar_corrections is None:
+        return 'pending', None
+
+    grammar_corrections = json.loads(analysis.grammar_corrections)
+    if 'error' in grammar_corrections:
+        return 'error', None
+
+    improved_text = analysis.improved_text or analysis.text
+    changes_made = improved_text != analysis.text
+    return 'done', {
+        'original_text': analysis.text,
+        'improved_text': {
+            'original_text': analysis.text,
+            'improved_text': improved_text,
+            'changes_made': changes_made,
+            'message': 'Negatif ifadeler daha pozitif alternatiflerle değiştirildi.' if changes_made else ''
+        },
+        'grammar_corrections': grammar_corrections,
+        'alternative_expressions': json.loads(analysis.alternative_expressions)
+    }
+
+def run_improvement_job(app, analysis_id, text, lang_code, sentiment):
+    """İyileştirme önerilerini hesaplar ve analiz kaydına yazar (thread havuzunda çalışır)."""
+    global _pending
+    from text_improver import get_text_improvements
+
+    try:
+        with app.app_context():
+            try:
+                save_improvements(analysis_id, get_text_improvements(text, lang_code, sentiment))
+            except Exception as e:
+                print(f"Metin iyileştirme hatası: {e}")
+                db.session.rollback()
+                save_improvement_error(analysis_id, str(e))
+            finally:
+                db.session.remove()
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+def enqueue_improvements(app, analysis_id, text, lang_code, sentiment):
+    """
+    Analiz için iyileştirme önerilerini arka planda hesaplanmak üzere kuyruğa ekler.
+
+    Args:
+        app: Flask uygulaması (iş kendi uygulama bağlamında çalışır)
+        analysis_id (int): Sonuçların yazılacağı analiz kaydı
+        text (str): Orijinal metin
+        lang_code (str): Metnin dil kodu
+        sentiment (str): Metnin duygu tonu
+
+    Returns:
+        bool: İş kuyruğa eklendiyse True, kuyruk doluysa False
+    """
+    global _pending
+    executor = get_executor()
+    with _pending_lock:
+        if _pending >= IMPROVEMENT_QUEUE_SIZE:
+            return False
+        _pending += 1
+
+    executor.submit(run_improvement_job, app, analysis_id, text, lang_code, sentiment)
+    return True
@@ -0,0 +1,241 @@
+"""
+Prometheus metrikleri için modül.
+Bu modül, route bazında istek süresi histogramlarını, analiz ve çeviri
+sayaçlarını, istek başına veritabanı sorgu sayısını, aşama sürelerini ve süreç
+içi önbelleklerin boyutlarını prometheus_client ile tanımlar ve /metrics
+çıktısını üretir.
+
+gunicorn altında her worker ayrı bir süreç olduğundan metrikler
+PROMETHEUS_MULTIPROC_DIR dizinindeki dosyalarda tutulur ve /metrics isteğini
+hangi worker karşılarsa karşılasın tüm worker'ların toplamı döner (dizin
+gunicorn.conf.py içinde ayarlanır). Değişken tanımlı değilse (python app.py)
+metrikler yalnızca süreç içinde tutulur.
+
+prometheus_client kurulu değilse metrikler hiçbir şey yapmayan nesnelerle
+tanımlanır ve /metrics devre dışı kalır; uygulama metrik olmadan çalışmaya devam eder.
+"""
+
+import contextvars
+import os
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    from prometheus_client import (CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+                                   CONTENT_TYPE_LATEST, generate_latest, multiprocess)
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+    class _NoopMetric:
+        """prometheus_client yokken kullanılan, hiçbir şey kaydetmeyen metrik."""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, amount=1):
+            pass
+
+        def set(self, value):
+            pass
+
+        def observe(self, value):
+            pass
+
+    Counter = Gauge = Histogram = _NoopMetric
+
+# Süreç içi önbellek ve devre kesici göstergelerinin en sık güncellenme aralığı (saniye)
+METRICS_GAUGE_INTERVAL = float(os.environ.get('METRICS_GAUGE_INTERVAL', 5))
+# Tanımlanırsa /metrics yalnızca "Authorization: Bearer <token>" başlığıyla okunabilir
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+REQUEST_LATENCY = Histogram(
+    'empathix_http_request_duration_seconds', 'HTTP istek süresi',
+    ['method', 'endpoint'], buckets=REQUEST_BUCKETS
+)
+REQUESTS = Counter(
+    'empathix_http_requests_total', 'HTTP istek sayısı',
+    ['method', 'endpoint', 'status']
+)
+ANALYSES = Counter(
+    'empathix_analyses_total', 'Analiz edilen metin sayısı',
+    ['language', 'sentiment']
+)
+STAGE_LATENCY = Histogram(
+    'empathix_stage_duration_seconds', 'Analiz aşaması süresi (izlenen isteklerde)',
+    ['endpoint', 'stage'], buckets=REQUEST_BUCKETS
+)
+TRANSLATIONS = Counter(
+    'empathix_translation_requests_total', 'Çeviri istekleri',
+    ['backend', 'outcome']
+)
+TRANSLATION_LATENCY = Histogram(
+    'empathix_translation_duration_seconds', 'Çeviri sağlayıcısı çağrı süresi',
+    ['backend'], buckets=REQUEST_BUCKETS
+)
+SENTIMENT_BATCH_SIZE = Histogram(
+    'empathix_sentiment_batch_size', 'Duygu modelinin tek ileri geçişte puanladığı metin sayısı',
+    ['backend'], buckets=BATCH_SIZE_BUCKETS
+)
+SENTIMENT_BATCH_LATENCY = Histogram(
+    'empathix_sentiment_batch_duration_seconds', 'Duygu modeli grup çıkarım süresi',
+    ['backend'], buckets=REQUEST_BUCKETS
+)
+DB_QUERIES = Histogram(
+    'empathix_db_queries_per_request', 'İstek başına veritabanı sorgu sayısı',
+    ['endpoint'], buckets=QUERY_COUNT_BUCKETS
+)
+
+# Göstergeler worker başına tutulur (pid etiketiyle); ölen worker'ların değerleri çıktıdan düşer
+CACHE_ENTRIES = Gauge(
+    'empathix_cache_entries', 'Süreç içi önbellekteki kayıt sayısı',
+    ['cache'], multiprocess_mode='liveall'
+)
+CACHE_HIT_RATIO = Gauge(
+    'empathix_cache_hit_ratio', 'Süreç içi önbellek isabet oranı',
+    ['cache'], multiprocess_mode='liveall'
+)
+BREAKER_STATE = Gauge(
+    'empathix_translation_breaker_state', 'Çeviri devre kesicisinin durumu (geçerli durum 1)',
+    ['state'], multiprocess_mode='liveall'
+)
+BREAKER_FAILURE_RATE = Gauge(
+    'empathix_translation_breaker_failure_rate', 'Devre kesici penceresindeki kötü çağrı oranı',
+    multiprocess_mode='liveall'
+)
+IMPROVEMENT_QUEUE = Gauge(
+    'empathix_improvement_jobs_pending', 'Kuyrukta bekleyen veya çalışan metin iyileştirme işi',
+    multiprocess_mode='livesum'
+)
+
+# Geçerli isteğin veritabanı sorgu sayacı; istek dışında (arka plan işleri) None'dır
+_query_count = contextvars.ContextVar('db_query_count', default=None)
+_gauges_updated_at = 0.0
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+def start_request():
+    """İstek başında süre ölçümünü ve sorgu sayacını başlatır."""
+    _query_count.set([0])
+    return time.perf_counter()
+
+def observe_request(method, endpoint, status, started, trace=None):
+    """
+    İstek sonunda süreyi, sorgu sayısını ve (izlenmişse) aşama sürelerini kaydeder.
+
+    Args:
+        method (str): HTTP metodu
+        endpoint (str): Flask endpoint adı
+        status (int): Yanıt durum kodu
+        started (float): start_request ile alınan başlangıç zamanı
+        trace (Trace, optional): İsteğin aşama süreleri
+    """
+    REQUEST_LATENCY.labels(method, endpoint).observe(time.perf_counter() - started)
+    REQUESTS.labels(method, endpoint, str(status)).inc()
+
+    counter = _query_count.get()
+    if counter is not None:
+        DB_QUERIES.labels(endpoint).observe(counter[0])
+        _query_count.set(None)
+
+    if trace is not None:
+        for stage, seconds in trace.stages.items():
+            STAGE_LATENCY.labels(endpoint, stage).observe(seconds)
+
+    update_gauges()
+
+def observe_analysis(language, sentiment):
+    """Analiz edilen bir metni sayar."""
+    ANALYSES.labels(language, sentiment).inc()
+
+def observe_translation(backend, outcome, seconds=None):
+    """
+    Çeviri isteğini sayar.
+
+    Args:
+        backend (str): Çeviri sağlayıcısının adı
+        outcome (str): 'success', 'error', 'cache_hit' veya 'rejected'
+        seconds (float, optional): Sağlayıcı çağrısının süresi
+    """
+    TRANSLATIONS.labels(backend, outcome).inc()
+    if seconds is not None:
+        TRANSLATION_LATENCY.labels(backend).observe(seconds)
+
+def observe_sentiment_batch(backend, size, seconds):
+    """Duygu modelinin bir grup çıkarımını kaydeder."""
+    SENTIMENT_BATCH_SIZE.labels(backend).observe(size)
+    SENTIMENT_BATCH_LATENCY.labels(backend).observe(seconds)
+
+def set_cache_gauges(name, stats, size):
+    CACHE_ENTRIES.labels(name).set(size)
+    lookups = stats['hits'] + stats['misses']
+    CACHE_HIT_RATIO.labels(name).set(stats['hits'] / lookups if lookups else 0.0)
+
+def update_gauges(force=False):
+    """Önbellek, devre kesici ve iş kuyruğu göstergelerini en fazla METRICS_GAUGE_INTERVAL'de bir günceller."""
+    global _gauges_updated_at
+    now = time.monotonic()
+    if not METRICS_AVAILABLE or (not force and now - _gauges_updated_at < METRICS_GAUGE_INTERVAL):
+        return
+    _gauges_updated_at = now
+
+    from circuit_breaker import CLOSED, OPEN, HALF_OPEN
+    from translation import get_translation_metrics, translation_cache
+    from sentiment_analyzer import language_cache, result_cache
+    from stats import chart_cache
+    from improvement_jobs import pending_jobs
+    import spell_checker
+
+    translation_metrics = get_translation_metrics()
+    breaker = translation_metrics['breaker']
+    for state in (CLOSED, OPEN, HALF_OPEN):
+        BREAKER_STATE.labels(state).set(1 if breaker['state'] == state else 0)
+    BREAKER_FAILURE_RATE.set(breaker['window_failure_rate'])
+
+    set_cache_gauges('translation', translation_metrics['cache'], len(translation_cache.memory))
+    set_cache_gauges('language', language_cache.stats(), len(language_cache))
+    set_cache_gauges('result', result_cache.stats(), len(result_cache.memory))
+    set_cache_gauges('chart', chart_cache.stats(), len(chart_cache))
+    # Yazım düzeltici yalnızca yüklenmişse raporlanır; metrik için dizin oluşturulmaz
+    if spell_checker._spell_checker is not None:
+        cache = spell_checker._spell_checker.cache
+        set_cache_gauges('spelling', cache.stats(), len(cache))
+
+    IMPROVEMENT_QUEUE.set(pending_jobs())
+
+def render_metrics():
+    """
+    /metrics çıktısını üretir; çok süreçli modda tüm worker'ların değerleri birleştirilir.
+
+    Returns:
+        tuple: (çıktı, içerik türü)
+
+    Raises:
+        RuntimeError: prometheus_client kurulu değilse
+    """
+    if not METRICS_AVAILABLE:
+        raise RuntimeError("prometheus_client kurulu değil, metrikler devre dışı.")
+    update_gauges(force=True)
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+def mark_process_dead(pid):
+    """Ölen worker'ın canlı göstergelerini (liveall, livesum) çıktıdan kaldırır."""
+    if METRICS_AVAILABLE and os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
@@ -94,6 +94,108 @@ def add_column_if_not_exists(table_name, column_name, column_type):
     
     return True
 
+def execute_sql(statements):
+    """
+    SQL ifadelerini sırayla tek bir işlem içinde çalıştırır.
+    
+    Args:
+        statements (list): Çalıştırılacak SQL ifadeleri
+    """
+    try:
+        if is_postgres_db():
+            # PostgreSQL için
+            conn = get_db_connection()
+            with conn.begin():
+                for statement in statements:
+                    conn.execute(text(statement))
+            conn.close()
+        else:
+            # SQLite için
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            conn.commit()
+            conn.close()
+            
+    except Exception as e:
+        print(f"Hata: {e}")
+        return False
+    
+    return True
+
+def add_unique_stats_index(table_name, column_name, average_columns=()):
+    """
+    İstatistik tablosundaki tekrar eden satırları birleştirir ve anahtar sütuna benzersiz indeks ekler.
+    Benzersiz indeks, sayaçların eşzamanlı worker'lar tarafından atomik olarak güncellenmesi için gereklidir.
+    İndeks adı models.py'deki tanımla aynıdır.
+    
+    Args:
+        table_name (str): Tablo adı
+        column_name (str): Benzersiz olacak sütun adı
+        average_columns (tuple): Birleştirilirken sayıyla ağırlıklı ortalaması alınacak sütunlar
+    """
+    group = f"FROM {table_name} t2 WHERE t2.{column_name} = {table_name}.{column_name}"
+    # Ortalamalar birleştirilen satırların sayılarıyla ağırlıklandırılır; SET ifadeleri eski değerleri görür
+    averages = ''.join(
+        f""",
+                {column} = (
+                    SELECT SUM(COALESCE(t2.{column}, 0.0) * COALESCE(t2.count, 0)) / NULLIF(SUM(COALESCE(t2.count, 0)), 0)
+                    {group}
+                )"""
+        for column in average_columns
+    )
+    statements = [
+        # Tekrar eden satırların sayılarını en küçük ID'li satırda topla
+        f"""
+            UPDATE {table_name} SET
+                count = (SELECT SUM(t2.count) {group}){averages}
+            WHERE id IN (
+                SELECT MIN(id) FROM {table_name} GROUP BY {column_name} HAVING COUNT(*) > 1
+            )
+        """,
+        # Fazla satırları sil
+        f"""
+            DELETE FROM {table_name} WHERE id NOT IN (
+                SELECT MIN(id) FROM {table_name} GROUP BY {column_name}
+            )
+        """,
+        f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{table_name}_{column_name} ON {table_name} ({column_name})"
+    ]
+    
+    if execute_sql(statements):
+        print(f"'{table_name}.{column_name}' için benzersiz indeks hazır.")
+
+def create_index_if_not_exists(index_name, table_name, columns):
+    """
+    Belirtilen tabloya, belirtilen indeksi ekler (eğer yoksa).
+    PostgreSQL'de tabloyu kilitlememek için indeks CONCURRENTLY ile oluşturulur.
+    
+    Args:
+        index_name (str): İndeks adı
+        table_name (str): Tablo adı
+        columns (str): İndeks sütunları (örn. "user_id, created_at DESC")
+    """
+    try:
+        if is_postgres_db():
+            # PostgreSQL için: CONCURRENTLY bir işlem bloğu içinde çalışamaz
+            conn = get_db_connection().execution_options(isolation_level="AUTOCOMMIT")
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name} ({columns})"))
+            conn.close()
+        else:
+            # SQLite için
+            conn = get_db_connection()
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})")
+            conn.commit()
+            conn.close()
+        print(f"'{index_name}' indeksi hazır.")
+            
+    except Exception as e:
+        print(f"Hata: {e}")
+        return False
+    
+    return True
+
 def update_database():
     """Veritabanı şemasını günceller."""
     print("Empathix Veritabanı Güncelleme Aracı")
@@ -114,6 +216,19 @@ def update_database():
     column_type = "INTEGER" if is_postgres_db() else "INTEGER"
     add_column_if_not_exists("text_suggestion_feedback", "user_id", column_type)
     
+    # İstatistik tablolarına benzersiz indeksler ekle
+    print("İstatistik tablolarına benzersiz indeksler ekleniyor...")
+    add_unique_stats_index("language_stats", "language_code")
+    add_unique_stats_index("sentiment_stats", "sentiment")
+    add_unique_stats_index("emotion_stats", "emotion", average_columns=("average_intensity",))
+    
+    # Analysis tablosuna sık kullanılan sorgular için bileşik indeksler ekle
+    print("Analysis tablosuna bileşik indeksler ekleniyor...")
+    create_index_if_not_exists("ix_analysis_user_id_created_at", "analysis", "user_id, created_at DESC")
+    create_index_if_not_exists("ix_analysis_created_at_sentiment", "analysis", "created_at, sentiment")
+    create_index_if_not_exists("ix_analysis_user_id_sentiment", "analysis", "user_id, sentiment")
+    create_index_if_not_exists("ix_analysis_user_id_original_language", "analysis", "user_id, original_language")
+    
     print("\nVeritabanı güncelleme işlemi tamamlandı!")
 
 if __name__ == "__main__":
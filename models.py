@@ -53,6 +53,14 @@ class Analysis(db.Model):
     grammar_corrections = db.Column(db.Text)  # Dilbilgisi düzeltmeleri (JSON formatında)
     alternative_expressions = db.Column(db.Text)  # Alternatif ifadeler (JSON formatında)
     
+    # Sık kullanılan sorgular için bileşik indeksler (/history, /profile, istatistik grafikleri)
+    __table_args__ = (
+        db.Index('ix_analysis_user_id_created_at', user_id, created_at.desc()),
+        db.Index('ix_analysis_created_at_sentiment', 'created_at', 'sentiment'),
+        db.Index('ix_analysis_user_id_sentiment', 'user_id', 'sentiment'),
+        db.Index('ix_analysis_user_id_original_language', 'user_id', 'original_language'),
+    )
+    
     def __repr__(self):
         return f'<Analysis {self.id}>'
     
@@ -78,6 +86,11 @@ class LanguageStats(db.Model):
     language_name = db.Column(db.String(50), nullable=False)
     count = db.Column(db.Integer, default=0)
     
+    # migrate_db.py ile aynı isimli benzersiz indeks; sayaçların atomik güncellenmesi için gereklidir
+    __table_args__ = (
+        db.Index('uq_language_stats_language_code', 'language_code', unique=True),
+    )
+    
     def __repr__(self):
         return f'<LanguageStats {self.language_name}>'
 
@@ -86,6 +99,10 @@ class SentimentStats(db.Model):
     sentiment = db.Column(db.String(20), nullable=False)
     count = db.Column(db.Integer, default=0)
     
+    __table_args__ = (
+        db.Index('uq_sentiment_stats_sentiment', 'sentiment', unique=True),
+    )
+    
     def __repr__(self):
         return f'<SentimentStats {self.sentiment}>'
 
@@ -96,6 +113,10 @@ class EmotionStats(db.Model):
     count = db.Column(db.Integer, default=0)
     average_intensity = db.Column(db.Float, default=0.0)  # Ortalama yoğunluk
     
+    __table_args__ = (
+        db.Index('uq_emotion_stats_emotion', 'emotion', unique=True),
+    )
+    
     def __repr__(self):
         return f'<EmotionStats {self.emotion}>'
 
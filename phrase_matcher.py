@@ -0,0 +1,123 @@
+"""
+Kelime ve çok kelimeli ifade eşleştirme için modül.
+Bu modül, anahtar kelime listelerini bir kez derleyerek kelimeden değerlere
+sözlük ve çok kelimeli ifadeler için bir önek ağacı (trie) oluşturur. Böylece
+bir kelime dizisindeki tüm eşleşmeler tek bir doğrusal geçişte bulunur.
+"""
+
+# Önek ağacında ifadenin bittiği düğümü işaretleyen anahtar
+_END = None
+
+class PhraseMatcher:
+    """
+    Kelime dizileri üzerinde tek ve çok kelimeli ifadeleri eşleştirir.
+    Her ifade bir veya daha fazla değerle (örn. duygu kategorisi) ilişkilendirilir.
+    """
+
+    def __init__(self):
+        self.words = {}
+        self.trie = {}
+        self.max_phrase_length = 1
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """
+        {değer: [ifade, ...]} biçimindeki sözlükten eşleştirici oluşturur.
+
+        Args:
+            mapping (dict): Değerlerden ifade listelerine sözlük
+
+        Returns:
+            PhraseMatcher: Derlenmiş eşleştirici
+        """
+        matcher = cls()
+        for value, phrases in mapping.items():
+            for phrase in phrases:
+                matcher.add(phrase, value)
+        return matcher
+
+    def add(self, phrase, value):
+        """İfadeyi verilen değerle eşleştirilecek şekilde ekler."""
+        tokens = phrase.lower().split()
+        if not tokens:
+            return
+
+        if len(tokens) == 1:
+            values = self.words.setdefault(tokens[0], [])
+        else:
+            node = self.trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            values = node.setdefault(_END, [])
+            self.max_phrase_length = max(self.max_phrase_length, len(tokens))
+
+        if value not in values:
+            values.append(value)
+
+    def find(self, tokens):
+        """
+        Kelime dizisindeki tüm eşleşmeleri sırayla üretir.
+        Aynı konumdan başlayan iç içe ifadelerin (örn. 'hayal kırıklığı' ve
+        'hayal kırıklığına uğramış') her biri ayrı eşleşme olarak döner.
+
+        Args:
+            tokens (list): Küçük harfe çevrilmiş kelimeler
+
+        Yields:
+            tuple: (başlangıç konumu, ifade, değer listesi)
+        """
+        length = len(tokens)
+        for i, token in enumerate(tokens):
+            values = self.words.get(token)
+            if values:
+                yield i, token, values
+
+            node = self.trie.get(token)
+            j = i + 1
+            while node is not None:
+                if _END in node:
+                    yield i, ' '.join(tokens[i:j]), node[_END]
+                if j >= length:
+                    break
+                node = node.get(tokens[j])
+                j += 1
+
+    def find_longest(self, tokens):
+        """
+        Kelime dizisindeki çakışmayan en uzun eşleşmeleri soldan sağa üretir.
+        Örneğin 'hayal kırıklığı' eşleştiğinde 'hayal' ve 'kırıklığı' ayrıca
+        eşleştirilmez; değiştirme işlemlerinde kullanılır.
+
+        Args:
+            tokens (list): Küçük harfe çevrilmiş kelimeler
+
+        Yields:
+            tuple: (başlangıç konumu, bitiş konumu, ifade, değer listesi)
+        """
+        words = self.words
+        trie = self.trie
+        length = len(tokens)
+        i = 0
+        while i < length:
+            token = tokens[i]
+            values = words.get(token)
+            node = trie.get(token)
+            if values is None and node is None:
+                i += 1
+                continue
+
+            end = i + 1 if values else None
+            j = i + 1
+            while node is not None:
+                if _END in node:
+                    end, values = j, node[_END]
+                if j >= length:
+                    break
+                node = node.get(tokens[j])
+                j += 1
+
+            if end is None:
+                i += 1
+                continue
+            yield i, end, ' '.join(tokens[i:end]), values
+            i = end
@@ -1,21 +1,69 @@
-from textblob import TextBlob
-from langdetect import detect, LangDetectException
-from deep_translator import GoogleTranslator
+from langdetect import detect, DetectorFactory, LangDetectException
+from translation import translate_text, translate_many, TranslationUnavailableError
+from phrase_matcher import PhraseMatcher
+from cache import LRUCache, create_cache, make_key
+from tracing import span
+from sentiment_backends import get_sentiment_backend
+from metrics import observe_analysis
+import copy
+import hashlib
+import os
 import re
 import json
-import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
+from warmup import ensure_nltk_data
 
 # NLTK gerekli kaynakları indir
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+ensure_nltk_data()
+
+# langdetect olasılıksal çalışır; sabit tohum aynı metin için her zaman aynı sonucu verir
+DetectorFactory.seed = 0
+
+# Dil tespiti önbelleği ayarları
+LANGUAGE_CACHE_SIZE = int(os.environ.get('LANGUAGE_CACHE_SIZE', 10000))
+language_cache = LRUCache(maxsize=LANGUAGE_CACHE_SIZE)
+
+# Analiz sonucu önbelleği ayarları
+RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 10000))
+RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 24 * 3600))
+# Tanımlanırsa sonuçlar bu SQLite dosyasında da tutulur ve tüm worker'lar arasında paylaşılır
+RESULT_CACHE_PATH = os.environ.get('RESULT_CACHE_PATH')
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 100000))
+
+# Analiz algoritması değiştiğinde artırılır; eski önbellek kayıtları böylece kullanılmaz.
+# Sözlüklerdeki değişiklikler PIPELINE_FINGERPRINT ile anahtara otomatik yansır.
+PIPELINE_VERSION = 1
+
+result_cache = create_cache(
+    maxsize=RESULT_CACHE_SIZE,
+    ttl=RESULT_CACHE_TTL,
+    path=RESULT_CACHE_PATH,
+    table='result_cache',
+    max_entries=RESULT_CACHE_MAX_ENTRIES
+)
+
+# Duygu analizinde çıkarılan durdurma kelimeleri (her çağrıda diskten okunmaması için bir kez yüklenir)
+ENGLISH_STOPWORDS = frozenset(stopwords.words('english'))
+
+# Diğer desteklenen Latin alfabeli dillerde (es, fr, de, it, pt) kelime olarak geçmeyen
+# İngilizce durdurma kelimeleri ('a', 'no', 'in', 'was' gibi ortak kelimeler hariç)
+ENGLISH_MARKER_WORDS = frozenset([
+    'the', 'and', 'is', 'are', 'were', 'be', 'been', 'this', 'that', 'these', 'those', 'with',
+    'have', 'has', 'had', 'it', "it's", 'its', 'of', 'to', 'for', 'from', 'you', 'your', 'my',
+    'we', 'our', 'they', 'their', 'he', 'she', 'his', 'her', 'not', "don't", "didn't", 'but',
+    'what', 'which', 'would', 'could', 'should', 'very', 'at', 'by', 'just', 'about', 'there'
+])
+
+# Yalnızca Türkçe'de bulunan harfler
+TURKISH_CHARACTERS = frozenset('şğıŞĞİ')
+
+# Tam dil tespiti yapılmadan İngilizce kabul edilmesi için ASCII metindeki en az
+# İngilizce durdurma kelimesi sayısı ve oranı
+ENGLISH_MIN_STOPWORDS = 2
+ENGLISH_MIN_STOPWORD_RATIO = 0.2
+
+ASCII_WORD_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
 
 # Duygu kategorileri için anahtar kelimeler
 EMOTION_KEYWORDS = {
@@ -41,6 +89,49 @@ EMOTION_KEYWORDS = {
     ]
 }
 
+# Anahtar kelimeleri import sırasında bir kez derle: kelimeden duygulara sözlük
+# ve 'kalbi kırık' gibi çok kelimeli ifadeler için önek ağacı
+EMOTION_LEXICON = PhraseMatcher.from_mapping(EMOTION_KEYWORDS)
+
+# Çeviri servisine ulaşılamadığında orijinal metni puanlamak için kullanılan yerel
+# polarite sözlükleri: {dil kodu: {polarite: [ifade, ...]}}
+LOCAL_POLARITY_KEYWORDS = {
+    'tr': {
+        1.0: ['mükemmel', 'harika', 'muhteşem', 'bayıldım', 'kusursuz', 'şahane'],
+        0.7: [
+            'iyi', 'güzel', 'mutlu', 'memnun', 'memnunum', 'sevdim', 'seviyorum', 'beğendim', 'başarılı',
+            'teşekkür', 'teşekkürler', 'tavsiye ederim', 'süper', 'keyifli', 'hoşnut', 'sevinç'
+        ],
+        0.4: ['hoş', 'fena değil', 'idare eder', 'hızlı', 'kolay', 'uygun'],
+        -0.4: ['yavaş', 'pahalı', 'zor', 'eksik', 'sorun', 'problem', 'gecikme', 'geç'],
+        -0.7: [
+            'kötü', 'mutsuz', 'üzgün', 'kızgın', 'sinirli', 'öfkeli', 'beğenmedim', 'sevmedim',
+            'şikayet', 'hayal kırıklığı', 'bozuk', 'hatalı'
+        ],
+        -1.0: ['berbat', 'rezalet', 'korkunç', 'nefret', 'iğrenç', 'felaket', 'asla tavsiye etmem']
+    }
+}
+
+LOCAL_POLARITY_LEXICONS = {
+    lang_code: PhraseMatcher.from_mapping(keywords)
+    for lang_code, keywords in LOCAL_POLARITY_KEYWORDS.items()
+}
+
+# Kendinden önceki ifadenin polaritesini tersine çeviren olumsuzluk kelimeleri
+LOCAL_NEGATIONS = {'tr': {'değil', 'değilim', 'değiliz', 'değildi', 'değildir'}}
+
+# Yerel sözlük puanları TextBlob ile aynı ölçekte olduğundan aynı nötr eşiği kullanılır
+LOCAL_LEXICON_NEUTRAL_THRESHOLD = 0.05
+
+# Analiz sonucunu etkileyen sözlüklerin özeti (sonuç önbelleği anahtarının parçası)
+PIPELINE_FINGERPRINT = hashlib.sha256(json.dumps([
+    EMOTION_KEYWORDS,
+    {lang_code: {str(score): phrases for score, phrases in keywords.items()}
+     for lang_code, keywords in LOCAL_POLARITY_KEYWORDS.items()},
+    {lang_code: sorted(words) for lang_code, words in LOCAL_NEGATIONS.items()},
+    sorted(ENGLISH_MARKER_WORDS)
+], sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
 # Desteklenen diller ve kodları
 SUPPORTED_LANGUAGES = {
     'en': 'İngilizce',
@@ -57,33 +148,72 @@ SUPPORTED_LANGUAGES = {
     'ko': 'Korece'
 }
 
-def detect_language(text):
-    """Metnin dilini tespit eder."""
+def guess_language(text):
+    """
+    Tam dil tespitine gerek kalmadan dili belirlenebilen metinler için hızlı kontroller.
+    Türkçe'ye özgü harf içeren metinler Türkçe, yeterince İngilizce durdurma kelimesi
+    içeren ASCII metinler İngilizce kabul edilir.
+    
+    Returns:
+        str: Dil kodu veya emin olunamıyorsa None
+    """
+    if not TURKISH_CHARACTERS.isdisjoint(text):
+        return 'tr'
+    
+    if text.isascii():
+        words = ASCII_WORD_PATTERN.findall(text.lower())
+        stopword_count = sum(1 for word in words if word in ENGLISH_MARKER_WORDS)
+        if stopword_count >= ENGLISH_MIN_STOPWORDS and stopword_count >= len(words) * ENGLISH_MIN_STOPWORD_RATIO:
+            return 'en'
+    
+    return None
+
+def detect_language_code(text):
+    """langdetect ile metnin dil kodunu bulur; tespit edilemezse None döndürür."""
     try:
         lang_code = detect(text)
-        # Bazı dil kodlarını düzeltme
-        if lang_code == 'zh-cn' or lang_code == 'zh-tw' or lang_code == 'zh':
-            lang_code = 'zh-cn'
-        
-        # Desteklenen diller listesinde varsa o dili döndür, yoksa 'en' (İngilizce) döndür
-        if lang_code in SUPPORTED_LANGUAGES:
-            return lang_code, SUPPORTED_LANGUAGES[lang_code]
-        return 'en', 'İngilizce (Varsayılan)'
     except LangDetectException:
-        return 'en', 'İngilizce (Varsayılan)'
+        return None
+    # Bazı dil kodlarını düzeltme
+    if lang_code == 'zh-cn' or lang_code == 'zh-tw' or lang_code == 'zh':
+        lang_code = 'zh-cn'
+    return lang_code
 
-def translate_to_english(text, source_lang='auto'):
-    """Metni İngilizce'ye çevirir."""
+def detect_language(text):
+    """
+    Metnin dilini tespit eder.
+    Sonuçlar metnin özetiyle önbelleğe alınır; hızlı kontrollerle belirlenemeyen
+    metinler için tam dil tespiti yapılır.
+    """
+    key = make_key('language', text)
+    lang_code = language_cache.get(key)
+    if lang_code is None:
+        lang_code = guess_language(text) or detect_language_code(text) or ''
+        language_cache.set(key, lang_code)
+    
+    # Desteklenen diller listesinde varsa o dili döndür, yoksa 'en' (İngilizce) döndür
+    if lang_code in SUPPORTED_LANGUAGES:
+        return lang_code, SUPPORTED_LANGUAGES[lang_code]
+    return 'en', 'İngilizce (Varsayılan)'
+
+def try_translate_to_english(text, source_lang='auto'):
+    """Metni İngilizce'ye çevirir; çeviri yapılamazsa None döndürür."""
     try:
         if source_lang == 'en':
             return text  # Zaten İngilizce ise çevirme
         
-        translator = GoogleTranslator(source=source_lang, target='en')
-        translated_text = translator.translate(text)
-        return translated_text
+        # Aynı ifadeler önbellekten döner, yalnızca yeni metinler çevrilir; boş çeviri hata sayılır
+        return translate_text(text, source_lang, 'en') or None
+    except TranslationUnavailableError:
+        return None  # Devre açık: servis beklenmez
     except Exception as e:
         print(f"Çeviri hatası: {e}")
-        return text  # Hata durumunda orijinal metni döndür
+        return None
+
+def translate_to_english(text, source_lang='auto'):
+    """Metni İngilizce'ye çevirir; hata durumunda orijinal metni döndürür."""
+    en_text = try_translate_to_english(text, source_lang)
+    return text if en_text is None else en_text
 
 def clean_text(text):
     """Metni temizler ve analize hazırlar."""
@@ -95,23 +225,105 @@ def clean_text(text):
     text = re.sub(r'\s+', ' ', text).strip()
     return text
 
-def analyze_detailed_emotions(text, lang_code):
+def score_with_local_lexicon(tokens, lang_code):
     """
-    Metindeki detaylı duygu kategorilerini analiz eder.
-    Her bir duygu kategorisi için 0-1 arasında bir skor döndürür.
+    Çeviri yapılamadığında orijinal metni dile özel yerel sözlükle puanlar.
+    
+    Args:
+        tokens (list): Orijinal metnin küçük harfe çevrilmiş kelimeleri
+        lang_code (str): Metnin dil kodu
+        
+    Returns:
+        tuple: (polarite, öznellik) veya dil için sözlük yoksa ya da eşleşme bulunmazsa None
     """
-    # Metni İngilizce'ye çevir (eğer İngilizce değilse)
-    if lang_code != 'en':
-        en_text = translate_to_english(text, lang_code)
-    else:
-        en_text = text
+    lexicon = LOCAL_POLARITY_LEXICONS.get(lang_code)
+    if lexicon is None:
+        return None
+    
+    negations = LOCAL_NEGATIONS.get(lang_code, set())
+    scores = []
+    for position, phrase, values in lexicon.find(tokens):
+        score = sum(values) / len(values)
+        end = position + len(phrase.split())
+        if end < len(tokens) and tokens[end] in negations:
+            score = -score
+        scores.append(score)
+    
+    if not scores:
+        return None
+    
+    polarity = max(-1.0, min(1.0, sum(scores) / len(scores)))
+    subjectivity = min(1.0, 0.5 + 0.1 * len(scores))
+    return polarity, subjectivity
+
+def build_analysis_context(text, lang_code, en_text=None, scores=None, translation_failed=False):
+    """
+    Bir istek boyunca tüm analiz aşamalarının paylaştığı bağlamı oluşturur.
+    Çeviri, kelimelere ayırma ve duygu puanlaması metin başına yalnızca bir kez yapılır.
+    
+    Args:
+        text (str): Temizlenmiş metin
+        lang_code (str): Metnin dil kodu
+        en_text (str, optional): Önceden çevrilmiş İngilizce metin (toplu analizde)
+        scores (tuple, optional): Önceden hesaplanmış (polarite, öznellik) (toplu analizde)
+        translation_failed (bool): Önceden yapılan çeviri başarısız olduysa True (toplu analizde)
+        
+    Returns:
+        dict: İngilizce metin, kelimeler, polarite/öznellik değerleri ve çeviri durumu
+    
+    Çeviri yapılamadıysa (servis hatası veya açık devre kesici) orijinal metin
+    puanlanır; dil için yerel sözlük varsa polarite bu sözlükten hesaplanır.
+    """
+    # Metni İngilizce'ye çevir (eğer İngilizce değilse ve önceden çevrilmediyse)
+    if en_text is None:
+        if lang_code != 'en':
+            with span('translate'):
+                en_text = try_translate_to_english(text, lang_code)
+            if en_text is None:
+                en_text, translation_failed = text, True
+        else:
+            en_text = text
     
     # Metni küçük harfe çevir ve kelimelere ayır
-    words = word_tokenize(en_text.lower())
+    with span('tokenize'):
+        tokens = word_tokenize(en_text.lower())
+    
+    with span('polarity'):
+        local_scores = None
+        if translation_failed:
+            local_scores = score_with_local_lexicon(tokens, lang_code)
+        
+        if local_scores is not None:
+            polarity, subjectivity = local_scores
+            neutral_threshold = LOCAL_LEXICON_NEUTRAL_THRESHOLD
+        else:
+            # Yapılandırılmış sağlayıcıyla (varsayılan: TextBlob) duygu puanlarını hesapla
+            backend = get_sentiment_backend()
+            polarity, subjectivity = scores or backend.score(en_text)
+            neutral_threshold = backend.neutral_threshold
+    
+    return {
+        'text': text,
+        'lang_code': lang_code,
+        'en_text': en_text,
+        'tokens': tokens,
+        'polarity': polarity,
+        'subjectivity': subjectivity,
+        'neutral_threshold': neutral_threshold,
+        'translation_failed': translation_failed
+    }
+
+def analyze_detailed_emotions(text, lang_code, context=None):
+    """
+    Metindeki detaylı duygu kategorilerini analiz eder.
+    Her bir duygu kategorisi için 0-1 arasında bir skor döndürür.
+    Verilen analiz bağlamı (context) varsa çeviri ve kelimelere ayırma tekrarlanmaz.
+    """
+    if context is None:
+        context = build_analysis_context(text, lang_code)
     
     # Durdurma kelimelerini kaldır
-    stop_words = set(stopwords.words('english'))
-    words = [word for word in words if word not in stop_words]
+    words = [word for word in context['tokens'] if word not in ENGLISH_STOPWORDS]
     
     # Her duygu kategorisi için skor hesapla
     emotion_scores = {
@@ -122,11 +334,10 @@ def analyze_detailed_emotions(text, lang_code):
         'surprise': 0.0
     }
     
-    # Metindeki her kelime için duygu kategorilerini kontrol et
-    for word in words:
-        for emotion, keywords in EMOTION_KEYWORDS.items():
-            if word in keywords:
-                emotion_scores[emotion] += 1
+    # Metindeki kelime ve ifadeleri derlenmiş sözlükle tek geçişte eşleştir
+    for position, phrase, emotions in EMOTION_LEXICON.find(words):
+        for emotion in emotions:
+            emotion_scores[emotion] += 1
     
     # Skorları normalize et (0-1 arasında)
     total_matches = sum(emotion_scores.values())
@@ -134,9 +345,8 @@ def analyze_detailed_emotions(text, lang_code):
         for emotion in emotion_scores:
             emotion_scores[emotion] = emotion_scores[emotion] / total_matches
     
-    # TextBlob polaritesini de hesaba kat
-    analysis = TextBlob(en_text)
-    polarity = analysis.sentiment.polarity
+    # Polariteyi de hesaba kat
+    polarity = context['polarity']
     
     # Polarite pozitifse mutluluk skorunu artır, negatifse üzüntü ve öfke skorlarını artır
     if polarity > 0:
@@ -166,74 +376,80 @@ def calculate_intensity(emotion_scores, polarity):
     else:
         return 3  # Yüksek
 
-def highlight_emotional_words(text, lang_code):
+def highlight_emotional_words(text, lang_code, context=None):
     """
     Metindeki duygusal kelimeleri tespit eder ve vurgular.
     Vurgulanan kelimeler ve duygu kategorileri ile birlikte döndürür.
+    Verilen analiz bağlamı (context) varsa çeviri ve kelimelere ayırma tekrarlanmaz.
     """
-    # Metni İngilizce'ye çevir (eğer İngilizce değilse)
-    if lang_code != 'en':
-        en_text = translate_to_english(text, lang_code)
-    else:
-        en_text = text
+    if context is None:
+        context = build_analysis_context(text, lang_code)
     
-    # Metni kelimelere ayır
-    words = word_tokenize(en_text.lower())
+    words = context['tokens']
     
     # Duygusal kelimeleri tespit et
     emotional_words = []
-    for i, word in enumerate(words):
-        for emotion, keywords in EMOTION_KEYWORDS.items():
-            if word in keywords:
-                emotional_words.append({
-                    'word': word,
-                    'emotion': emotion,
-                    'position': i
-                })
+    for position, phrase, emotions in EMOTION_LEXICON.find(words):
+        for emotion in emotions:
+            emotional_words.append({
+                'word': phrase,
+                'emotion': emotion,
+                'position': position
+            })
     
     return {
         'text': text,
         'emotional_words': emotional_words
     }
 
-def analyze_sentiment(text):
-    """Metnin duygu analizini yapar ve sonuçları döndürür."""
-    # Metni temizle
-    cleaned_text = clean_text(text)
-    
-    # Dil tespiti yap
-    lang_code, lang_name = detect_language(cleaned_text)
-    
-    # Metni İngilizce'ye çevir (eğer İngilizce değilse)
-    if lang_code != 'en':
-        en_text = translate_to_english(cleaned_text, lang_code)
-    else:
-        en_text = cleaned_text
+def polarity_to_sentiment(polarity, neutral_threshold=None):
+    """
+    Polarite değerini duygu etiketine (Pozitif, Negatif, Nötr) dönüştürür.
+    Eşik verilmezse polariteyi hesaplayan sağlayıcının nötr eşiği kullanılır.
+    """
+    if neutral_threshold is None:
+        neutral_threshold = get_sentiment_backend().neutral_threshold
+    if polarity > neutral_threshold:
+        return "Pozitif"
+    elif polarity < -neutral_threshold:
+        return "Negatif"
+    return "Nötr"
+
+def build_sentiment_result(text, lang_name, context):
+    """
+    Analiz bağlamından duygu analizi sonucunu oluşturur.
     
-    # TextBlob ile duygu analizi yap
-    analysis = TextBlob(en_text)
-    polarity = analysis.sentiment.polarity
-    subjectivity = analysis.sentiment.subjectivity
+    Args:
+        text (str): Kullanıcının gönderdiği orijinal metin
+        lang_name (str): Tespit edilen dilin adı
+        context (dict): build_analysis_context ile oluşturulan analiz bağlamı
+        
+    Returns:
+        dict: Duygu analizi sonucu
+    """
+    cleaned_text = context['text']
+    lang_code = context['lang_code']
+    en_text = context['en_text']
+    polarity = context['polarity']
+    subjectivity = context['subjectivity']
     
     # Polariteyi değerlendir
-    if polarity > 0.05:
-        sentiment = "Pozitif"
-    elif polarity < -0.05:
-        sentiment = "Negatif"
-    else:
-        sentiment = "Nötr"
+    sentiment = polarity_to_sentiment(polarity, context['neutral_threshold'])
     
     # Güven skorunu hesapla (0-100 arasında)
     confidence = abs(polarity) * 100
     
-    # Detaylı duygu kategorilerini analiz et
-    emotion_scores = analyze_detailed_emotions(cleaned_text, lang_code)
-    
-    # Duygu yoğunluğunu hesapla
-    intensity = calculate_intensity(emotion_scores, polarity)
+    with span('emotions'):
+        # Detaylı duygu kategorilerini analiz et
+        emotion_scores = analyze_detailed_emotions(cleaned_text, lang_code, context)
+        
+        # Duygu yoğunluğunu hesapla
+        intensity = calculate_intensity(emotion_scores, polarity)
+        
+        # Duygusal kelimeleri vurgula
+        highlighted_emotions = highlight_emotional_words(cleaned_text, lang_code, context)
     
-    # Duygusal kelimeleri vurgula
-    highlighted_emotions = highlight_emotional_words(cleaned_text, lang_code)
+    observe_analysis(lang_code, sentiment)
     
     # Sonuçları döndür
     result = {
@@ -258,3 +474,147 @@ def analyze_sentiment(text):
     }
     
     return result
+
+def make_result_key(cleaned_text):
+    """Temizlenmiş metin, analiz hattı sürümü ve duygu sağlayıcısından sonuç önbelleği anahtarını üretir."""
+    backend = get_sentiment_backend()
+    return make_key('analysis', PIPELINE_VERSION, PIPELINE_FINGERPRINT,
+                    backend.identifier, backend.neutral_threshold, cleaned_text)
+
+def get_cached_result(key, text):
+    """
+    Önbellekteki analiz sonucunu döndürür.
+    Sonuç kopyalanır; çağıranların yaptığı değişiklikler önbelleğe yansımaz.
+    
+    Args:
+        key (str): make_result_key ile üretilen anahtar
+        text (str): Kullanıcının gönderdiği orijinal metin
+        
+    Returns:
+        dict: Analiz sonucu veya önbellekte yoksa None
+    """
+    cached = result_cache.get(key)
+    if cached is None:
+        return None
+    result = copy.deepcopy(cached)
+    result['text'] = text
+    observe_analysis(result['language_code'], result['sentiment'])
+    return result
+
+def cache_result(key, result, context):
+    """
+    Analiz sonucunu önbelleğe ekler.
+    Çeviri yapılamadığında (servis hatası veya açık devre kesici) üretilen sonuçlar
+    eksik olduğundan önbelleğe alınmaz; servis düzeldiğinde metin yeniden analiz edilir.
+    """
+    if context['translation_failed']:
+        return
+    value = copy.deepcopy(result)
+    # Aynı temizlenmiş metne sahip farklı girdiler (örn. farklı URL'ler) aynı kaydı paylaşır
+    del value['text']
+    result_cache.set(key, value)
+
+def analyze_sentiment(text):
+    """
+    Metnin duygu analizini yapar ve sonuçları döndürür.
+    Aynı temizlenmiş metin daha önce analiz edildiyse sonuç önbellekten döner.
+    """
+    # Metni temizle
+    with span('clean_text'):
+        cleaned_text = clean_text(text)
+    
+    key = make_result_key(cleaned_text)
+    with span('result_cache'):
+        result = get_cached_result(key, text)
+    if result is not None:
+        return result
+    
+    # Dil tespiti yap
+    with span('detect_language'):
+        lang_code, lang_name = detect_language(cleaned_text)
+    
+    # Çeviri, kelimelere ayırma ve duygu puanlamasını tek seferde yap
+    context = build_analysis_context(cleaned_text, lang_code)
+    
+    result = build_sentiment_result(text, lang_name, context)
+    cache_result(key, result, context)
+    return result
+
+def analyze_sentiment_batch(texts):
+    """
+    Birden fazla metnin duygu analizini toplu olarak yapar.
+    Metinler önce temizlenir ve önbellekte olmayanların dilleri tespit edilir,
+    ardından dile göre gruplanarak her farklı metin yalnızca bir kez çevrilir.
+    
+    Args:
+        texts (list): Analiz edilecek metinler
+        
+    Returns:
+        list: Her metin için sırasıyla analiz sonucu ya da 'error' alanı içeren sözlük
+    """
+    results = [None] * len(texts)
+    pending = []
+    
+    # Temizleme ve dil tespiti
+    for i, text in enumerate(texts):
+        if not isinstance(text, str) or not text.strip():
+            results[i] = {'text': text, 'error': 'Text is required'}
+            continue
+        try:
+            with span('clean_text'):
+                cleaned_text = clean_text(text)
+            key = make_result_key(cleaned_text)
+            with span('result_cache'):
+                results[i] = get_cached_result(key, text)
+            if results[i] is not None:
+                continue
+            with span('detect_language'):
+                lang_code, lang_name = detect_language(cleaned_text)
+            pending.append((i, key, cleaned_text, lang_code, lang_name))
+        except Exception as e:
+            results[i] = {'text': text, 'error': str(e)}
+    
+    # Aynı dildeki metinleri grupla ve her farklı metni bir kez çevir
+    translations = {}
+    for i, key, cleaned_text, lang_code, lang_name in pending:
+        if lang_code != 'en':
+            translations.setdefault(lang_code, {})[cleaned_text] = None
+    for lang_code, group in translations.items():
+        # Çeviriler eşzamanlı yapılır; çevrilemeyen metinler orijinal halleriyle analiz edilir
+        with span('translate'):
+            translated = translate_many(group, lang_code, 'en')
+        for cleaned_text in group:
+            group[cleaned_text] = translated.get(cleaned_text) or None
+    
+    # Tüm metinleri tek çağrıda puanla; transformer sağlayıcısı bunları gruplar halinde işler
+    en_texts = []
+    failed = []
+    for i, key, cleaned_text, lang_code, lang_name in pending:
+        en_text = translations[lang_code][cleaned_text] if lang_code != 'en' else cleaned_text
+        en_texts.append(cleaned_text if en_text is None else en_text)
+        failed.append(en_text is None)
+    # Çevrilemeyen ve yerel sözlüğü olan dillerdeki metinler sözlükle puanlanacağından modele gönderilmez;
+    # sözlükte eşleşme bulunmazsa build_analysis_context bunları tek tek puanlar
+    unique_en_texts = list(dict.fromkeys(
+        en_text for (i, key, cleaned_text, lang_code, lang_name), en_text, translation_failed
+        in zip(pending, en_texts, failed)
+        if not (translation_failed and lang_code in LOCAL_POLARITY_LEXICONS)
+    ))
+    try:
+        with span('polarity'):
+            scores = dict(zip(unique_en_texts, get_sentiment_backend().score_many(unique_en_texts)))
+    except Exception as e:
+        print(f"Toplu duygu puanlama hatası: {e}")
+        scores = {}  # Metinler tek tek puanlanır
+    
+    # Duygu ve detaylı duygu skorlarını hesapla
+    for (i, key, cleaned_text, lang_code, lang_name), en_text, translation_failed in zip(pending, en_texts, failed):
+        try:
+            context = build_analysis_context(cleaned_text, lang_code, en_text, scores.get(en_text),
+                                             translation_failed)
+            results[i] = build_sentiment_result(texts[i], lang_name, context)
+            cache_result(key, results[i], context)
+        except Exception as e:
+            results[i] = {'text': texts[i], 'error': str(e)}
+    
+    return results
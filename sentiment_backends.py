@@ -0,0 +1,315 @@
+"""
+Duygu puanlama sağlayıcıları (backend) için modül.
+Bu modül, İngilizce metnin polarite ve öznellik puanlarını hesaplayan
+sağlayıcıları ortak bir arayüz arkasında toplar.
+
+Sağlayıcılar:
+    textblob     TextBlob sözlük tabanlı puanlama (varsayılan)
+    transformer  Yerel Hugging Face modeliyle yalnızca CPU üzerinde çıkarım
+                 (transformers ve torch kurulu olmalıdır)
+
+transformer sağlayıcısında farklı thread'lerden birkaç milisaniye içinde gelen
+istekler arka plandaki tek bir thread'de birleştirilir ve tek ileri geçişte
+(forward pass) puanlanır (dinamik gruplama). Model her süreçte bir kez yüklenir.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from metrics import observe_sentiment_batch
+
+SENTIMENT_BACKEND = os.environ.get('SENTIMENT_BACKEND', 'textblob')
+SENTIMENT_MODEL = os.environ.get('SENTIMENT_MODEL', 'distilbert-base-uncased-finetuned-sst-2-english')
+# Tek ileri geçişte puanlanan en fazla metin sayısı
+SENTIMENT_MAX_BATCH_SIZE = int(os.environ.get('SENTIMENT_MAX_BATCH_SIZE', 32))
+# İlk istekten sonra aynı gruba katılacak isteklerin bekleneceği en uzun süre (milisaniye)
+SENTIMENT_BATCH_WAIT_MS = float(os.environ.get('SENTIMENT_BATCH_WAIT_MS', 5))
+# Model çıkarımında kullanılacak CPU thread sayısı (0 = torch varsayılanı)
+SENTIMENT_THREADS = int(os.environ.get('SENTIMENT_THREADS', 0))
+# Modele verilen en uzun girdi (token)
+SENTIMENT_MAX_LENGTH = int(os.environ.get('SENTIMENT_MAX_LENGTH', 512))
+# Model etiketlerinin rollere eşlenmesi, örn. "negative=LABEL_0,neutral=LABEL_1,positive=LABEL_2";
+# tanımlanmazsa modelin id2label ayarında positive/negative (ve varsa neutral) etiketleri aranır
+SENTIMENT_LABELS = os.environ.get('SENTIMENT_LABELS', '')
+# transformer polaritesi (P(pozitif) - P(negatif)) bu değerin altında kalırsa metin nötr sayılır
+SENTIMENT_NEUTRAL_THRESHOLD = float(os.environ.get('SENTIMENT_NEUTRAL_THRESHOLD', 0.3))
+
+SENTIMENT_ROLES = ('positive', 'negative', 'neutral')
+
+def parse_label_mapping(value):
+    """
+    SENTIMENT_LABELS değerini {rol: etiket} sözlüğüne dönüştürür.
+
+    Raises:
+        ValueError: Biçim hatalıysa veya bilinmeyen bir rol verilmişse
+    """
+    mapping = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        role, separator, label = item.partition('=')
+        role = role.strip().lower()
+        if not separator or role not in SENTIMENT_ROLES or not label.strip():
+            raise ValueError(f"Geçersiz SENTIMENT_LABELS girdisi: '{item}' (beklenen: rol=etiket)")
+        mapping[role] = label.strip()
+    return mapping
+
+def resolve_labels(id2label, mapping=None):
+    """
+    Modelin sınıf indekslerini pozitif, negatif ve nötr rollere eşler.
+    Eşleme verilmezse etiketlerin kendisi positive, negative ve neutral olmalıdır;
+    LABEL_0 gibi anlamı belirsiz etiketler tahmin edilmez.
+
+    Args:
+        id2label (dict): Model ayarındaki {indeks: etiket} sözlüğü
+        mapping (dict, optional): {rol: etiket} eşlemesi (SENTIMENT_LABELS)
+
+    Returns:
+        tuple: (pozitif indeks, negatif indeks, nötr indeks veya None)
+
+    Raises:
+        ValueError: Pozitif veya negatif sınıf bulunamazsa
+    """
+    indexes = {str(label).lower(): int(index) for index, label in id2label.items()}
+    if mapping:
+        roles = {}
+        for role, label in mapping.items():
+            if label.lower() not in indexes:
+                raise ValueError(f"'{label}' etiketi modelde yok; modelin etiketleri: {sorted(indexes)}")
+            roles[role] = indexes[label.lower()]
+    else:
+        roles = {role: indexes[role] for role in SENTIMENT_ROLES if role in indexes}
+
+    if 'positive' not in roles or 'negative' not in roles:
+        raise ValueError(
+            f"Modelin etiketlerinden pozitif ve negatif sınıflar belirlenemedi: {sorted(indexes)}. "
+            "SENTIMENT_LABELS ile eşleme tanımlayın (örn. negative=LABEL_0,positive=LABEL_1)."
+        )
+    return roles['positive'], roles['negative'], roles.get('neutral')
+
+class SentimentBackend:
+    """Duygu puanlama sağlayıcıları için temel sınıf."""
+
+    name = 'base'
+    # Mutlak değeri bu eşiği aşmayan polariteler nötr sayılır; sağlayıcının puan dağılımına göre ayarlanır
+    neutral_threshold = 0.05
+
+    @property
+    def identifier(self):
+        """Sonuç önbelleği anahtarında kullanılan, sağlayıcıyı ve modeli belirten değer."""
+        return self.name
+
+    def score(self, text):
+        """
+        İngilizce metnin duygu puanlarını hesaplar.
+
+        Args:
+            text (str): İngilizce metin
+
+        Returns:
+            tuple: (polarite -1..1, öznellik 0..1)
+        """
+        raise NotImplementedError
+
+    def score_many(self, texts):
+        """Birden fazla metni puanlar; sonuçlar metinlerle aynı sıradadır."""
+        return [self.score(text) for text in texts]
+
+    def warm_up(self):
+        """Sağlayıcının modellerini ilk istekten önce yükler."""
+        self.score('This is a good warm up.')
+
+class TextBlobBackend(SentimentBackend):
+    """TextBlob'un sözlük tabanlı polarite ve öznellik puanları."""
+
+    name = 'textblob'
+
+    def score(self, text):
+        from textblob import TextBlob
+
+        sentiment = TextBlob(text).sentiment
+        return sentiment.polarity, sentiment.subjectivity
+
+class _BatchRequest:
+    """Gruplama kuyruğundaki tek bir istek: metinler ve sonucun yazılacağı Future."""
+
+    __slots__ = ('texts', 'future')
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.future = Future()
+
+class TransformerBackend(SentimentBackend):
+    """
+    Yerel transformer sınıflandırma modeliyle CPU üzerinde puanlama.
+    Polarite pozitif ve negatif sınıf olasılıklarının farkıdır; model nötr sınıf
+    içeriyorsa öznellik 1 - P(nötr), içermiyorsa polaritenin mutlak değeridir.
+
+    Args:
+        model_name (str): Hugging Face model adı veya yerel dizin
+        max_batch_size (int): Tek ileri geçişte puanlanan en fazla metin
+        batch_wait_ms (float): Grubun dolması için beklenecek en uzun süre (milisaniye)
+        max_length (int): Modele verilen en uzun girdi (token)
+        labels (str): Etiket eşlemesi (SENTIMENT_LABELS biçiminde)
+        neutral_threshold (float): Nötr sayılan en yüksek mutlak polarite. Modelin olasılık
+            farkı TextBlob puanlarından çok daha uç değerler aldığından varsayılanı daha yüksektir.
+    """
+
+    name = 'transformer'
+
+    def __init__(self, model_name=SENTIMENT_MODEL, max_batch_size=SENTIMENT_MAX_BATCH_SIZE,
+                 batch_wait_ms=SENTIMENT_BATCH_WAIT_MS, max_length=SENTIMENT_MAX_LENGTH,
+                 labels=SENTIMENT_LABELS, neutral_threshold=SENTIMENT_NEUTRAL_THRESHOLD):
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait_ms / 1000
+        self.max_length = max_length
+        # Hatalı eşleme model indirilmeden, sağlayıcı oluşturulurken fark edilir
+        self.label_mapping = parse_label_mapping(labels)
+        self.neutral_threshold = neutral_threshold
+        self.batches = 0
+        self.batched_texts = 0
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def identifier(self):
+        return f'{self.name}:{self.model_name}'
+
+    def load(self):
+        """
+        Modeli ve gruplama thread'ini yükler.
+        Thread'ler fork ile kopyalanmadığından her süreçte (gunicorn worker) ayrı yüklenir.
+
+        Raises:
+            ValueError: Modelin pozitif ve negatif sınıfları belirlenemezse
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+            if SENTIMENT_THREADS:
+                torch.set_num_threads(SENTIMENT_THREADS)
+            self.torch = torch
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name).to('cpu')
+            model.eval()
+            self.positive, self.negative, self.neutral = resolve_labels(model.config.id2label, self.label_mapping)
+            self.model = model
+
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name='sentiment-batcher', daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def predict(self, texts):
+        """
+        Metinleri gruplama yapmadan, max_batch_size'lık ileri geçişlerle puanlar.
+
+        Args:
+            texts (list): İngilizce metinler
+
+        Returns:
+            list: (polarite, öznellik) ikilileri
+        """
+        self.load()
+        scores = []
+        for start in range(0, len(texts), self.max_batch_size):
+            batch = texts[start:start + self.max_batch_size]
+            inputs = self.tokenizer(batch, padding=True, truncation=True,
+                                    max_length=self.max_length, return_tensors='pt')
+            with self.torch.inference_mode():
+                probabilities = self.model(**inputs).logits.softmax(dim=-1).tolist()
+
+            for row in probabilities:
+                polarity = row[self.positive] - row[self.negative]
+                subjectivity = 1 - row[self.neutral] if self.neutral is not None else abs(polarity)
+                scores.append((polarity, subjectivity))
+        return scores
+
+    def _run(self):
+        """Kuyruktaki istekleri gruplayıp puanlayan arka plan döngüsü."""
+        while True:
+            pending = [self._queue.get()]
+            size = len(pending[0].texts)
+            deadline = time.monotonic() + self.batch_wait
+
+            # İlk istekten sonra grup dolana veya bekleme süresi bitene kadar yeni istekleri topla
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                size += len(request.texts)
+
+            texts = [text for request in pending for text in request.texts]
+            started = time.perf_counter()
+            try:
+                scores = self.predict(texts)
+            except Exception as e:
+                for request in pending:
+                    request.future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.batched_texts += len(texts)
+            observe_sentiment_batch(self.name, len(texts), time.perf_counter() - started)
+
+            position = 0
+            for request in pending:
+                request.future.set_result(scores[position:position + len(request.texts)])
+                position += len(request.texts)
+
+    def score_many(self, texts):
+        if not texts:
+            return []
+        self.load()
+        request = _BatchRequest(list(texts))
+        self._queue.put(request)
+        return request.future.result()
+
+    def score(self, text):
+        return self.score_many([text])[0]
+
+    def warm_up(self):
+        self.load()
+        self.predict(['This is a good warm up.'])
+
+    def stats(self):
+        """Gruplama sayaçlarını döndürür."""
+        return {
+            'model': self.model_name,
+            'batches': self.batches,
+            'texts': self.batched_texts,
+            'mean_batch_size': round(self.batched_texts / self.batches, 2) if self.batches else 0.0
+        }
+
+BACKENDS = {
+    'textblob': TextBlobBackend,
+    'transformer': TransformerBackend
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_sentiment_backend():
+    """Yapılandırılmış duygu puanlama sağlayıcısını döndürür (model ilk puanlamada yüklenir)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[SENTIMENT_BACKEND]()
+    return _backend
+
+def set_sentiment_backend(backend):
+    """Duygu puanlama sağlayıcısını değiştirir (testler ve ölçümler için)."""
+    global _backend
+    _backend = backend
@@ -0,0 +1,181 @@
+"""
+Yazım düzeltme modülü.
+Bu modül, TextBlob'un kullandığı kelime frekans verisi (en-spelling.txt) üzerinde
+simetrik silme (SymSpell) yöntemiyle çalışan bir yazım düzelticisi sağlar.
+Sözlükteki her kelimenin tek harf silme varyasyonları bir kez dizinlenir; 1 uzaklıktaki
+adaylar kelimenin kendi silme varyasyonlarıyla doğrudan bulunur. TextBlob her yanlış
+kelime için yüzlerce 1 uzaklıktaki ve on binlerce 2 uzaklıktaki dizgiyi üretip sözlükte
+arar; burada 2 uzaklıktaki adaylara yalnızca 1 uzaklıkta aday yoksa bakılır.
+Aday seçimi TextBlob ile aynıdır: en küçük düzenleme uzaklığındaki adaylardan
+en sık kullanılanı seçilir.
+"""
+
+import os
+import re
+import threading
+from cache import LRUCache
+
+# Aranacak en fazla düzenleme uzaklığı (1 veya 2)
+SPELLING_MAX_EDIT_DISTANCE = int(os.environ.get('SPELLING_MAX_EDIT_DISTANCE', 2))
+# Kelime başına düzeltme sonuçlarını tutan önbelleğin boyutu
+SPELLING_CACHE_SIZE = int(os.environ.get('SPELLING_CACHE_SIZE', 50000))
+# Bu uzunluktan uzun kelimeler düzeltilmez
+MAX_WORD_LENGTH = 30
+
+# TextBlob.correct ile aynı ayrıştırma: kelimeler, noktalama işaretleri ve boşluklar
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]|\s")
+# TextBlob'un ekleme ve değiştirmede kullandığı harfler
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+def default_dictionary_path():
+    """TextBlob ile birlikte gelen İngilizce kelime frekans dosyasının yolunu döndürür."""
+    import textblob
+    return os.path.join(os.path.dirname(textblob.__file__), 'en', 'en-spelling.txt')
+
+def read_frequencies(path):
+    """
+    'kelime frekans' satırlarından oluşan sözlük dosyasını okur (';;;' ile başlayan satırlar yorumdur).
+
+    Returns:
+        dict: {kelime: frekans}
+    """
+    frequencies = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(';;;'):
+                continue
+            parts = line.split()
+            if len(parts) == 2:
+                frequencies[parts[0]] = int(parts[1])
+    return frequencies
+
+def edits1(word):
+    """
+    TextBlob ile aynı şekilde, kelimeden tek silme, bitişik iki harfin yer değiştirmesi,
+    harf değiştirme veya harf ekleme ile elde edilen tüm dizgileri döndürür.
+    """
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    results = {a + b[1:] for a, b in splits if b}
+    results.update(a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1)
+    results.update(a + c + b[1:] for a, b in splits if b for c in ALPHABET)
+    results.update(a + c + b for a, b in splits for c in ALPHABET)
+    return results
+
+def one_substitution_apart(a, b):
+    """
+    Aynı uzunluktaki iki farklı kelimenin tek harf değiştirme veya bitişik iki harfin
+    yer değiştirmesiyle birbirine dönüşüp dönüşmediğini döndürür.
+    """
+    i = 0
+    while a[i] == b[i]:
+        i += 1
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:]
+
+class SpellChecker:
+    """
+    Tek harf silme dizini ile yazım düzeltici.
+
+    Args:
+        frequencies (dict): {kelime: frekans}
+        max_edit_distance (int): Aranacak en fazla düzenleme uzaklığı (1 veya 2)
+        cache_size (int): Kelime başına düzeltme önbelleğinin boyutu
+    """
+
+    def __init__(self, frequencies, max_edit_distance=SPELLING_MAX_EDIT_DISTANCE,
+                 cache_size=SPELLING_CACHE_SIZE):
+        self.frequencies = frequencies
+        self.max_edit_distance = max_edit_distance
+        self.cache = LRUCache(maxsize=cache_size)
+
+        # {tek harfi silinmiş dizgi: [kelimeler]}
+        self.index = {}
+        for word in frequencies:
+            for i in range(len(word)):
+                self.index.setdefault(word[:i] + word[i + 1:], []).append(word)
+
+    @classmethod
+    def from_file(cls, path=None, **kwargs):
+        """Sözlük dosyasından (varsayılan: TextBlob en-spelling.txt) düzeltici oluşturur."""
+        return cls(read_frequencies(path or default_dictionary_path()), **kwargs)
+
+    def distance_one(self, word):
+        """
+        Sözlükte kelimeye tam olarak 1 düzenleme uzaklığında olan kelimeleri döndürür.
+        Yalnızca kelimenin silme varyasyonlarına ve uzunluğu kelimeyle aynı olan dizin
+        kayıtlarına bakılır; düzenleme uzaklığı hesabı yapılmaz.
+        """
+        # Kelimeye bir harf eklenerek elde edilen kelimeler
+        candidates = set(self.index.get(word, ()))
+        for i in range(len(word)):
+            variant = word[:i] + word[i + 1:]
+            # Kelimeden bir harf silinerek elde edilen kelime
+            if variant in self.frequencies:
+                candidates.add(variant)
+            # Aynı silme varyasyonunu paylaşan, aynı uzunluktaki kelimeler: değiştirme veya yer değiştirme
+            for candidate in self.index.get(variant, ()):
+                if (len(candidate) == len(word) and candidate != word and candidate not in candidates
+                        and one_substitution_apart(word, candidate)):
+                    candidates.add(candidate)
+        return candidates
+
+    def distance_two(self, word):
+        """Kelimenin 1 uzaklıktaki dizgilerine 1 uzaklıkta olan sözlük kelimelerini döndürür."""
+        candidates = set()
+        for variant in edits1(word):
+            candidates |= self.distance_one(variant)
+        candidates.discard(word)
+        return candidates
+
+    def lookup(self, word):
+        """
+        Küçük harfli kelime için en iyi düzeltmeyi döndürür.
+        Sözlükte olan kelimeler olduğu gibi döner; aday bulunamazsa kelimenin kendisi döner.
+        TextBlob gibi önce 1 uzaklıktaki adaylara bakılır, yalnızca bunlar yoksa 2 uzaklıktaki
+        adaylar üretilir; adaylardan en sık kullanılanı (eşitlikte alfabetik olarak sonuncusu) seçilir.
+        """
+        if word in self.frequencies or len(word) > MAX_WORD_LENGTH:
+            return word
+
+        cached = self.cache.get(word)
+        if cached is not None:
+            return cached
+
+        candidates = self.distance_one(word) if self.max_edit_distance >= 1 else set()
+        if not candidates and self.max_edit_distance >= 2:
+            candidates = self.distance_two(word)
+        best = max(candidates, key=lambda candidate: (self.frequencies[candidate], candidate)) if candidates else word
+
+        self.cache.set(word, best)
+        return best
+
+    def correct_word(self, token):
+        """
+        Tek bir kelimeyi düzeltir. Tek harfli kelimeler, sayılar ve büyük harfle yazılmış
+        kısaltmalar değiştirilmez; baş harfi büyük kelimelerde büyük harf korunur.
+        """
+        if len(token) <= 1 or not token.isalpha():
+            return token
+        if token.islower():
+            return self.lookup(token)
+        if token.istitle():
+            return self.lookup(token.lower()).title()
+        return token
+
+    def correct(self, text):
+        """Metindeki tüm kelimeleri düzeltir; noktalama ve boşluklar korunur."""
+        return ''.join(self.correct_word(token) for token in TOKEN_PATTERN.findall(text))
+
+_spell_checker = None
+_spell_checker_lock = threading.Lock()
+
+def get_spell_checker():
+    """Varsayılan yazım düzelticisini döndürür (dizin ilk kullanımda bir kez oluşturulur)."""
+    global _spell_checker
+    if _spell_checker is None:
+        with _spell_checker_lock:
+            if _spell_checker is None:
+                _spell_checker = SpellChecker.from_file()
+    return _spell_checker
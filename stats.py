@@ -1,15 +1,89 @@
-import matplotlib
-matplotlib.use('Agg')  # GUI olmadan çalışması için
-import matplotlib.pyplot as plt
-import io
+import os
 import base64
-import pandas as pd
+from collections import Counter
+from sqlalchemy.exc import IntegrityError
 from models import Analysis, LanguageStats, SentimentStats, EmotionStats, db
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+from cache import LRUCache
+
+# Grafik önbelleği ayarları
+CHART_CACHE_SIZE = int(os.environ.get('CHART_CACHE_SIZE', 128))
+CHART_CACHE_TTL = int(os.environ.get('CHART_CACHE_TTL', 3600))
+
+# Oluşturulmuş PNG grafikleri; anahtar veri filigranını içerdiği için yeni analizler eski kayıtları geçersiz kılar
+chart_cache = LRUCache(maxsize=CHART_CACHE_SIZE, ttl=CHART_CACHE_TTL)
+
+def get_data_watermark(user_id=None):
+    """
+    Grafik verisinin sürümünü belirleyen filigranı döndürür (en büyük Analysis.id).
+    Yeni bir analiz eklendiğinde filigran değişir ve önbellekteki grafikler kullanılmaz.
+    
+    Args:
+        user_id (int, optional): Belirli bir kullanıcının verisi için kullanıcı ID'si.
+        
+    Returns:
+        int: En büyük analiz ID'si, analiz yoksa 0
+    """
+    query = db.session.query(db.func.max(Analysis.id))
+    if user_id:
+        query = query.filter(Analysis.user_id == user_id)
+    return query.scalar() or 0
+
+def get_chart_png(chart_type, user_id=None, days=30):
+    """
+    Grafiği önbellekten döndürür, yoksa oluşturup önbelleğe ekler.
+    Önbellek anahtarı (grafik türü, kullanıcı, zaman aralığı, veri filigranı) şeklindedir;
+    zaman serisi grafikleri gün değiştiğinde de yeniden oluşturulur.
+    
+    Args:
+        chart_type (str): 'sentiment', 'language' veya 'time_series'
+        user_id (int, optional): Belirli bir kullanıcı için kullanıcı ID'si.
+        days (int): Zaman serisi için gün sayısı.
+        
+    Returns:
+        tuple: (PNG görüntüsü veya veri yoksa None, veri filigranı)
+    """
+    watermark = get_data_watermark(user_id)
+    if chart_type == 'time_series':
+        key = (chart_type, user_id, days, watermark, date.today())
+    else:
+        key = (chart_type, user_id, None, watermark, None)
+    
+    png = chart_cache.get(key)
+    if png is None:
+        if chart_type == 'sentiment':
+            png = render_sentiment_distribution(user_id)
+        elif chart_type == 'language':
+            png = render_language_distribution(user_id)
+        elif chart_type == 'time_series':
+            png = render_time_series_analysis(days, user_id)
+        else:
+            raise ValueError(f"Bilinmeyen grafik türü: {chart_type}")
+        
+        if png is not None:
+            chart_cache.set(key, png)
+    
+    return png, watermark
+
+def to_base64(png):
+    """PNG görüntüsünü HTML içine gömmek için base64 metnine dönüştürür."""
+    return base64.b64encode(png).decode('utf-8') if png is not None else None
 
 def get_sentiment_distribution(user_id=None):
     """
-    Duygu analizi dağılımını gösteren pasta grafik oluşturur.
+    Duygu analizi dağılımını gösteren pasta grafiği (önbellekli) döndürür.
+    
+    Args:
+        user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
+        
+    Returns:
+        str: Base64 kodlanmış grafik görüntüsü.
+    """
+    return to_base64(get_chart_png('sentiment', user_id)[0])
+
+def get_language_distribution(user_id=None):
+    """
+    Dil dağılımını gösteren pasta grafiği (önbellekli) döndürür.
     
     Args:
         user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
@@ -17,6 +91,31 @@ def get_sentiment_distribution(user_id=None):
     Returns:
         str: Base64 kodlanmış grafik görüntüsü.
     """
+    return to_base64(get_chart_png('language', user_id)[0])
+
+def get_time_series_analysis(days=30, user_id=None):
+    """
+    Zaman serisi grafiğini (önbellekli) döndürür.
+    
+    Args:
+        days (int): Kaç günlük veri gösterileceği.
+        user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
+        
+    Returns:
+        str: Base64 kodlanmış grafik görüntüsü.
+    """
+    return to_base64(get_chart_png('time_series', user_id, days)[0])
+
+def render_sentiment_distribution(user_id=None):
+    """
+    Duygu analizi dağılımını gösteren pasta grafik oluşturur.
+    
+    Args:
+        user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
+        
+    Returns:
+        bytes: PNG grafik görüntüsü.
+    """
     try:
         # Veritabanı sorgusunu hazırla
         from models import Analysis, db
@@ -55,30 +154,15 @@ def get_sentiment_distribution(user_id=None):
             else:
                 colors.append('#FFC107')  # Sarı
         
-        # Grafik oluştur
-        plt.figure(figsize=(8, 6))
-        plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', 
-                shadow=True, startangle=140, textprops={'fontsize': 12})
-        plt.axis('equal')  # Dairesel görünüm için
-        plt.title('Duygu Analizi Dağılımı', fontsize=16, pad=20)
-        
-        # Grafik görüntüsünü belleğe kaydet
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        
-        # Base64 kodla
-        img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
-        buf.close()
-        plt.close()
-        
-        return img_str
+        # Grafik oluştur (matplotlib ilk grafikte yüklenir)
+        from charts import render_pie_chart
+        return render_pie_chart(labels, sizes, colors, 'Duygu Analizi Dağılımı', startangle=140)
         
     except Exception as e:
         print(f"Grafik oluşturma hatası: {e}")
         return None
 
-def get_language_distribution(user_id=None):
+def render_language_distribution(user_id=None):
     """
     Dil dağılımını gösteren pasta grafik oluşturur.
     
@@ -86,7 +170,7 @@ def get_language_distribution(user_id=None):
         user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
         
     Returns:
-        str: Base64 kodlanmış grafik görüntüsü.
+        bytes: PNG grafik görüntüsü.
     """
     try:
         # Veritabanı sorgusunu hazırla
@@ -132,35 +216,48 @@ def get_language_distribution(user_id=None):
             else:
                 language_names.append(lang)
         
-        # Grafik oluştur
-        plt.figure(figsize=(8, 6))
-        
-        # Renk paleti oluştur
-        cmap = plt.cm.get_cmap('tab10')
-        colors = [cmap(i) for i in np.linspace(0, 1, len(languages))]
-        
-        plt.pie(counts, labels=language_names, colors=colors, autopct='%1.1f%%', 
-                shadow=True, startangle=90, textprops={'fontsize': 12})
-        plt.axis('equal')
-        plt.title('Dil Dağılımı', fontsize=16, pad=20)
-        
-        # Grafik görüntüsünü belleğe kaydet
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        
-        # Base64 kodla
-        img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
-        buf.close()
-        plt.close()
-        
-        return img_str
+        # Grafik oluştur (matplotlib ilk grafikte yüklenir)
+        from charts import palette, render_pie_chart
+        return render_pie_chart(language_names, counts, palette(len(languages)), 'Dil Dağılımı')
         
     except Exception as e:
         print(f"Grafik oluşturma hatası: {e}")
         return None
 
-def get_time_series_analysis(days=30, user_id=None):
+def get_daily_sentiment_counts(start_date, end_date, user_id=None):
+    """
+    Verilen tarih aralığındaki analizleri gün ve duygu bazında SQL tarafında sayar.
+    Yalnızca gün başına sayılar veritabanından okunur; bellek kullanımı satır sayısından bağımsızdır.
+    SQLite ve PostgreSQL'in ikisi de date() fonksiyonunu destekler.
+    
+    Args:
+        start_date (datetime): Başlangıç zamanı
+        end_date (datetime): Bitiş zamanı
+        user_id (int, optional): Belirli bir kullanıcı için kullanıcı ID'si.
+        
+    Returns:
+        dict: {(tarih, duygu): analiz sayısı}
+    """
+    day = db.func.date(Analysis.created_at).label('day')
+    query = db.session.query(
+        day,
+        Analysis.sentiment,
+        db.func.count(Analysis.id)
+    ).filter(Analysis.created_at.between(start_date, end_date))
+    
+    if user_id:
+        query = query.filter(Analysis.user_id == user_id)
+    
+    daily_counts = {}
+    for day_value, sentiment, count in query.group_by(day, Analysis.sentiment).all():
+        # SQLite tarihi 'YYYY-MM-DD' metni olarak, PostgreSQL date nesnesi olarak döndürür
+        if not isinstance(day_value, date):
+            day_value = date.fromisoformat(str(day_value)[:10])
+        daily_counts[(day_value, sentiment)] = count
+    
+    return daily_counts
+
+def render_time_series_analysis(days=30, user_id=None):
     """
     Belirli bir zaman aralığında yapılan analizlerin zaman serisi grafiğini oluşturur.
     
@@ -169,82 +266,29 @@ def get_time_series_analysis(days=30, user_id=None):
         user_id (int, optional): Belirli bir kullanıcı için istatistik oluşturmak için kullanıcı ID'si.
         
     Returns:
-        str: Base64 kodlanmış grafik görüntüsü.
+        bytes: PNG grafik görüntüsü.
     """
     try:
-        # Veritabanı sorgusunu hazırla
-        from models import Analysis, db
-        
         # Tarih aralığını belirle
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Sorguyu oluştur
-        if user_id:
-            analyses = Analysis.query.filter(
-                Analysis.created_at.between(start_date, end_date),
-                Analysis.user_id == user_id
-            ).all()
-        else:
-            analyses = Analysis.query.filter(
-                Analysis.created_at.between(start_date, end_date)
-            ).all()
+        # Günlük duygu sayılarını veritabanında hesapla
+        daily_counts = get_daily_sentiment_counts(start_date, end_date, user_id)
         
         # Veri yoksa boş grafik döndür
-        if not analyses:
+        if not daily_counts:
             return None
         
-        # Verileri pandas DataFrame'e dönüştür
-        data = []
-        for analysis in analyses:
-            data.append({
-                'date': analysis.created_at.date(),
-                'sentiment': analysis.sentiment
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Tarihe göre grupla ve duygu sayılarını hesapla
-        grouped = df.groupby(['date', 'sentiment']).size().unstack(fill_value=0)
-        
-        # Eksik tarihleri doldur
-        date_range = pd.date_range(start=start_date.date(), end=end_date.date())
-        grouped = grouped.reindex(date_range, fill_value=0)
-        
-        # Duygu kategorilerini kontrol et ve eksik olanları ekle
+        # Eksik tarihleri sıfırla doldur
+        dates = [start_date.date() + timedelta(days=i) for i in range((end_date.date() - start_date.date()).days + 1)]
+        series = {}
         for sentiment in ['Pozitif', 'Negatif', 'Nötr']:
-            if sentiment not in grouped.columns:
-                grouped[sentiment] = 0
-        
-        # Grafik oluştur
-        plt.figure(figsize=(10, 6))
-        
-        # Çizgi grafiği çiz
-        plt.plot(grouped.index, grouped['Pozitif'], 'g-', label='Pozitif', linewidth=2)
-        plt.plot(grouped.index, grouped['Negatif'], 'r-', label='Negatif', linewidth=2)
-        plt.plot(grouped.index, grouped['Nötr'], 'y-', label='Nötr', linewidth=2)
-        
-        # Grafik ayarları
-        plt.title(f'Son {days} Gün İçindeki Analiz Dağılımı', fontsize=16)
-        plt.xlabel('Tarih', fontsize=12)
-        plt.ylabel('Analiz Sayısı', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-        
-        # X ekseni tarih formatını ayarla
-        plt.gcf().autofmt_xdate()
+            series[sentiment] = [daily_counts.get((day, sentiment), 0) for day in dates]
         
-        # Grafik görüntüsünü belleğe kaydet
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        
-        # Base64 kodla
-        img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
-        buf.close()
-        plt.close()
-        
-        return img_str
+        # Grafik oluştur (matplotlib ilk grafikte yüklenir)
+        from charts import render_sentiment_time_series
+        return render_sentiment_time_series(dates, series, days)
         
     except Exception as e:
         print(f"Grafik oluşturma hatası: {e}")
@@ -253,42 +297,91 @@ def get_time_series_analysis(days=30, user_id=None):
 def update_stats(analysis_result):
     """
     Analiz sonucuna göre istatistikleri günceller.
+    Commit işlemi çağırana bırakılır; analiz kaydı ve sayaçlar tek işlemde yazılır.
     
     Args:
         analysis_result (dict): Analiz sonucu
     """
-    # Dil istatistiklerini güncelle
-    lang_code = analysis_result['language_code']
-    lang_name = analysis_result['language_name']
+    update_stats_bulk([analysis_result])
+
+def update_stats_bulk(analysis_results):
+    """
+    Birden fazla analiz sonucuna göre istatistikleri tek seferde günceller.
+    Sayılar önce bellekte toplanır, ardından her dil, duygu ve duygu kategorisi
+    için tek bir atomik UPDATE (count = count + n) çalıştırılır. Böylece eşzamanlı
+    worker'lar birbirinin artışını ezmez. Commit işlemi çağırana bırakılır.
     
-    lang_stat = LanguageStats.query.filter_by(language_code=lang_code).first()
-    if lang_stat:
-        lang_stat.count += 1
-    else:
-        lang_stat = LanguageStats(language_code=lang_code, language_name=lang_name, count=1)
-        db.session.add(lang_stat)
+    Args:
+        analysis_results (list): Analiz sonuçları
+    """
+    language_counts = Counter()
+    language_names = {}
+    sentiment_counts = Counter()
+    emotion_counts = Counter()
+    emotion_intensities = Counter()
+    
+    for analysis_result in analysis_results:
+        lang_code = analysis_result['language_code']
+        language_counts[lang_code] += 1
+        language_names[lang_code] = analysis_result['language_name']
+        
+        sentiment_counts[analysis_result['sentiment']] += 1
+        
+        if 'emotion_scores' in analysis_result:
+            # En yüksek skora sahip duygu kategorisini bul
+            emotion_scores = analysis_result['emotion_scores']
+            primary_emotion = max(emotion_scores, key=emotion_scores.get)
+            emotion_counts[primary_emotion] += 1
+            emotion_intensities[primary_emotion] += analysis_result.get('intensity', 1)
+    
+    # Dil istatistiklerini güncelle
+    for lang_code, count in language_counts.items():
+        increment_stat(
+            LanguageStats, {'language_code': lang_code},
+            {LanguageStats.count: db.func.coalesce(LanguageStats.count, 0) + count},
+            lambda: LanguageStats(language_code=lang_code, language_name=language_names[lang_code], count=count)
+        )
     
     # Duygu istatistiklerini güncelle
-    sentiment = analysis_result['sentiment']
-    sentiment_stat = SentimentStats.query.filter_by(sentiment=sentiment).first()
-    if sentiment_stat:
-        sentiment_stat.count += 1
-    else:
-        sentiment_stat = SentimentStats(sentiment=sentiment, count=1)
-        db.session.add(sentiment_stat)
+    for sentiment, count in sentiment_counts.items():
+        increment_stat(
+            SentimentStats, {'sentiment': sentiment},
+            {SentimentStats.count: db.func.coalesce(SentimentStats.count, 0) + count},
+            lambda: SentimentStats(sentiment=sentiment, count=count)
+        )
     
     # Duygu kategorileri istatistiklerini güncelle
-    if 'emotion_scores' in analysis_result:
-        # En yüksek skora sahip duygu kategorisini bul
-        emotion_scores = analysis_result['emotion_scores']
-        primary_emotion = max(emotion_scores, key=emotion_scores.get)
-        
-        # İstatistikleri güncelle
-        emotion_stat = EmotionStats.query.filter_by(emotion=primary_emotion).first()
-        if emotion_stat:
-            emotion_stat.count += 1
-        else:
-            emotion_stat = EmotionStats(emotion=primary_emotion, count=1)
-            db.session.add(emotion_stat)
+    for emotion, count in emotion_counts.items():
+        intensity_sum = float(emotion_intensities[emotion])
+        old_count = db.func.coalesce(EmotionStats.count, 0)
+        old_average = db.func.coalesce(EmotionStats.average_intensity, 0.0)
+        increment_stat(
+            EmotionStats, {'emotion': emotion},
+            {
+                EmotionStats.count: old_count + count,
+                # Ortalama yoğunluk yürüyen ortalama olarak tutulur; SET ifadeleri eski değerleri kullanır
+                EmotionStats.average_intensity: (old_average * old_count + intensity_sum) / (old_count + count)
+            },
+            lambda: EmotionStats(emotion=emotion, count=count, average_intensity=intensity_sum / count)
+        )
+
+def increment_stat(model, key, values, create):
+    """
+    İstatistik satırını veritabanı tarafında atomik olarak günceller, satır yoksa oluşturur.
+    
+    Args:
+        model: İstatistik modeli (LanguageStats, SentimentStats, EmotionStats)
+        key (dict): Satırı belirleyen sütun değerleri
+        values (dict): UPDATE ile atanacak SQL ifadeleri
+        create (callable): Satır yoksa eklenecek model nesnesini döndüren fonksiyon
+    """
+    updated = db.session.query(model).filter_by(**key).update(values, synchronize_session=False)
+    if updated:
+        return
     
-    db.session.commit()
+    # Satır yoksa ekle; başka bir worker aynı anda eklediyse benzersiz indeks hatası alınır ve güncellemeye dönülür
+    try:
+        with db.session.begin_nested():
+            db.session.add(create())
+    except IntegrityError:
+        db.session.query(model).filter_by(**key).update(values, synchronize_session=False)
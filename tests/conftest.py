@@ -0,0 +1,9 @@
+"""
+Testler için ortak ayarlar.
+Uygulama modülleri depo kökünde durduğundan kök dizin içe aktarma yoluna eklenir.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,57 @@
+"""Akış halinde toplu analizde satır okuma testleri."""
+
+import io
+import pytest
+
+pytest.importorskip('nltk')
+pytest.importorskip('textblob')
+pytest.importorskip('langdetect')
+pytest.importorskip('requests')
+pytest.importorskip('sqlalchemy')
+
+from bulk_analysis import iter_lines, iter_records, parse_line
+
+class CountingStream(io.BytesIO):
+    """readline çağrılarında istenen en büyük boyutu kaydeden akış."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.largest_read = 0
+
+    def readline(self, size=-1):
+        line = super().readline(size)
+        self.largest_read = max(self.largest_read, len(line))
+        return line
+
+def test_json_object_and_string():
+    assert parse_line('{"id": 7, "text": "merhaba"}') == (7, 'merhaba', None)
+    assert parse_line('"merhaba dünya"') == (None, 'merhaba dünya', None)
+    assert parse_line('   ') is None
+
+def test_quoted_plain_text_falls_back_to_text():
+    line = '"Harika" dedi ve gitti'
+
+    assert parse_line(line) == (None, line, None)
+
+def test_invalid_json_object_is_an_error():
+    assert parse_line('{"text": ') == (None, None, 'Invalid JSON')
+
+def test_long_line_is_rejected_without_reading_it_whole():
+    stream = CountingStream(b'ilk satir\n' + b'a' * 100000 + b'\nson satir\n')
+
+    records = list(iter_records(stream, max_length=100))
+
+    assert [(line_no, text, error) for line_no, record_id, text, error in records] == [
+        (1, 'ilk satir', None),
+        (2, None, 'Line exceeds 100 characters'),
+        (3, 'son satir', None),
+    ]
+    assert stream.largest_read <= 102
+
+def test_line_at_limit_is_accepted():
+    stream = io.StringIO('a' * 100 + '\r\n' + 'b' * 100)
+
+    assert list(iter_lines(stream, max_length=100)) == ['a' * 100 + '\r\n', 'b' * 100]
+
+def test_line_limit_for_plain_iterables():
+    assert list(iter_lines(['kısa', 'x' * 101], max_length=100)) == ['kısa', None]
@@ -0,0 +1,52 @@
+"""Önbellek seviyeleri testleri."""
+
+import time
+from cache import LRUCache, SQLiteCache, TieredCache, create_cache
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.stats()['evictions'] == 1
+
+def test_lru_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    cache = LRUCache(maxsize=10, ttl=60)
+    cache.set('a', 1)
+
+    now[0] += 61
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+def test_promoted_entry_keeps_remaining_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    path = str(tmp_path / 'cache.db')
+
+    # Kayıt başka bir worker tarafından 50 saniye önce diske yazılmış olsun
+    create_cache(maxsize=10, ttl=60, path=path).set('key', 'value')
+    now[0] += 50
+    cache = create_cache(maxsize=10, ttl=60, path=path)
+
+    assert cache.get('key') == 'value'
+    assert len(cache.memory) == 1
+
+    # Bellekteki kopya diskteki kayıtla aynı anda geçersiz olur (taze 60 saniye başlamaz)
+    now[0] += 11
+    assert cache.memory.get('key') is None
+    assert cache.get('key') is None
+
+def test_disk_entry_without_ttl(tmp_path):
+    disk = SQLiteCache(str(tmp_path / 'cache.db'))
+    cache = TieredCache(LRUCache(maxsize=10), disk)
+    disk.set('key', {'a': 1})
+
+    assert disk.get_entry('key') == ({'a': 1}, None)
+    assert cache.get('key') == {'a': 1}
+    assert cache.memory.get('key') == {'a': 1}
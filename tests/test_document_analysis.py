@@ -0,0 +1,92 @@
+"""Belgelerin cümlelere ve bölümlere ayrılması testleri."""
+
+import io
+import re
+import pytest
+
+pytest.importorskip('nltk')
+pytest.importorskip('textblob')
+pytest.importorskip('langdetect')
+pytest.importorskip('requests')
+pytest.importorskip('sqlalchemy')
+
+import document_analysis
+from document_analysis import iter_segments, iter_sentences
+
+def simple_sent_tokenize(text):
+    """NLTK verisi gerektirmeyen basit cümle bölücü."""
+    return [sentence for sentence in re.split(r'(?<=[.!?])\s+', text) if sentence]
+
+@pytest.fixture
+def tokenized(monkeypatch):
+    """sent_tokenize'a verilen metinlerin uzunluklarını kaydeder."""
+    lengths = []
+
+    def sent_tokenize(text):
+        lengths.append(len(text))
+        return simple_sent_tokenize(text)
+
+    monkeypatch.setattr(document_analysis, 'sent_tokenize', sent_tokenize)
+    return lengths
+
+def test_unpunctuated_stream_keeps_buffer_bounded(tokenized):
+    max_buffer = 400
+    lines = ('kelime ' * 8 for _ in range(5000))
+
+    pieces = list(iter_sentences(lines, max_buffer=max_buffer))
+
+    # Tampon sınırlı kalır: hiçbir bölme çağrısı sınırın bir satırdan fazlasını görmez
+    assert max(tokenized) < max_buffer + 64
+    # Yeniden bölme toplam girdiyle doğrusal kalır
+    assert sum(tokenized) < 3 * 5000 * len('kelime ' * 8)
+    assert all(len(piece) <= max_buffer for piece in pieces)
+    assert sum(piece.count('kelime') for piece in pieces) == 5000 * 8
+
+class RecordingStream(io.BytesIO):
+    """Her readline çağrısında istenen ve okunan boyutu kaydeden akış."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def readline(self, size=-1):
+        line = super().readline(size)
+        self.reads.append((size, len(line)))
+        return line
+
+def test_single_line_stream_is_read_incrementally(tokenized):
+    max_buffer = 4000
+    sentence = 'Çok güzel bir gün geçirdik. '
+    count = 100000
+    stream = RecordingStream((sentence * count).encode('utf-8'))
+    assert len(stream.getvalue()) > 3 * 1024 * 1024
+
+    sentences = iter_sentences(stream, max_buffer=max_buffer)
+    first = next(sentences)
+
+    # İlk cümle akışın yalnızca başı okunarak üretilir
+    assert first == sentence.strip()
+    assert stream.tell() <= 2 * max_buffer
+    rest = list(sentences)
+
+    assert len(rest) + 1 == count
+    assert set(rest) == {sentence.strip()}
+    # Hiçbir okuma sınırı aşmaz ve satırın tamamı tek seferde okunmaz
+    assert all(0 < size <= max_buffer // 2 for size, _ in stream.reads)
+    assert max(read for _, read in stream.reads) <= max_buffer // 2
+    assert max(tokenized) < 2 * max_buffer
+
+def test_sentences_split_across_lines(tokenized):
+    lines = ['Birinci cümle. İkinci', 'cümle devam ediyor.', '', 'Üçüncü cümle.']
+
+    assert list(iter_sentences(lines)) == [
+        'Birinci cümle.', 'İkinci cümle devam ediyor.', 'Üçüncü cümle.'
+    ]
+
+def test_segments_respect_max_chars():
+    sentences = ['a' * 30, 'b' * 30, 'c' * 30, 'uzun ' * 40]
+
+    segments = list(iter_segments(sentences, max_chars=70))
+
+    assert all(len(segment) <= 70 for segment in segments)
+    assert segments[0] == 'a' * 30 + ' ' + 'b' * 30
@@ -0,0 +1,37 @@
+"""prometheus_client kurulu olmadan metrik modülünün davranışı testleri."""
+
+import builtins
+import importlib
+import sys
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+@pytest.fixture
+def metrics_without_prometheus(monkeypatch):
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == 'prometheus_client' or name.startswith('prometheus_client.'):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', fake_import)
+    monkeypatch.delitem(sys.modules, 'metrics', raising=False)
+    module = importlib.import_module('metrics')
+    yield module
+    sys.modules.pop('metrics', None)
+
+def test_observers_are_noops_without_prometheus(metrics_without_prometheus):
+    metrics = metrics_without_prometheus
+
+    assert not metrics.METRICS_AVAILABLE
+    started = metrics.start_request()
+    metrics.observe_request('GET', 'index', 200, started)
+    metrics.observe_analysis('tr', 'Pozitif')
+    metrics.observe_translation('stub', 'success', 0.01)
+    metrics.observe_sentiment_batch('transformer', 4, 0.02)
+    metrics.mark_process_dead(12345)
+
+    with pytest.raises(RuntimeError):
+        metrics.render_metrics()
@@ -0,0 +1,119 @@
+"""Duygu analizi hattının paylaşılan analiz bağlamı testleri."""
+
+import pytest
+
+pytest.importorskip('nltk')
+pytest.importorskip('textblob')
+pytest.importorskip('langdetect')
+pytest.importorskip('requests')
+pytest.importorskip('sqlalchemy')
+
+import sentiment_analyzer
+import sentiment_backends
+import translation
+from circuit_breaker import CircuitBreaker
+
+TURKISH_TEXT = 'Bugün çok mutluyum, harika bir gün geçirdim'
+ENGLISH_TEXT = 'I am very happy today, I had a great day'
+
+class FixedSentimentBackend(sentiment_backends.SentimentBackend):
+    """Her metne aynı puanları veren sahte sağlayıcı."""
+
+    name = 'fixed'
+
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, text):
+        self.calls += 1
+        return 0.8, 0.9
+
+@pytest.fixture
+def translator(monkeypatch):
+    backend = translation.StubTranslationBackend({('tr', 'en', TURKISH_TEXT): ENGLISH_TEXT})
+    monkeypatch.setattr(translation, '_backend', backend)
+    monkeypatch.setattr(translation, 'translation_breaker', CircuitBreaker('test'))
+    monkeypatch.setattr(sentiment_backends, '_backend', FixedSentimentBackend())
+    translation.translation_cache.clear()
+    sentiment_analyzer.result_cache.clear()
+    yield backend
+    translation.translation_cache.clear()
+    sentiment_analyzer.result_cache.clear()
+
+def count_calls(monkeypatch, module, name):
+    """Modüldeki fonksiyonun çağrı sayısını tutan bir sarmalayıcı yerleştirir."""
+    calls = []
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+def test_non_english_text_is_translated_once(translator):
+    result = sentiment_analyzer.analyze_sentiment(TURKISH_TEXT)
+
+    assert result['language_code'] == 'tr'
+    assert result['translated_text'] == ENGLISH_TEXT
+    assert translator.calls == 1
+
+def test_emotion_and_highlight_stages_reuse_context(monkeypatch, translator):
+    contexts = count_calls(monkeypatch, sentiment_analyzer, 'build_analysis_context')
+    tokenizations = count_calls(monkeypatch, sentiment_analyzer, 'word_tokenize')
+    scorer = sentiment_backends.get_sentiment_backend()
+
+    result = sentiment_analyzer.analyze_sentiment(TURKISH_TEXT)
+
+    assert len(contexts) == 1
+    assert len(tokenizations) == 1
+    assert scorer.calls == 1
+    assert translator.calls == 1
+    assert result['emotion_scores']['happiness'] > 0
+    assert any(item['word'] == 'happy' for item in result['highlighted_emotions'])
+
+def test_stages_do_not_rebuild_given_context(monkeypatch, translator):
+    context = sentiment_analyzer.build_analysis_context(TURKISH_TEXT, 'tr')
+    contexts = count_calls(monkeypatch, sentiment_analyzer, 'build_analysis_context')
+
+    sentiment_analyzer.analyze_detailed_emotions(TURKISH_TEXT, 'tr', context)
+    sentiment_analyzer.highlight_emotional_words(TURKISH_TEXT, 'tr', context)
+
+    assert contexts == []
+    assert translator.calls == 1
+
+class FailingTranslationBackend(translation.StubTranslationBackend):
+    """Her çağrıda sağlayıcı hatası veren sahte sağlayıcı."""
+
+    def translate(self, text, source_lang, target_lang):
+        super().translate(text, source_lang, target_lang)
+        raise ConnectionError('sağlayıcıya ulaşılamadı')
+
+def test_failed_translation_is_not_cached(monkeypatch, translator):
+    backend = FailingTranslationBackend()
+    monkeypatch.setattr(translation, '_backend', backend)
+
+    first = sentiment_analyzer.analyze_sentiment(TURKISH_TEXT)
+    sentiment_analyzer.analyze_sentiment(TURKISH_TEXT)
+
+    assert first['translated_text'] == TURKISH_TEXT
+    assert backend.calls == 2
+
+def test_translation_equal_to_original_is_cached(translator):
+    text = 'Çok güzel İstanbul'
+    translator.translations[('tr', 'en', text)] = text
+
+    sentiment_analyzer.analyze_sentiment(text)
+    sentiment_analyzer.analyze_sentiment(text)
+
+    assert translator.calls == 1
+
+def test_batch_skips_model_for_local_lexicon_texts(monkeypatch, translator):
+    monkeypatch.setattr(translation, '_backend', FailingTranslationBackend())
+    scorer = sentiment_backends.get_sentiment_backend()
+
+    results = sentiment_analyzer.analyze_sentiment_batch(['Bu ürün berbat, hiç beğenmedim'])
+
+    assert results[0]['sentiment'] == 'Negatif'
+    assert scorer.calls == 0
@@ -0,0 +1,49 @@
+"""Duygu puanlama sağlayıcılarının etiket eşleme testleri."""
+
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+from sentiment_backends import TextBlobBackend, TransformerBackend, parse_label_mapping, resolve_labels
+
+# Hugging Face model ayarlarındaki id2label değerleri
+SST2_ID2LABEL = {0: 'NEGATIVE', 1: 'POSITIVE'}  # distilbert-base-uncased-finetuned-sst-2-english
+CARDIFF_LATEST_ID2LABEL = {0: 'negative', 1: 'neutral', 2: 'positive'}  # twitter-roberta-base-sentiment-latest
+CARDIFF_ID2LABEL = {0: 'LABEL_0', 1: 'LABEL_1', 2: 'LABEL_2'}  # twitter-roberta-base-sentiment
+NLPTOWN_ID2LABEL = {0: '1 star', 1: '2 stars', 2: '3 stars', 3: '4 stars', 4: '5 stars'}
+
+def test_binary_model_labels():
+    assert resolve_labels(SST2_ID2LABEL) == (1, 0, None)
+
+def test_three_class_model_labels():
+    assert resolve_labels(CARDIFF_LATEST_ID2LABEL) == (2, 0, 1)
+
+def test_config_json_string_indexes():
+    assert resolve_labels({'0': 'NEGATIVE', '1': 'POSITIVE'}) == (1, 0, None)
+
+@pytest.mark.parametrize('id2label', [CARDIFF_ID2LABEL, NLPTOWN_ID2LABEL])
+def test_ambiguous_labels_fail(id2label):
+    with pytest.raises(ValueError):
+        resolve_labels(id2label)
+
+def test_explicit_mapping_for_generic_labels():
+    mapping = parse_label_mapping('negative=LABEL_0, neutral=LABEL_1, positive=LABEL_2')
+
+    assert resolve_labels(CARDIFF_ID2LABEL, mapping) == (2, 0, 1)
+
+def test_mapping_must_name_existing_labels():
+    with pytest.raises(ValueError):
+        resolve_labels(CARDIFF_ID2LABEL, parse_label_mapping('negative=LABEL_0,positive=LABEL_3'))
+
+def test_mapping_must_include_positive_and_negative():
+    with pytest.raises(ValueError):
+        resolve_labels(CARDIFF_ID2LABEL, parse_label_mapping('neutral=LABEL_1'))
+
+@pytest.mark.parametrize('value', ['LABEL_0', 'happy=LABEL_0', 'positive='])
+def test_invalid_mapping_fails_at_construction(value):
+    with pytest.raises(ValueError):
+        TransformerBackend(labels=value)
+
+def test_neutral_threshold_per_backend():
+    assert TextBlobBackend().neutral_threshold == 0.05
+    assert TransformerBackend(neutral_threshold=0.4).neutral_threshold == 0.4
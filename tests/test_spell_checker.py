@@ -0,0 +1,56 @@
+"""Yazım düzeltici testleri."""
+
+import random
+import pytest
+from spell_checker import SpellChecker, edits1
+
+FREQUENCIES = {'the': 100, 'then': 40, 'they': 60, 'hello': 20, 'help': 30,
+               'world': 25, 'word': 35, 'sword': 5, 'quiet': 8, 'quite': 12}
+
+def textblob_suggest(frequencies, word):
+    """TextBlob'un aday seçimini birebir uygulayan başvuru düzeltmesi."""
+    if word in frequencies:
+        return word
+    candidates = ({w for w in edits1(word) if w in frequencies}
+                  or {w2 for w1 in edits1(word) for w2 in edits1(w1) if w2 in frequencies})
+    return max(candidates, key=lambda w: (frequencies[w], w)) if candidates else word
+
+def test_distance_one_operations():
+    checker = SpellChecker(FREQUENCIES)
+    assert checker.lookup('teh') == 'the'      # yer değiştirme
+    assert checker.lookup('wrld') == 'world'   # ekleme
+    assert checker.lookup('worlds') == 'world' # silme
+    assert checker.lookup('wprld') == 'world'  # değiştirme
+
+def test_prefers_frequent_candidate_and_distance_one():
+    checker = SpellChecker(FREQUENCIES)
+    # 'thex' -> 'then' ve 'they' 1 uzaklıkta; 'the' de 1 uzaklıkta ve en sık
+    assert checker.lookup('thex') == 'the'
+    # 'helo' -> 'hello' ve daha sık olan 'help' 1 uzaklıkta
+    assert checker.lookup('helo') == 'help'
+    # 'swrd' -> 'sword' 1 uzaklıkta; daha sık olan 'word' 2 uzaklıkta
+    assert checker.lookup('swrd') == 'sword'
+
+def test_distance_two_only_without_distance_one():
+    checker = SpellChecker(FREQUENCIES)
+    assert checker.lookup('qieut') == 'quiet'
+    assert SpellChecker(FREQUENCIES, max_edit_distance=1).lookup('qieut') == 'qieut'
+
+def test_keeps_case_and_unknown_words():
+    checker = SpellChecker(FREQUENCIES)
+    assert checker.correct('Teh wprld, xyzzyq!') == 'The world, xyzzyq!'
+
+def test_matches_textblob_selection_on_random_words():
+    rng = random.Random(3)
+    checker = SpellChecker(FREQUENCIES)
+    for _ in range(300):
+        word = ''.join(rng.choice('dehlopqrstuwy') for _ in range(rng.randint(2, 6)))
+        assert checker.lookup(word) == textblob_suggest(FREQUENCIES, word), word
+
+def test_matches_textblob_correct():
+    textblob = pytest.importorskip('textblob')
+    from benchmark import make_misspelled_text
+    checker = SpellChecker.from_file()
+    words = sorted(checker.frequencies, key=checker.frequencies.get, reverse=True)[:2000]
+    text = make_misspelled_text(words, 300, error_rate=0.3)
+    assert checker.correct(text) == str(textblob.TextBlob(text).correct())
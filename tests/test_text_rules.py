@@ -0,0 +1,94 @@
+"""Metin iyileştirme kural motoru testleri."""
+
+import json
+import os
+import time
+import pytest
+from text_rules import TextRules, get_text_rules
+
+def write_rules(path, tables):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tables, f)
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = str(tmp_path / 'rules.json')
+    write_rules(path, {
+        'negative_to_positive': {
+            'en': {'good': ['great'], 'not good': ['fine']},
+            'tr': {'kötü': ['iyi']}
+        }
+    })
+    return path
+
+def test_turkish_multiword_phrase():
+    words, changes = get_text_rules().replace('negative_to_positive', 'tr', 'büyük bir hayal kırıklığı yaşadım'.split())
+
+    assert ' '.join(words) == 'büyük bir memnuniyet yaşadım'
+    assert changes == [{'original': 'hayal kırıklığı', 'improved': 'memnuniyet', 'position': 2}]
+
+def test_several_replacements_in_one_text():
+    words, changes = get_text_rules().replace('negative_to_positive', 'tr', 'çok endişeli ve kızgın'.split())
+
+    assert ' '.join(words) == 'çok kendinden emin ve sakin'
+    assert len(changes) == 2
+
+def test_english_single_word():
+    words, changes = get_text_rules().replace('negative_to_positive', 'en', 'the delivery was terrible'.split())
+
+    assert ' '.join(words) == 'the delivery was excellent'
+
+def test_longest_match_wins(rules_path):
+    rules = TextRules(rules_path, check_interval=0)
+
+    words, changes = rules.replace('negative_to_positive', 'en', 'it is not good , good'.split())
+
+    assert ' '.join(words) == 'it is fine , great'
+    assert [change['original'] for change in changes] == ['not good', 'good']
+
+def test_tables_are_per_language(rules_path):
+    rules = TextRules(rules_path, check_interval=0)
+
+    assert rules.has_rules('negative_to_positive', 'en')
+    assert rules.has_rules('negative_to_positive', 'tr')
+    assert not rules.has_rules('negative_to_positive', 'de')
+    assert not rules.has_rules('alternative_expressions', 'en')
+
+    assert rules.find('negative_to_positive', 'tr', ['good']) == []
+    assert rules.find('negative_to_positive', 'en', ['kötü']) == []
+    assert rules.find('negative_to_positive', 'de', ['good']) == []
+    assert rules.replace('negative_to_positive', 'tr', ['çok', 'kötü'])[0] == ['çok', 'iyi']
+
+def test_reload_on_mtime_change(rules_path):
+    rules = TextRules(rules_path, check_interval=0)
+
+    write_rules(rules_path, {'negative_to_positive': {'en': {'not good at all': ['excellent']}}})
+    later = time.time() + 10
+    os.utime(rules_path, (later, later))
+    rules.reload_if_changed()
+
+    words, changes = rules.replace('negative_to_positive', 'en', 'not good at all'.split())
+    assert ' '.join(words) == 'excellent'
+    assert not rules.has_rules('negative_to_positive', 'tr')
+
+def test_reload_is_throttled(rules_path):
+    rules = TextRules(rules_path, check_interval=3600)
+    rules.reload_if_changed()
+
+    write_rules(rules_path, {'negative_to_positive': {'en': {'good': ['superb']}}})
+    later = time.time() + 10
+    os.utime(rules_path, (later, later))
+    rules.reload_if_changed()
+
+    assert rules.replace('negative_to_positive', 'en', ['good'])[0] == ['great']
+
+def test_invalid_file_keeps_previous_rules(rules_path):
+    rules = TextRules(rules_path, check_interval=0)
+
+    with open(rules_path, 'w', encoding='utf-8') as f:
+        f.write('{"negative_to_positive": ')
+    later = time.time() + 10
+    os.utime(rules_path, (later, later))
+    rules.reload_if_changed()
+
+    assert rules.replace('negative_to_positive', 'en', ['good'])[0] == ['great']
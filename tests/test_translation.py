@@ -0,0 +1,47 @@
+"""translate_text ve çeviri devre kesicisi testleri."""
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('sqlalchemy')
+
+import translation
+from circuit_breaker import CLOSED, OPEN, CircuitBreaker
+
+class FailingBackend(translation.TranslationBackend):
+    """Her çağrıda sağlayıcı hatası veren sahte sağlayıcı."""
+
+    name = 'failing'
+
+    def translate(self, text, source_lang, target_lang):
+        raise ConnectionError('sağlayıcıya ulaşılamadı')
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker('test', window_size=10, min_calls=2, failure_rate=0.5, open_seconds=60)
+    monkeypatch.setattr(translation, 'translation_breaker', breaker)
+    return breaker
+
+def test_over_length_texts_do_not_open_breaker(monkeypatch, breaker):
+    backend = translation.StubTranslationBackend()
+    monkeypatch.setattr(translation, '_backend', backend)
+    text = 'a' * (translation.MAX_TRANSLATION_LENGTH + 1)
+
+    for _ in range(10):
+        with pytest.raises(translation.TranslationError):
+            translation.translate_text(text, 'tr', 'en')
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()['failed_calls'] == 0
+    assert backend.calls == 0
+
+def test_provider_failures_open_breaker(monkeypatch, breaker):
+    monkeypatch.setattr(translation, '_backend', FailingBackend())
+
+    for i in range(2):
+        with pytest.raises(ConnectionError):
+            translation.translate_text(f'merhaba {i}', 'tr', 'en')
+
+    assert breaker.state == OPEN
+    with pytest.raises(translation.TranslationUnavailableError):
+        translation.translate_text('merhaba dünya', 'tr', 'en')
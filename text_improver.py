@@ -6,44 +6,15 @@ alternatif ifade önerileri gibi işlevleri sağlar.
 
 import re
 import json
-import nltk
 from nltk.tokenize import word_tokenize
 from textblob import TextBlob
-from deep_translator import GoogleTranslator
+from translation import translate_text
+from spell_checker import get_spell_checker
+from text_rules import get_text_rules
 from sentiment_analyzer import EMOTION_KEYWORDS, translate_to_english
 
-# NLTK kaynaklarını kontrol et ve indir
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-# Negatif ifadelerin pozitif alternatifleri
-NEGATIVE_TO_POSITIVE = {
-    # İngilizce
-    'bad': ['good', 'nice', 'pleasant'],
-    'terrible': ['excellent', 'wonderful', 'great'],
-    'awful': ['awesome', 'amazing', 'fantastic'],
-    'hate': ['like', 'appreciate', 'enjoy'],
-    'dislike': ['like', 'enjoy', 'appreciate'],
-    'angry': ['calm', 'composed', 'understanding'],
-    'sad': ['happy', 'cheerful', 'joyful'],
-    'disappointed': ['satisfied', 'pleased', 'content'],
-    'worried': ['confident', 'assured', 'optimistic'],
-    'annoyed': ['pleased', 'content', 'satisfied'],
-    
-    # Türkçe
-    'kötü': ['iyi', 'güzel', 'hoş'],
-    'berbat': ['mükemmel', 'harika', 'muhteşem'],
-    'korkunç': ['harika', 'şahane', 'mükemmel'],
-    'nefret': ['sevgi', 'beğeni', 'takdir'],
-    'sevmiyorum': ['seviyorum', 'beğeniyorum', 'takdir ediyorum'],
-    'kızgın': ['sakin', 'anlayışlı', 'huzurlu'],
-    'üzgün': ['mutlu', 'neşeli', 'keyifli'],
-    'hayal kırıklığı': ['memnuniyet', 'tatmin', 'hoşnutluk'],
-    'endişeli': ['kendinden emin', 'iyimser', 'umutlu'],
-    'rahatsız': ['memnun', 'hoşnut', 'tatmin']
-}
+# Dilbilgisi düzeltmesi yapılacak en uzun metin (karakter)
+MAX_CORRECTION_LENGTH = 20000
 
 def improve_negative_text(text, lang_code):
     """
@@ -75,32 +46,27 @@ def improve_negative_text(text, lang_code):
             'message': 'Metin zaten pozitif tonda, değişiklik yapılmadı.'
         }
     
+    rules = get_text_rules()
+    
+    # Dil için kendi kuralları varsa orijinal metinde, yoksa İngilizce çeviride eşleştir
+    if rules.has_rules('negative_to_positive', lang_code):
+        rule_lang, source_text = lang_code, text
+    else:
+        rule_lang, source_text = 'en', en_text
+    
     # Metni kelimelere ayır
-    words = word_tokenize(en_text.lower())
-    
-    # Negatif kelimeleri tespit et ve değiştir
-    improved_words = words.copy()
-    changes = []
-    
-    for i, word in enumerate(words):
-        if word in NEGATIVE_TO_POSITIVE:
-            # Rastgele bir pozitif alternatif seç
-            positive_alt = NEGATIVE_TO_POSITIVE[word][0]
-            improved_words[i] = positive_alt
-            changes.append({
-                'original': word,
-                'improved': positive_alt,
-                'position': i
-            })
+    words = word_tokenize(source_text.lower())
+    
+    # Negatif kelime ve ifadeleri (örn. 'hayal kırıklığı') tespit et ve değiştir
+    improved_words, changes = rules.replace('negative_to_positive', rule_lang, words)
     
     # İyileştirilmiş metni oluştur
     improved_text = ' '.join(improved_words)
     
-    # Eğer orijinal dil İngilizce değilse, geri çevir
-    if lang_code != 'en':
+    # Kurallar İngilizce çeviriye uygulandıysa metni orijinal dile geri çevir
+    if rule_lang != lang_code:
         try:
-            translator = GoogleTranslator(source='en', target=lang_code)
-            improved_text = translator.translate(improved_text)
+            improved_text = translate_text(improved_text, 'en', lang_code)
         except Exception as e:
             print(f"Çeviri hatası: {e}")
     
@@ -123,10 +89,18 @@ def correct_grammar(text, lang_code):
     Returns:
         dict: Orijinal metin ve düzeltilmiş metin içeren sözlük
     """
-    # Şu anda sadece İngilizce için TextBlob dilbilgisi düzeltmesi destekleniyor
+    # Şu anda sadece İngilizce için dilbilgisi düzeltmesi destekleniyor
     if lang_code == 'en':
-        blob = TextBlob(text)
-        corrected_text = str(blob.correct())
+        if len(text) > MAX_CORRECTION_LENGTH:
+            return {
+                'original_text': text,
+                'corrected_text': text,
+                'changes_made': False,
+                'message': f"Dilbilgisi düzeltmesi {MAX_CORRECTION_LENGTH} karakterden uzun metinler için yapılmıyor."
+            }
+        
+        # TextBlob'un kelime frekans verisiyle simetrik silme dizini üzerinden düzelt
+        corrected_text = get_spell_checker().correct(text)
         
         # Değişiklik olup olmadığını kontrol et
         changes_made = corrected_text != text
@@ -158,54 +132,27 @@ def suggest_alternative_expressions(text, lang_code, sentiment):
     Returns:
         dict: Orijinal metin ve alternatif ifadeler içeren sözlük
     """
-    # Metni İngilizce'ye çevir (eğer İngilizce değilse)
-    if lang_code != 'en':
-        en_text = translate_to_english(text, lang_code)
+    rules = get_text_rules()
+    
+    # Dil için kendi kuralları varsa orijinal metinde, yoksa İngilizce çeviride eşleştir
+    if rules.has_rules('alternative_expressions', lang_code):
+        rule_lang, source_text = lang_code, text
+    elif lang_code != 'en':
+        rule_lang, source_text = 'en', translate_to_english(text, lang_code)
     else:
-        en_text = text
+        rule_lang, source_text = 'en', text
     
     # Metni kelimelere ayır
-    words = word_tokenize(en_text.lower())
-    
-    # Yaygın ifadeler ve alternatifleri
-    common_expressions = {
-        'good': ['great', 'excellent', 'fantastic', 'wonderful'],
-        'bad': ['poor', 'terrible', 'awful', 'unpleasant'],
-        'happy': ['joyful', 'delighted', 'pleased', 'thrilled'],
-        'sad': ['unhappy', 'depressed', 'gloomy', 'melancholy'],
-        'big': ['large', 'enormous', 'massive', 'substantial'],
-        'small': ['tiny', 'little', 'miniature', 'compact'],
-        'important': ['crucial', 'essential', 'vital', 'significant'],
-        'difficult': ['challenging', 'demanding', 'tough', 'arduous'],
-        'easy': ['simple', 'straightforward', 'effortless', 'uncomplicated'],
-        'interesting': ['fascinating', 'intriguing', 'captivating', 'engaging']
-    }
-    
-    # Türkçe ifadeler
-    if lang_code == 'tr':
-        common_expressions = {
-            'iyi': ['harika', 'mükemmel', 'muhteşem', 'hayranlık verici'],
-            'kötü': ['berbat', 'korkunç', 'fena', 'hoş olmayan'],
-            'mutlu': ['neşeli', 'sevinçli', 'keyifli', 'memnun'],
-            'üzgün': ['mutsuz', 'kederli', 'karamsar', 'melankolik'],
-            'büyük': ['kocaman', 'devasa', 'muazzam', 'geniş'],
-            'küçük': ['minik', 'ufak', 'minyatür', 'kompakt'],
-            'önemli': ['hayati', 'kritik', 'elzem', 'mühim'],
-            'zor': ['çetin', 'meşakkatli', 'güç', 'zorlu'],
-            'kolay': ['basit', 'zahmetsiz', 'çaba gerektirmeyen', 'anlaşılır'],
-            'ilginç': ['merak uyandırıcı', 'etkileyici', 'büyüleyici', 'sürükleyici']
-        }
+    words = word_tokenize(source_text.lower())
     
     # Alternatif ifadeleri bul
     alternatives = []
-    
-    for i, word in enumerate(words):
-        if word in common_expressions:
-            alternatives.append({
-                'original': word,
-                'alternatives': common_expressions[word],
-                'position': i
-            })
+    for start, end, phrase, phrase_alternatives in rules.find('alternative_expressions', rule_lang, words):
+        alternatives.append({
+            'original': phrase,
+            'alternatives': phrase_alternatives,
+            'position': start
+        })
     
     return {
         'original_text': text,
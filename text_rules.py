@@ -0,0 +1,130 @@
+"""
+Metin iyileştirme kuralları için modül.
+Bu modül, negatif ifadelerin pozitif karşılıklarını ve alternatif ifade
+önerilerini dil bazında bir JSON veri dosyasından (text_rules.json) yükler ve
+her dil için bir kez derlenmiş ifade eşleştiricisi oluşturur. Veri dosyası
+değiştirildiğinde kurallar worker'lar yeniden başlatılmadan yeniden yüklenir.
+
+Veri dosyası biçimi:
+    {"<tablo>": {"<dil kodu>": {"<ifade>": ["<alternatif>", ...]}}}
+"""
+
+import json
+import os
+import threading
+import time
+from phrase_matcher import PhraseMatcher
+
+TEXT_RULES_PATH = os.environ.get('TEXT_RULES_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'text_rules.json'))
+# Veri dosyasının değişip değişmediğinin en sık kontrol edileceği aralık (saniye)
+TEXT_RULES_CHECK_INTERVAL = float(os.environ.get('TEXT_RULES_CHECK_INTERVAL', 5))
+
+class TextRules:
+    """
+    Dil bazında derlenmiş değiştirme tabloları.
+
+    Args:
+        path (str): JSON veri dosyası
+        check_interval (float): Dosya değişikliği kontrolleri arasındaki en kısa süre (saniye)
+    """
+
+    def __init__(self, path=TEXT_RULES_PATH, check_interval=TEXT_RULES_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self.state = ({}, {})
+        self.mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def reload(self):
+        """Veri dosyasını okur ve eşleştiricileri yeniden derler."""
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, encoding='utf-8') as f:
+            tables = json.load(f)
+
+        rules = {}
+        matchers = {}
+        for table, languages in tables.items():
+            for lang_code, language_rules in languages.items():
+                key = (table, lang_code)
+                rules[key] = {phrase.lower(): alternatives for phrase, alternatives in language_rules.items()}
+                matchers[key] = PhraseMatcher()
+                for phrase in rules[key]:
+                    matchers[key].add(phrase, phrase)
+
+        # Yeni tablolar tek atamayla devreye girer; okuyan thread'ler eski veya yeni tabloyu bütün olarak görür
+        self.state = (rules, matchers)
+        self.mtime = mtime
+
+    def reload_if_changed(self):
+        """Veri dosyası son yüklemeden sonra değiştiyse kuralları yeniden yükler."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                if os.path.getmtime(self.path) != self.mtime:
+                    self.reload()
+            except (OSError, ValueError) as e:
+                # Hatalı veya yarım yazılmış dosyada eski kurallarla devam et
+                print(f"Kural dosyası yüklenemedi: {e}")
+
+    def has_rules(self, table, lang_code):
+        """Verilen tabloda dil için kural olup olmadığını döndürür."""
+        return (table, lang_code) in self.state[1]
+
+    def find(self, table, lang_code, tokens):
+        """
+        Kelime dizisindeki kural eşleşmelerini (çakışmayan en uzun ifadeler) döndürür.
+
+        Args:
+            table (str): 'negative_to_positive' veya 'alternative_expressions'
+            lang_code (str): Kuralların dili
+            tokens (list): Küçük harfe çevrilmiş kelimeler
+
+        Returns:
+            list: (başlangıç konumu, bitiş konumu, ifade, alternatifler) dörtlüleri
+        """
+        rules, matchers = self.state
+        matcher = matchers.get((table, lang_code))
+        if matcher is None:
+            return []
+        language_rules = rules[(table, lang_code)]
+        return [(start, end, phrase, language_rules[values[0]])
+                for start, end, phrase, values in matcher.find_longest(tokens)]
+
+    def replace(self, table, lang_code, tokens):
+        """
+        Eşleşen ifadeleri ilk alternatifleriyle değiştirir.
+
+        Returns:
+            tuple: (yeni kelime listesi, değişiklik listesi)
+        """
+        result = []
+        changes = []
+        position = 0
+        for start, end, phrase, alternatives in self.find(table, lang_code, tokens):
+            result.extend(tokens[position:start])
+            result.append(alternatives[0])
+            changes.append({'original': phrase, 'improved': alternatives[0], 'position': start})
+            position = end
+        result.extend(tokens[position:])
+        return result, changes
+
+_rules = None
+_rules_lock = threading.Lock()
+
+def get_text_rules():
+    """Yüklenmiş kuralları döndürür; veri dosyası değiştiyse önce yeniden yükler."""
+    global _rules
+    if _rules is None:
+        with _rules_lock:
+            if _rules is None:
+                _rules = TextRules()
+    else:
+        _rules.reload_if_changed()
+    return _rules
@@ -0,0 +1,202 @@
+"""
+İstek bazında aşama süresi ölçümü (tracing) için modül.
+Bu modül, analiz hattının aşamalarını (temizleme, dil tespiti, çeviri, TextBlob,
+duygu skorları, veritabanı yazma vb.) span adı verilen bağlam yöneticileriyle
+ölçer. Her isteğin aşama süreleri bir iz (trace) nesnesinde toplanır, istek
+bitince route ve aşama bazında histogramlara eklenir.
+
+İzleme kapalıyken ve istekte debug bayrağı yokken span() paylaşılan ve hiçbir
+şey yapmayan bir nesne döndürür; ölçümün maliyeti tek bir değişken okumasıdır.
+
+Kullanım:
+    with span('detect_language'):
+        lang_code, lang_name = detect_language(text)
+"""
+
+import contextvars
+import os
+import threading
+import time
+
+# Tüm istekler izlensin mi (kapalıyken yalnızca ?debug=1 ile gelen istekler izlenir)
+TRACING_ENABLED = os.environ.get('TRACING_ENABLED', '0') != '0'
+
+# Histogram kova üst sınırları (saniye)
+TRACING_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Geçerli isteğin izi; iz yoksa span'ler ölçüm yapmaz
+_current_trace = contextvars.ContextVar('trace', default=None)
+
+class _NoopSpan:
+    """İzleme kapalıyken kullanılan, hiçbir şey yapmayan span."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+class Span:
+    """Bir aşamanın süresini ölçüp ize ekleyen bağlam yöneticisi."""
+
+    __slots__ = ('trace', 'name', 'started')
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.trace.add(self.name, time.perf_counter() - self.started)
+        return False
+
+class Trace:
+    """
+    Bir isteğin aşama sürelerini toplar.
+    Aynı aşama istek içinde birden fazla çalışırsa süreleri toplanır.
+
+    Args:
+        name (str): İzin adı (genellikle Flask endpoint adı)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    def add(self, stage, seconds):
+        """Aşama süresini ekler."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def elapsed(self):
+        """İz başladığından beri geçen süre (saniye)."""
+        return time.perf_counter() - self.started
+
+    def timings(self):
+        """API yanıtına eklenecek aşama sürelerini milisaniye cinsinden döndürür."""
+        return {
+            'total_ms': round(self.elapsed() * 1000, 3),
+            'stages': {stage: round(seconds * 1000, 3) for stage, seconds in self.stages.items()}
+        }
+
+class StageHistograms:
+    """
+    İz ve aşama bazında süre histogramları.
+
+    Args:
+        buckets (tuple): Artan sırada kova üst sınırları (saniye)
+    """
+
+    def __init__(self, buckets=TRACING_BUCKETS):
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, stage, seconds):
+        """Bir süre ölçümünü ilgili histograma ekler."""
+        with self._lock:
+            series = self._series.get((name, stage))
+            if series is None:
+                # [kova sayaçları (+Inf dahil), toplam süre, ölçüm sayısı]
+                series = self._series[(name, stage)] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def quantile(self, counts, total, q):
+        """Kova sayaçlarından yüzdelik değerini (kova üst sınırı olarak) tahmin eder."""
+        rank = q * total
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float('inf')
+
+    def snapshot(self):
+        """
+        Histogramların kopyasını döndürür.
+
+        Returns:
+            dict: {iz adı: {aşama: {'count', 'sum', 'mean_ms', 'p50_ms', 'p95_ms', 'buckets'}}}
+        """
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+
+        result = {}
+        for (name, stage), (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                buckets['+Inf' if bound == float('inf') else str(bound)] = cumulative
+            result.setdefault(name, {})[stage] = {
+                'count': count,
+                'sum': total,
+                'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+                'p50_ms': round(self.quantile(counts, count, 0.5) * 1000, 3),
+                'p95_ms': round(self.quantile(counts, count, 0.95) * 1000, 3),
+                'buckets': buckets
+            }
+        return result
+
+    def reset(self):
+        """Tüm histogramları sıfırlar."""
+        with self._lock:
+            self._series.clear()
+
+stage_histograms = StageHistograms()
+
+def span(name):
+    """
+    Geçerli isteğin izine aşama süresi ekleyen bağlam yöneticisi döndürür.
+    Aktif iz yoksa paylaşılan no-op span döner.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return NOOP_SPAN
+    return Span(trace, name)
+
+def current_trace():
+    """Geçerli isteğin izini, yoksa None döndürür."""
+    return _current_trace.get()
+
+def start_trace(name):
+    """Yeni bir iz başlatır ve geçerli iz olarak ayarlar."""
+    trace = Trace(name)
+    _current_trace.set(trace)
+    return trace
+
+def finish_trace():
+    """Geçerli izi bitirir ve aşama sürelerini histogramlara ekler."""
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    _current_trace.set(None)
+
+    stage_histograms.observe(trace.name, 'total', trace.elapsed())
+    for stage, seconds in trace.stages.items():
+        stage_histograms.observe(trace.name, stage, seconds)
+    return trace
+
+def get_tracing_metrics():
+    """İzleme ayarlarını ve aşama süresi histogramlarını döndürür."""
+    return {
+        'enabled': TRACING_ENABLED,
+        'pid': os.getpid(),
+        'histograms': stage_histograms.snapshot()
+    }
@@ -0,0 +1,284 @@
+"""
+Çeviri işlemleri için modül.
+Bu modül, çeviri sağlayıcılarını (backend) ortak bir arayüz arkasında toplar ve
+çevirileri (kaynak dil, hedef dil, metin özeti) anahtarıyla önbelleğe alarak
+aynı ifadelerin tekrar tekrar çevrilmesini önler.
+
+Sağlayıcılar:
+    deep_translator deep_translator.GoogleTranslator (varsayılan, her çağrıda yeni bağlantı)
+    google          Bağlantı havuzlu HTTP oturumu ve zaman aşımı ile Google Translate'in web
+                    arayüzünün ayrıştırılması (isteğe bağlı; TRANSLATION_BACKEND=google)
+    stub            Ağ bağlantısı olmadan çalışan yerel sahte sağlayıcı (testler ve ölçümler için)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from cache import create_cache, make_key
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from metrics import observe_translation
+
+# Çeviri önbelleği ayarları
+TRANSLATION_CACHE_SIZE = int(os.environ.get('TRANSLATION_CACHE_SIZE', 10000))
+TRANSLATION_CACHE_TTL = int(os.environ.get('TRANSLATION_CACHE_TTL', 7 * 24 * 3600))
+# Tanımlanırsa önbellek worker yeniden başlatmalarında korunacak şekilde SQLite dosyasında da tutulur
+TRANSLATION_CACHE_PATH = os.environ.get('TRANSLATION_CACHE_PATH')
+
+# Çeviri sağlayıcısı ayarları
+TRANSLATION_BACKEND = os.environ.get('TRANSLATION_BACKEND', 'deep_translator')
+TRANSLATION_TIMEOUT = float(os.environ.get('TRANSLATION_TIMEOUT', 5))
+TRANSLATION_POOL_SIZE = int(os.environ.get('TRANSLATION_POOL_SIZE', 10))
+# Bir süreçte aynı anda yapılabilecek en fazla çeviri isteği
+TRANSLATION_MAX_CONCURRENCY = int(os.environ.get('TRANSLATION_MAX_CONCURRENCY', 8))
+
+# Devre kesici ayarları: son TRANSLATION_BREAKER_WINDOW çağrının en az
+# TRANSLATION_BREAKER_FAILURE_RATE oranı hatalı veya yavaşsa çeviri istekleri
+# TRANSLATION_BREAKER_OPEN_SECONDS boyunca hiç denenmeden reddedilir
+TRANSLATION_BREAKER_WINDOW = int(os.environ.get('TRANSLATION_BREAKER_WINDOW', 20))
+TRANSLATION_BREAKER_MIN_CALLS = int(os.environ.get('TRANSLATION_BREAKER_MIN_CALLS', 5))
+TRANSLATION_BREAKER_FAILURE_RATE = float(os.environ.get('TRANSLATION_BREAKER_FAILURE_RATE', 0.5))
+TRANSLATION_BREAKER_SLOW_CALL = float(os.environ.get('TRANSLATION_BREAKER_SLOW_CALL', 2))
+TRANSLATION_BREAKER_OPEN_SECONDS = float(os.environ.get('TRANSLATION_BREAKER_OPEN_SECONDS', 30))
+
+# Google Translate'in tek istekte kabul ettiği en uzun metin
+MAX_TRANSLATION_LENGTH = 5000
+
+translation_cache = create_cache(
+    maxsize=TRANSLATION_CACHE_SIZE,
+    ttl=TRANSLATION_CACHE_TTL,
+    path=TRANSLATION_CACHE_PATH,
+    table='translation_cache'
+)
+
+class TranslationError(Exception):
+    """Çeviri sağlayıcısından geçerli bir sonuç alınamadığında fırlatılır."""
+
+class TranslationUnavailableError(TranslationError, CircuitOpenError):
+    """Devre kesici açıkken çeviri denenmeden reddedildiğinde fırlatılır."""
+
+translation_breaker = CircuitBreaker(
+    'translation',
+    window_size=TRANSLATION_BREAKER_WINDOW,
+    min_calls=TRANSLATION_BREAKER_MIN_CALLS,
+    failure_rate=TRANSLATION_BREAKER_FAILURE_RATE,
+    slow_call_seconds=TRANSLATION_BREAKER_SLOW_CALL,
+    open_seconds=TRANSLATION_BREAKER_OPEN_SECONDS
+)
+
+class TranslationBackend:
+    """Çeviri sağlayıcıları için temel sınıf."""
+
+    name = 'base'
+
+    def translate(self, text, source_lang, target_lang):
+        """
+        Metni kaynak dilden hedef dile çevirir.
+
+        Args:
+            text (str): Çevrilecek metin
+            source_lang (str): Kaynak dil kodu ('auto' olabilir)
+            target_lang (str): Hedef dil kodu
+
+        Returns:
+            str: Çevrilmiş metin
+        """
+        raise NotImplementedError
+
+class GoogleTranslationBackend(TranslationBackend):
+    """
+    deep_translator ile aynı Google Translate uç noktasını kullanır, ancak tüm
+    çağrılar bağlantı havuzlu tek bir requests oturumunu paylaşır ve her istek
+    zaman aşımına tabidir. Böylece yavaş bir yanıt worker'ı süresiz bekletmez.
+    """
+
+    name = 'google'
+    URL = 'https://translate.google.com/m'
+
+    # Google'ın beklediği biçimden farklı olan dil kodları
+    LANGUAGE_CODES = {'zh-cn': 'zh-CN', 'zh-tw': 'zh-TW'}
+
+    def __init__(self, timeout=TRANSLATION_TIMEOUT, pool_size=TRANSLATION_POOL_SIZE):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0'
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+
+    def translate(self, text, source_lang, target_lang):
+        from bs4 import BeautifulSoup
+
+        if len(text) > MAX_TRANSLATION_LENGTH:
+            raise TranslationError(f"Metin {MAX_TRANSLATION_LENGTH} karakterden uzun olamaz.")
+
+        response = self.session.get(self.URL, params={
+            'sl': self.LANGUAGE_CODES.get(source_lang, source_lang),
+            'tl': self.LANGUAGE_CODES.get(target_lang, target_lang),
+            'q': text
+        }, timeout=self.timeout)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        element = soup.find('div', {'class': 'result-container'}) or soup.find('div', {'class': 't0'})
+        if element is None:
+            raise TranslationError("Çeviri sonucu bulunamadı.")
+        return element.get_text(strip=True)
+
+class DeepTranslatorBackend(TranslationBackend):
+    """deep_translator.GoogleTranslator ile çeviri yapar (varsayılan sağlayıcı)."""
+
+    name = 'deep_translator'
+
+    def translate(self, text, source_lang, target_lang):
+        from deep_translator import GoogleTranslator
+
+        return GoogleTranslator(source=source_lang, target=target_lang).translate(text)
+
+class StubTranslationBackend(TranslationBackend):
+    """
+    Ağ bağlantısı olmadan çalışan sahte sağlayıcı.
+    Verilen sözlükte karşılığı olan metinleri çevirir, diğerlerini olduğu gibi döndürür
+    ve yapılan çağrı sayısını tutar.
+    """
+
+    name = 'stub'
+
+    def __init__(self, translations=None, delay=0.0):
+        self.translations = translations or {}
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def translate(self, text, source_lang, target_lang):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.translations.get((source_lang, target_lang, text), text)
+
+BACKENDS = {
+    'google': GoogleTranslationBackend,
+    'deep_translator': DeepTranslatorBackend,
+    'stub': StubTranslationBackend
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+_concurrency = threading.BoundedSemaphore(TRANSLATION_MAX_CONCURRENCY)
+_executor = None
+_executor_pid = None
+
+def get_backend():
+    """Yapılandırılmış çeviri sağlayıcısını döndürür (ilk kullanımda oluşturulur)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[TRANSLATION_BACKEND]()
+    return _backend
+
+def set_backend(backend):
+    """Çeviri sağlayıcısını değiştirir (testler ve ölçümler için)."""
+    global _backend
+    _backend = backend
+
+def get_executor():
+    """Eşzamanlı çeviriler için thread havuzunu döndürür; fork sonrası yeniden oluşturulur."""
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=TRANSLATION_MAX_CONCURRENCY, thread_name_prefix='translation')
+        _executor_pid = os.getpid()
+    return _executor
+
+def translate_text(text, source_lang, target_lang):
+    """
+    Metni kaynak dilden hedef dile çevirir, sonucu önbellekten döndürmeyi dener.
+    Çeviri hataları çağırana iletilir ve hatalı sonuçlar önbelleğe alınmaz.
+    Sağlayıcı art arda hata veriyor ya da yavaş yanıt veriyorsa devre kesici açılır ve
+    çağrılar beklemeden TranslationUnavailableError ile reddedilir. Yalnızca sağlayıcı
+    ve ağ hataları devre kesicide sayılır; MAX_TRANSLATION_LENGTH'ten uzun metinler
+    sağlayıcıya gönderilmeden TranslationError ile reddedilir.
+
+    Args:
+        text (str): Çevrilecek metin
+        source_lang (str): Kaynak dil kodu ('auto' olabilir)
+        target_lang (str): Hedef dil kodu
+
+    Returns:
+        str: Çevrilmiş metin
+    """
+    if source_lang == target_lang or not text.strip():
+        return text
+    # İstemci kaynaklı hatalar sağlayıcıya gönderilmez ve devre kesicide hata sayılmaz;
+    # aksi halde birkaç uzun metin devreyi herkes için açabilir
+    if len(text) > MAX_TRANSLATION_LENGTH:
+        raise TranslationError(f"Metin {MAX_TRANSLATION_LENGTH} karakterden uzun olamaz.")
+
+    key = make_key(source_lang, target_lang, text)
+    backend = get_backend()
+    cached = translation_cache.get(key)
+    if cached is not None:
+        observe_translation(backend.name, 'cache_hit')
+        return cached
+
+    if not translation_breaker.allow():
+        observe_translation(backend.name, 'rejected')
+        raise TranslationUnavailableError("Çeviri servisi geçici olarak devre dışı.")
+
+    # Süreç başına eşzamanlı istek sayısını sınırla
+    with _concurrency:
+        started = time.perf_counter()
+        try:
+            translated_text = backend.translate(text, source_lang, target_lang)
+        except Exception:
+            translation_breaker.record_failure()
+            observe_translation(backend.name, 'error', time.perf_counter() - started)
+            raise
+        duration = time.perf_counter() - started
+        translation_breaker.record_success(duration)
+        observe_translation(backend.name, 'success', duration)
+
+    if translated_text:
+        translation_cache.set(key, translated_text)
+    return translated_text
+
+def translate_many(texts, source_lang, target_lang):
+    """
+    Birden fazla metni aynı anda çevirir. Her farklı metin yalnızca bir kez çevrilir,
+    önbellekte olmayanlar thread havuzunda eşzamanlı olarak (TRANSLATION_MAX_CONCURRENCY
+    sınırı içinde) işlenir.
+
+    Args:
+        texts (iterable): Çevrilecek metinler
+        source_lang (str): Kaynak dil kodu
+        target_lang (str): Hedef dil kodu
+
+    Returns:
+        dict: {metin: çeviri}; çevrilemeyen metinler için değer None olur
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    futures = {text: get_executor().submit(translate_text, text, source_lang, target_lang) for text in unique_texts}
+
+    translations = {}
+    for text, future in futures.items():
+        try:
+            translations[text] = future.result()
+        except TranslationUnavailableError:
+            translations[text] = None
+        except Exception as e:
+            print(f"Çeviri hatası: {e}")
+            translations[text] = None
+    return translations
+
+def get_translation_cache_stats():
+    """Çeviri önbelleğinin isabet/ıskalama/çıkarma sayaçlarını döndürür."""
+    return translation_cache.stats()
+
+def get_translation_metrics():
+    """Devre kesicinin durumunu, geçiş sayaçlarını ve önbellek istatistiklerini döndürür."""
+    return {
+        'breaker': translation_breaker.stats(),
+        'cache': translation_cache.stats()
+    }
@@ -6,7 +6,7 @@ kullanıcı davranışlarına göre öneriler sunma işlevlerini sağlar.
 """
 
 from models import db, User, Analysis, UserPreference, TextSuggestionFeedback
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, case
 import json
 
 def get_or_create_user_preferences(user_id):
@@ -133,33 +133,32 @@ def get_user_analysis_patterns(user_id):
     ).order_by(desc('count')).limit(3).all()
     
     # Kullanıcının en sık aldığı detaylı duygu kategorilerini getir
-    analyses = Analysis.query.filter_by(user_id=user_id).all()
-    emotion_counts = {
-        'happiness': 0,
-        'sadness': 0,
-        'anger': 0,
-        'fear': 0,
-        'surprise': 0
+    # Eşik sayıları SUM(CASE ...) ile veritabanında hesaplanır; analiz satırları belleğe yüklenmez
+    emotion_columns = {
+        'happiness': Analysis.happiness,
+        'sadness': Analysis.sadness,
+        'anger': Analysis.anger,
+        'fear': Analysis.fear,
+        'surprise': Analysis.surprise
     }
+    aggregates = db.session.query(
+        func.count(Analysis.id),
+        *[func.sum(case((column > 0.5, 1), else_=0)) for column in emotion_columns.values()]
+    ).filter(Analysis.user_id == user_id).one()
     
-    for analysis in analyses:
-        if analysis.happiness > 0.5:
-            emotion_counts['happiness'] += 1
-        if analysis.sadness > 0.5:
-            emotion_counts['sadness'] += 1
-        if analysis.anger > 0.5:
-            emotion_counts['anger'] += 1
-        if analysis.fear > 0.5:
-            emotion_counts['fear'] += 1
-        if analysis.surprise > 0.5:
-            emotion_counts['surprise'] += 1
+    analysis_count = aggregates[0]
+    emotion_counts = {
+        emotion: count or 0
+        for emotion, count in zip(emotion_columns, aggregates[1:])
+    }
     
     top_emotions = sorted(emotion_counts.items(), key=lambda x: x[1], reverse=True)[:3]
     
     return {
         'top_languages': [(lang, count) for lang, count in top_languages],
         'top_sentiments': [(sentiment, count) for sentiment, count in top_sentiments],
-        'top_emotions': top_emotions
+        'top_emotions': top_emotions,
+        'analysis_count': analysis_count
     }
 
 def get_personalized_recommendations(user_id):
@@ -219,7 +218,7 @@ def get_personalized_recommendations(user_id):
             })
     
     # Kullanıcının analiz sayısına göre öneriler
-    analysis_count = Analysis.query.filter_by(user_id=user_id).count()
+    analysis_count = patterns['analysis_count']
     if analysis_count < 5:
         recommendations.append({
             'type': 'usage',
@@ -0,0 +1,80 @@
+"""
+Uygulama ısındırma (warm-up) modülü.
+Bu modül, NLTK verilerini, TextBlob modellerini, langdetect profillerini,
+yazım düzeltme dizinini ve duygu sözlüklerini ilk istek gelmeden önce yükler.
+gunicorn preload_app ile çalışırken ısındırma ana süreçte bir kez yapılır ve
+yüklenen veriler fork ile tüm worker'lara paylaşılır; böylece her worker'ın
+ilk isteği de yüzüncü isteği kadar hızlı olur.
+
+Kullanım:
+    python warmup.py    # Isındırma aşamalarının sürelerini yazdırır
+"""
+
+import time
+
+# Analiz modüllerinin ihtiyaç duyduğu NLTK kaynakları: (nltk.data yolu, indirme adı)
+NLTK_RESOURCES = [
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords')
+]
+
+def ensure_nltk_data():
+    """Eksik NLTK kaynaklarını indirir."""
+    import nltk
+
+    for path, name in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(name)
+
+def warm_up(with_improvements=True, with_models=True):
+    """
+    Analiz hattının tembel (lazy) yüklenen bileşenlerini önceden yükler.
+
+    Args:
+        with_improvements (bool): Metin iyileştirme modülünü ve yazım düzeltme dizinini de yükle
+        with_models (bool): Yapılandırılmış duygu puanlama sağlayıcısının modelini de yükle
+            (transformer modeli ve gruplama thread'i fork ile paylaşılamadığından ana süreçte yüklenmez)
+
+    Returns:
+        dict: {aşama: süre (saniye)}
+    """
+    timings = {}
+
+    def stage(name, func):
+        started = time.perf_counter()
+        result = func()
+        timings[name] = time.perf_counter() - started
+        return result
+
+    stage('nltk_data', ensure_nltk_data)
+    # Modül yüklenirken durdurma kelimesi kümesi ve duygu sözlükleri derlenir
+    sentiment_analyzer = stage('import_sentiment_analyzer', lambda: __import__('sentiment_analyzer'))
+
+    from textblob import TextBlob
+
+    stage('punkt', lambda: sentiment_analyzer.word_tokenize('Warm up the tokenizer.'))
+    stage('textblob_sentiment', lambda: TextBlob('This is a good warm up.').sentiment)
+    # Hızlı kontrollere takılmayan bir metinle langdetect dil profillerini yükle
+    stage('langdetect_profiles', lambda: sentiment_analyzer.detect_language_code('Bonjour tout le monde'))
+
+    if with_models:
+        from sentiment_backends import get_sentiment_backend
+        stage('sentiment_backend', lambda: get_sentiment_backend().warm_up())
+
+    if with_improvements:
+        stage('import_text_improver', lambda: __import__('text_improver'))
+        # Yazım düzeltme dizini ilk kullanımda oluşturulur
+        from spell_checker import get_spell_checker
+        stage('spell_checker', get_spell_checker)
+        from text_rules import get_text_rules
+        stage('text_rules', get_text_rules)
+
+    return timings
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    for name, seconds in warm_up().items():
+        print(f"  {name:<28} {seconds * 1000:10.1f} ms")
+    print(f"Toplam: {(time.perf_counter() - started) * 1000:.1f} ms")